@@ -0,0 +1,3 @@
+"""
+ベンチマーク（オフラインで実行する計測スクリプト）
+"""
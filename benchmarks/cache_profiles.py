@@ -0,0 +1,178 @@
+"""
+キャッシュプロファイルのメモリ比較
+
+Discord に接続せず、discord.py の ConnectionState に合成したゲートウェイイベント
+（GUILD_CREATE・起動時チャンク・メッセージ・参加・メンバー更新・VC参加）を流し込み、
+プロファイルごとにキャッシュされた件数と保持メモリ（tracemalloc）を比較する。
+
+使い方:
+    python -m benchmarks.cache_profiles [--guilds 20] [--members 2500] [--messages 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+# リポジトリ直下から実行した場合も utils を読み込めるようにする
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import discord
+
+from benchmarks.payloads import (
+    BOT_ID,
+    GUILD_BASE,
+    MESSAGE_BASE,
+    USER_BASE,
+    guild_payload,
+    member_payload,
+    message_payload,
+    user_payload,
+    voice_state_payload,
+)
+from utils.member_cache import CACHE_PROFILES, CacheProfile
+
+
+def _build_client(profile: CacheProfile) -> discord.Client:
+    """プロファイルの設定で Client を作成（接続はしない）"""
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+    client = discord.Client(
+        intents=intents,
+        member_cache_flags=profile.member_cache_flags(),
+        chunk_guilds_at_startup=profile.chunk_guilds_at_startup,
+        max_messages=profile.max_messages,
+    )
+    state = client._connection
+    state.user = discord.ClientUser(state=state, data=user_payload(BOT_ID))
+    return client
+
+
+def _replay(client: discord.Client, profile: CacheProfile, args: argparse.Namespace) -> None:
+    """合成したゲートウェイイベントを流し込む"""
+    state = client._connection
+    rng = random.Random(args.seed)
+
+    guild_members: dict[int, list[int]] = {}
+    for g in range(args.guilds):
+        guild_id = GUILD_BASE + g * 1000
+        member_ids = [USER_BASE + g * 10_000_000 + i for i in range(args.members)]
+        voice_ids = rng.sample(member_ids, min(args.voice, len(member_ids)))
+        guild_members[guild_id] = member_ids
+        guild = state._add_guild_from_data(guild_payload(guild_id, member_ids, voice_ids, rng))
+
+        # 起動時チャンク（ChunkRequest(cache=True) と同じく全員をキャッシュに追加）
+        if profile.chunk_guilds_at_startup:
+            for user_id in member_ids:
+                guild._add_member(discord.Member(data=member_payload(guild_id, user_id, rng), guild=guild, state=state))
+
+    guild_ids = list(guild_members)
+    message_id = MESSAGE_BASE
+
+    # 発言者はサーバーの一部（アクティブユーザー）に偏る
+    active = {gid: ids[: max(1, len(ids) * args.active_percent // 100)] for gid, ids in guild_members.items()}
+
+    for i in range(args.messages):
+        guild_id = rng.choice(guild_ids)
+        user_id = rng.choice(active[guild_id])
+        message_id += 1
+        state.parse_message_create(message_payload(guild_id, user_id, message_id, rng))
+
+        # メッセージ100件あたり参加1件・メンバー更新2件・VC参加/退出2件
+        if i % 100 == 0:
+            new_id = USER_BASE + 9_000_000_000 + i
+            data = member_payload(guild_id, new_id, rng)
+            data["guild_id"] = str(guild_id)
+            state.parse_guild_member_add(data)
+
+        if i % 50 == 0:
+            data = member_payload(guild_id, rng.choice(guild_members[guild_id]), rng)
+            data["guild_id"] = str(guild_id)
+            state.parse_guild_member_update(data)
+
+            state.parse_voice_state_update(
+                voice_state_payload(guild_id, rng.choice(guild_members[guild_id]), rng, joined=rng.random() < 0.5)
+            )
+
+
+async def _measure(profile: CacheProfile, args: argparse.Namespace) -> dict[str, Any]:
+    """1プロファイル分を計測"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+
+    client = _build_client(profile)
+    _replay(client, profile, args)
+
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    state = client._connection
+    result = {
+        "profile": profile.name,
+        "cached_members": sum(len(guild._members) for guild in state.guilds),
+        "cached_users": len(state._users),
+        "cached_messages": len(state._messages) if state._messages is not None else 0,
+        "retained_mib": round((current - baseline) / 1024 / 1024, 2),
+        "peak_mib": round((peak - baseline) / 1024 / 1024, 2),
+        "seconds": round(elapsed, 2),
+    }
+    del client, state
+    gc.collect()
+    return result
+
+
+def _format_table(results: list[dict[str, Any]]) -> str:
+    header = f"{'profile':<10} {'members':>9} {'users':>9} {'messages':>9} {'retained':>11} {'peak':>11} {'time':>7}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['profile']:<10} {r['cached_members']:>9} {r['cached_users']:>9} {r['cached_messages']:>9} "
+            f"{r['retained_mib']:>8.2f}MiB {r['peak_mib']:>8.2f}MiB {r['seconds']:>6.2f}s"
+        )
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="キャッシュプロファイルのメモリ比較")
+    parser.add_argument("--guilds", type=int, default=20, help="サーバー数")
+    parser.add_argument("--members", type=int, default=2500, help="サーバーあたりのメンバー数")
+    parser.add_argument("--voice", type=int, default=10, help="サーバーあたりのVC参加者数")
+    parser.add_argument("--messages", type=int, default=20000, help="流し込むメッセージ数")
+    parser.add_argument("--active-percent", type=int, default=5, help="発言するメンバーの割合（%%）")
+    parser.add_argument("--profiles", nargs="+", default=list(CACHE_PROFILES), choices=list(CACHE_PROFILES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="結果をJSONに書き出す")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = []
+    for name in args.profiles:
+        results.append(await _measure(CACHE_PROFILES[name], args))
+
+    print(
+        f"サーバー {args.guilds} × メンバー {args.members}、メッセージ {args.messages} 件"
+        f"（アクティブ {args.active_percent}%、VC {args.voice} 人/サーバー）"
+    )
+    print(_format_table(results))
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"args": vars(args), "results": results}, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,163 @@
+"""
+ベンチマーク用のゲートウェイイベントのペイロード
+
+Discord から受け取るのと同じ形式の dict を作る（discord.py の ConnectionState にそのまま渡せる）。
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Optional
+
+BOT_ID = 1_000_000_000_000_000
+GUILD_BASE = 2_000_000_000_000_000
+USER_BASE = 3_000_000_000_000_000
+MESSAGE_BASE = 4_000_000_000_000_000
+
+TIMESTAMP = "2026-01-01T00:00:00+00:00"
+
+# チャンネル・ロールのIDはサーバーIDからのオフセット
+TEXT_CHANNEL_OFFSET = 1
+VOICE_CHANNEL_OFFSET = 2
+ROLE_OFFSET = 10
+ROLES_PER_GUILD = 20
+
+
+def user_payload(user_id: int, bot: bool = False) -> dict[str, Any]:
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id % 1_000_000}",
+        "global_name": f"ユーザー{user_id % 1_000_000}",
+        "discriminator": "0",
+        "avatar": f"{user_id:032x}"[-32:],
+        "bot": bot,
+    }
+
+
+def member_payload(guild_id: int, user_id: int, rng: random.Random, with_user: bool = True) -> dict[str, Any]:
+    roles = rng.sample(range(ROLES_PER_GUILD), rng.randint(0, 3))
+    data: dict[str, Any] = {
+        "roles": [str(guild_id + ROLE_OFFSET + i) for i in roles],
+        "joined_at": TIMESTAMP,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+        "nick": None,
+    }
+    if with_user:
+        data["user"] = user_payload(user_id, bot=user_id == BOT_ID)
+    return data
+
+
+def voice_state_payload(guild_id: int, user_id: int, rng: random.Random, joined: bool = True) -> dict[str, Any]:
+    return {
+        "guild_id": str(guild_id),
+        "channel_id": str(guild_id + VOICE_CHANNEL_OFFSET) if joined else None,
+        "user_id": str(user_id),
+        "member": member_payload(guild_id, user_id, rng),
+        "session_id": f"session{user_id}",
+        "deaf": False,
+        "mute": False,
+        "self_deaf": False,
+        "self_mute": False,
+        "self_video": False,
+        "suppress": False,
+        "request_to_speak_timestamp": None,
+    }
+
+
+def guild_payload(guild_id: int, member_ids: list[int], voice_ids: list[int], rng: random.Random) -> dict[str, Any]:
+    """GUILD_CREATE（大規模サーバーと同様に、メンバーはBot自身とVC参加者のみ含む）"""
+    roles = [{
+        "id": str(guild_id), "name": "@everyone", "permissions": "0", "position": 0,
+        "color": 0, "hoist": False, "managed": False, "mentionable": False, "flags": 0,
+    }]
+    roles += [{
+        "id": str(guild_id + ROLE_OFFSET + i), "name": f"role{i}", "permissions": "0", "position": i + 1,
+        "color": 0, "hoist": False, "managed": False, "mentionable": False, "flags": 0,
+    } for i in range(ROLES_PER_GUILD)]
+
+    return {
+        "id": str(guild_id),
+        "name": f"guild{guild_id - GUILD_BASE}",
+        "owner_id": str(member_ids[0]),
+        "member_count": len(member_ids) + 1,
+        "large": True,
+        "features": [],
+        "emojis": [],
+        "stickers": [],
+        "roles": roles,
+        "channels": [
+            {"id": str(guild_id + TEXT_CHANNEL_OFFSET), "type": 0, "name": "general",
+             "position": 0, "permission_overwrites": []},
+            {"id": str(guild_id + VOICE_CHANNEL_OFFSET), "type": 2, "name": "voice",
+             "position": 1, "permission_overwrites": [], "bitrate": 64000, "user_limit": 0},
+        ],
+        "threads": [],
+        "stage_instances": [],
+        "guild_scheduled_events": [],
+        "voice_states": [
+            {k: v for k, v in voice_state_payload(guild_id, user_id, rng).items() if k != "guild_id"}
+            for user_id in voice_ids
+        ],
+        "members": [member_payload(guild_id, BOT_ID, rng)] + [
+            member_payload(guild_id, user_id, rng) for user_id in voice_ids
+        ],
+    }
+
+
+def message_payload(
+    guild_id: int,
+    user_id: int,
+    message_id: int,
+    rng: random.Random,
+    content: Optional[str] = None,
+    attachments: int = 0
+) -> dict[str, Any]:
+    return {
+        "id": str(message_id),
+        "channel_id": str(guild_id + TEXT_CHANNEL_OFFSET),
+        "guild_id": str(guild_id),
+        "author": user_payload(user_id, bot=user_id == BOT_ID),
+        "member": member_payload(guild_id, user_id, rng, with_user=False),
+        "content": content if content is not None else "おはようございます " * rng.randint(1, 8),
+        "timestamp": TIMESTAMP,
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [{
+            "id": str(message_id + i + 1),
+            "filename": f"image{i}.png",
+            "size": 1024,
+            "url": f"https://cdn.discordapp.com/attachments/{message_id}/image{i}.png",
+            "proxy_url": f"https://media.discordapp.net/attachments/{message_id}/image{i}.png",
+        } for i in range(attachments)],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+    }
+
+
+def reaction_payload(
+    guild_id: int,
+    user_id: int,
+    message_id: int,
+    emoji: str,
+    rng: random.Random,
+    with_member: bool = True
+) -> dict[str, Any]:
+    """MESSAGE_REACTION_ADD / MESSAGE_REACTION_REMOVE（REMOVE には member を含めない）"""
+    data: dict[str, Any] = {
+        "user_id": str(user_id),
+        "channel_id": str(guild_id + TEXT_CHANNEL_OFFSET),
+        "message_id": str(message_id),
+        "guild_id": str(guild_id),
+        "emoji": {"id": None, "name": emoji},
+        "burst": False,
+        "type": 0,
+    }
+    if with_member:
+        data["member"] = member_payload(guild_id, user_id, rng)
+    return data
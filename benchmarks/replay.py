@@ -0,0 +1,482 @@
+"""
+イベントリプレイによる負荷計測
+
+Discord に接続せず、SumireBot に Cog を読み込んで一時ディレクトリのデータベースに接続し、
+ゲートウェイイベント（メッセージ・リアクション・VC・メンバー参加）を ConnectionState に
+流し込んで、本番と同じ経路（パース → dispatch → Cog のリスナー）で処理させる。
+
+計測する値:
+    - スループット（イベント/秒）
+    - リスナーごとの処理時間（p50 / p95 / p99 / 最大）
+    - イベントあたりのDBステートメント数（リスナー別の内訳つき）
+    - Discord API の呼び出し数（ルート別、実際には送信しない）
+    - プロセスの最大RSS
+
+イベント列は JSONL（1行1件、ゲートウェイの DISPATCH と同じ {"t": 種類, "d": データ}）。
+--events を省略した場合は合成したイベント列を使う（--write-events で書き出して編集・再利用できる）。
+GUILD_CREATE は計測前にまとめて読み込み、そのサーバーに WordCounter / Star の設定を入れる。
+
+使い方:
+    python -m benchmarks.replay [--events stream.jsonl] [--rate 0] [--cogs cogs.leveling cogs.star]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextvars
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+import traceback
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# リポジトリ直下から実行した場合も utils を読み込めるようにする
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import discord
+import yaml
+
+from benchmarks.payloads import (
+    BOT_ID,
+    GUILD_BASE,
+    MESSAGE_BASE,
+    TEXT_CHANNEL_OFFSET,
+    USER_BASE,
+    guild_payload,
+    member_payload,
+    message_payload,
+    reaction_payload,
+    user_payload,
+    voice_state_payload,
+)
+from utils.config import Config
+from utils.logging import setup_logging
+from utils.perf import percentile
+
+DEFAULT_COGS = ["cogs.leveling", "cogs.wordcounter", "cogs.star"]
+
+# 計測前に読み込むイベント（サーバーのキャッシュ）と、リプレイしないイベント（接続状態のリセット）
+SETUP_EVENTS = {"GUILD_CREATE"}
+SKIPPED_EVENTS = {"READY", "RESUMED"}
+
+# 合成イベントの内訳（種類, 割合）
+SYNTHETIC_MIX = [
+    ("MESSAGE_CREATE", 0.70),
+    ("MESSAGE_REACTION_ADD", 0.18),
+    ("MESSAGE_REACTION_REMOVE", 0.05),
+    ("VOICE_STATE_UPDATE", 0.05),
+    ("GUILD_MEMBER_ADD", 0.02),
+]
+
+# 合成メッセージのうち、カウント対象の単語・添付ファイルを含む割合
+WORD_RATIO = 0.2
+ATTACHMENT_RATIO = 0.1
+
+# メッセージ取得（GET）に応答するため保持するメッセージ数
+STORED_MESSAGES = 5000
+
+# 実行中のリスナー（DBステートメントをリスナーごとに集計するため）
+_current_listener: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("replay_listener", default=None)
+
+
+def _peak_rss_mib() -> float:
+    """プロセス起動からの最大RSS（MiB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KiB、macOS はバイト
+    return peak / (1024 ** 2 if sys.platform == "darwin" else 1024)
+
+
+def _frame(event_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    return {"op": 0, "t": event_type, "d": data}
+
+
+def synthetic_events(args: argparse.Namespace) -> Iterator[dict[str, Any]]:
+    """合成したイベント列（GUILD_CREATE の後に args.count 件）"""
+    rng = random.Random(args.seed)
+
+    guild_members: dict[int, list[int]] = {}
+    for g in range(args.guilds):
+        guild_id = GUILD_BASE + g * 1000
+        member_ids = [USER_BASE + g * 10_000_000 + i for i in range(args.members)]
+        guild_members[guild_id] = member_ids
+        yield _frame("GUILD_CREATE", guild_payload(guild_id, member_ids, [], rng))
+
+    guild_ids = list(guild_members)
+    # 発言者はサーバーの一部（アクティブユーザー）に偏る
+    active = {gid: ids[: max(1, len(ids) * args.active_percent // 100)] for gid, ids in guild_members.items()}
+    # リアクション対象の直近のメッセージ
+    recent: dict[int, deque[int]] = {gid: deque(maxlen=200) for gid in guild_ids}
+    in_voice: dict[int, set[int]] = {gid: set() for gid in guild_ids}
+
+    types, weights = zip(*SYNTHETIC_MIX)
+    message_id = MESSAGE_BASE
+    new_member_id = USER_BASE + 9_000_000_000
+
+    for _ in range(args.count):
+        guild_id = rng.choice(guild_ids)
+        event_type = rng.choices(types, weights)[0]
+        if event_type.startswith("MESSAGE_REACTION") and not recent[guild_id]:
+            event_type = "MESSAGE_CREATE"
+
+        if event_type == "MESSAGE_CREATE":
+            message_id += 10
+            content = None
+            if args.words and rng.random() < WORD_RATIO:
+                content = f"{rng.choice(args.words)} " * rng.randint(1, 3)
+            attachments = 1 if rng.random() < ATTACHMENT_RATIO else 0
+            recent[guild_id].append(message_id)
+            yield _frame("MESSAGE_CREATE", message_payload(
+                guild_id, rng.choice(active[guild_id]), message_id, rng, content=content, attachments=attachments
+            ))
+
+        elif event_type.startswith("MESSAGE_REACTION"):
+            adding = event_type == "MESSAGE_REACTION_ADD"
+            yield _frame(event_type, reaction_payload(
+                guild_id,
+                rng.choice(guild_members[guild_id]),
+                rng.choice(recent[guild_id]),
+                "⭐" if rng.random() < 0.6 else "👍",
+                rng,
+                with_member=adding
+            ))
+
+        elif event_type == "VOICE_STATE_UPDATE":
+            user_id = rng.choice(active[guild_id])
+            joined = user_id not in in_voice[guild_id]
+            (in_voice[guild_id].add if joined else in_voice[guild_id].discard)(user_id)
+            yield _frame(event_type, voice_state_payload(guild_id, user_id, rng, joined=joined))
+
+        else:
+            new_member_id += 1
+            data = member_payload(guild_id, new_member_id, rng)
+            data["guild_id"] = str(guild_id)
+            guild_members[guild_id].append(new_member_id)
+            yield _frame(event_type, data)
+
+
+def load_events(path: str) -> Iterator[dict[str, Any]]:
+    """JSONL のイベント列を読み込む（空行・t のない行は無視）"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            frame = json.loads(line)
+            if frame.get("t"):
+                yield frame
+
+
+class FakeHTTP:
+    """
+    HTTPClient.request の代わりにルートごとの呼び出し数を記録する
+
+    メッセージ送信と取得には、discord.py が Message を作れるペイロードを返す。
+    それ以外は None（リアクション追加・ロール付与などは戻り値を使わない）。
+    """
+
+    def __init__(self, bot: discord.Client, latency: float) -> None:
+        self.bot = bot
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.messages: dict[int, dict[str, Any]] = {}
+        self._rng = random.Random(0)
+        self._next_id = MESSAGE_BASE + 1
+
+    def remember(self, data: dict[str, Any]) -> None:
+        """リプレイしたメッセージを GET で返せるよう保持"""
+        self.messages[int(data["id"])] = data
+        if len(self.messages) > STORED_MESSAGES:
+            del self.messages[next(iter(self.messages))]
+
+    def _guild_id(self, channel_id: int) -> int:
+        channel = self.bot.get_channel(channel_id)
+        guild = getattr(channel, "guild", None)
+        return guild.id if guild else channel_id - TEXT_CHANNEL_OFFSET
+
+    async def request(self, route: discord.http.Route, *, files: Any = None, form: Any = None, **kwargs: Any) -> Any:
+        self.calls[f"{route.method} {route.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if route.path == "/channels/{channel_id}/messages" and route.method == "POST":
+            self._next_id += 1
+            payload = kwargs.get("json") or {}
+            return message_payload(
+                self._guild_id(int(route.channel_id)), BOT_ID, self._next_id, self._rng,
+                content=payload.get("content") or ""
+            )
+
+        if route.path == "/channels/{channel_id}/messages/{message_id}" and route.method == "GET":
+            message_id = int(route.url.rsplit("/", 1)[1])
+            data = self.messages.get(message_id)
+            if data is None:
+                # 記録されていないメッセージは任意のユーザーの投稿として返す
+                data = message_payload(self._guild_id(int(route.channel_id)), USER_BASE, message_id, self._rng)
+            return data
+
+        return None
+
+
+class ReplayStats:
+    """リスナーの処理時間・DBステートメント数の記録"""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, list[float]] = {}
+        self.errors: Counter[str] = Counter()
+        self.first_error: Optional[str] = None
+        self.statements: Counter[Optional[str]] = Counter()
+        self.commits: Counter[Optional[str]] = Counter()
+        self.pending: set[asyncio.Task] = set()
+
+    def install(self, bot: discord.Client, connection: Any) -> None:
+        """Bot とDB接続のメソッドをインスタンス属性で置き換えて計測する"""
+        schedule_event = bot._schedule_event
+        run_event = bot._run_event
+
+        def _schedule(coro, event_name, *args, **kwargs):
+            task = schedule_event(coro, event_name, *args, **kwargs)
+            self.pending.add(task)
+            task.add_done_callback(self.pending.discard)
+            return task
+
+        async def _run(coro, event_name, *args, **kwargs):
+            name = getattr(coro, "__qualname__", event_name)
+            _current_listener.set(name)
+            started = time.perf_counter()
+            try:
+                await run_event(coro, event_name, *args, **kwargs)
+            finally:
+                self.durations.setdefault(name, []).append(time.perf_counter() - started)
+
+        async def _on_error(event_name, *args, **kwargs):
+            self.errors[_current_listener.get() or event_name] += 1
+            if self.first_error is None:
+                self.first_error = traceback.format_exc()
+
+        bot._schedule_event = _schedule
+        bot._run_event = _run
+        bot.on_error = _on_error
+
+        # aiosqlite の execute は await と async with の両方で使われるため、戻り値はそのまま返す
+        for method in ("execute", "executemany", "executescript", "commit"):
+            original = getattr(connection, method)
+            counter = self.commits if method == "commit" else self.statements
+
+            def _counted(*args, _original=original, _counter=counter, **kwargs):
+                _counter[_current_listener.get()] += 1
+                return _original(*args, **kwargs)
+
+            setattr(connection, method, _counted)
+
+    async def drain(self) -> None:
+        """実行中のリスナーが全て終わるまで待つ"""
+        while self.pending:
+            await asyncio.wait(set(self.pending))
+
+
+def _write_config(directory: Path, args: argparse.Namespace) -> Path:
+    """config.yaml.example を元に、一時ディレクトリのDBを使う設定を作成"""
+    with open(ROOT / "config.yaml.example", "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    config.setdefault("database", {})["path"] = str(directory / "replay.db")
+    config.setdefault("cache", {})["profile"] = args.cache_profile
+    config.setdefault("metrics", {})["enabled"] = False
+
+    path = directory / "config.yaml"
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f, allow_unicode=True)
+    return path
+
+
+async def _seed_guild(bot: Any, guild: discord.Guild, words: list[str]) -> None:
+    """サーバーの設定（WordCounter の単語、全テキストチャンネルをスター対象に）"""
+    await bot.db.ensure_guild(guild.id)
+    await bot.db.set_wordcounter_enabled(guild.id, True)
+    for word in words:
+        await bot.db.add_counter_word(guild.id, word)
+    await bot.db.set_star_enabled(guild.id, True)
+    for channel in guild.text_channels:
+        await bot.db.add_star_channel(guild.id, channel.id)
+
+
+async def replay(args: argparse.Namespace) -> dict[str, Any]:
+    """Bot を組み立ててイベント列を流し込み、結果を返す"""
+    frames = list(load_events(args.events) if args.events else synthetic_events(args))
+    if args.write_events:
+        path = Path(args.write_events)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for frame in frames:
+                f.write(json.dumps(frame, ensure_ascii=False) + "\n")
+
+    with tempfile.TemporaryDirectory(prefix="sumire-replay-") as directory:
+        Config(str(_write_config(Path(directory), args)))
+        setup_logging(level=args.log_level, console=True)
+
+        # Config の読み込み後に import する（Bot の初期化で設定を参照するため）
+        from bot import SumireBot
+
+        bot = SumireBot()
+        async with bot:
+            state = bot._connection
+            state.user = discord.ClientUser(state=state, data=user_payload(BOT_ID, bot=True))
+            http = FakeHTTP(bot, args.http_latency / 1000)
+            bot.http.request = http.request
+
+            await bot.db.connect(bot.config.database_path)
+            for extension in args.cogs:
+                await bot.load_extension(extension)
+
+            events = []
+            for frame in frames:
+                if frame["t"] in SETUP_EVENTS:
+                    guild = state._add_guild_from_data(frame["d"])
+                    await _seed_guild(bot, guild, args.words)
+                elif frame["t"] not in SKIPPED_EVENTS:
+                    events.append(frame)
+            del frames
+
+            stats = ReplayStats()
+            stats.install(bot, bot.db._db)
+            baseline_rss = _peak_rss_mib()
+
+            types: Counter[str] = Counter()
+            skipped: Counter[str] = Counter()
+            started = time.perf_counter()
+            for i, frame in enumerate(events):
+                if args.rate > 0:
+                    delay = started + i / args.rate - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif len(stats.pending) >= args.concurrency:
+                    await asyncio.wait(set(stats.pending), return_when=asyncio.FIRST_COMPLETED)
+
+                event_type, data = frame["t"], frame["d"]
+                parser = state.parsers.get(event_type)
+                if parser is None:
+                    skipped[event_type] += 1
+                    continue
+                if event_type == "MESSAGE_CREATE":
+                    http.remember(data)
+                types[event_type] += 1
+                bot.dispatch("socket_event_type", event_type)
+                parser(data)
+
+            await stats.drain()
+            elapsed = time.perf_counter() - started
+
+            # 送信スケジューラーに残っている通知を送り切る
+            while bot.outbound.stats()["queued"]:
+                await asyncio.sleep(0.05)
+
+        processed = sum(types.values())
+        listeners = []
+        for name, durations in sorted(stats.durations.items(), key=lambda item: -sum(item[1])):
+            listeners.append({
+                "listener": name,
+                "count": len(durations),
+                "errors": stats.errors[name],
+                "p50_ms": round(percentile(durations, 0.5) * 1000, 3),
+                "p95_ms": round(percentile(durations, 0.95) * 1000, 3),
+                "p99_ms": round(percentile(durations, 0.99) * 1000, 3),
+                "max_ms": round(max(durations) * 1000, 3),
+                "db_statements": stats.statements[name],
+                "db_commits": stats.commits[name],
+            })
+
+        statements = sum(stats.statements.values())
+        commits = sum(stats.commits.values())
+        return {
+            "events": processed,
+            "event_types": dict(types.most_common()),
+            "skipped": dict(skipped),
+            "seconds": round(elapsed, 3),
+            "throughput": round(processed / elapsed, 1) if elapsed else 0.0,
+            "listeners": listeners,
+            "db": {
+                "statements": statements,
+                "commits": commits,
+                "statements_per_event": round(statements / processed, 3) if processed else 0.0,
+                "commits_per_event": round(commits / processed, 3) if processed else 0.0,
+            },
+            "http": dict(http.calls.most_common()),
+            "rss": {"baseline_mib": round(baseline_rss, 1), "peak_mib": round(_peak_rss_mib(), 1)},
+            "first_error": stats.first_error,
+        }
+
+
+def _format_report(result: dict[str, Any], args: argparse.Namespace) -> str:
+    source = args.events or f"合成（サーバー {args.guilds} × メンバー {args.members}、seed {args.seed}）"
+    rate = f"{args.rate:g} イベント/秒" if args.rate > 0 else f"上限なし（同時 {args.concurrency}）"
+    db = result["db"]
+    lines = [
+        f"イベント列: {source} ・ レート: {rate}",
+        f"処理: {result['events']:,} 件 / {result['seconds']:.2f}s = {result['throughput']:,.1f} イベント/秒",
+        "  " + " ・ ".join(f"{name} {count:,}" for name, count in result["event_types"].items()),
+        "",
+    ]
+
+    header = (
+        f"{'listener':<44} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'db/call':>8} {'errors':>7}"
+    )
+    lines += [header, "-" * len(header)]
+    for row in result["listeners"]:
+        lines.append(
+            f"{row['listener']:<44} {row['count']:>7} {row['p50_ms']:>6.2f}ms {row['p95_ms']:>6.2f}ms "
+            f"{row['p99_ms']:>6.2f}ms {row['max_ms']:>6.2f}ms {row['db_statements'] / row['count']:>8.2f} "
+            f"{row['errors']:>7}"
+        )
+
+    lines += [
+        "",
+        f"DB: ステートメント {db['statements']:,}（{db['statements_per_event']:.2f}/イベント） ・ "
+        f"コミット {db['commits']:,}（{db['commits_per_event']:.2f}/イベント）",
+        "API: " + (" ・ ".join(f"{route} {count:,}" for route, count in result["http"].items()) or "呼び出しなし"),
+        f"最大RSS: {result['rss']['peak_mib']:.1f}MiB（リプレイ開始時 {result['rss']['baseline_mib']:.1f}MiB）",
+    ]
+    if result["skipped"]:
+        lines.append("未対応のイベント: " + " ・ ".join(f"{t} {c:,}" for t, c in result["skipped"].items()))
+    if result["first_error"]:
+        lines += ["", "最初のリスナーエラー:", result["first_error"].rstrip()]
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="イベントリプレイによる負荷計測")
+    parser.add_argument("--events", metavar="PATH", help="リプレイするイベント列（JSONL、省略時は合成）")
+    parser.add_argument("--write-events", metavar="PATH", help="使用したイベント列を JSONL に書き出す")
+    parser.add_argument("--rate", type=float, default=0, help="1秒あたりのイベント数（0で上限なし）")
+    parser.add_argument("--concurrency", type=int, default=256, help="--rate 0 の場合の同時実行リスナー数の上限")
+    parser.add_argument("--cogs", nargs="+", default=DEFAULT_COGS, help="読み込むCog")
+    parser.add_argument("--words", nargs="*", default=["草", "www"], help="WordCounter のカウント対象の単語")
+    parser.add_argument("--http-latency", type=float, default=0, help="Discord API の応答時間（ミリ秒）")
+    parser.add_argument("--cache-profile", default="full", choices=["full", "balanced", "minimal"])
+    parser.add_argument("--guilds", type=int, default=10, help="合成: サーバー数")
+    parser.add_argument("--members", type=int, default=1000, help="合成: サーバーあたりのメンバー数")
+    parser.add_argument("--active-percent", type=int, default=10, help="合成: 発言するメンバーの割合（%%）")
+    parser.add_argument("--count", type=int, default=20000, help="合成: イベント数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="WARNING", help="Bot のログレベル")
+    parser.add_argument("--json", metavar="PATH", help="結果をJSONに書き出す")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    result = await replay(args)
+    print(_format_report(result, args))
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"args": vars(args), "result": result}, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -4,7 +4,19 @@ Discord.py 2.6.4を使用した多機能Discord BOT
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Coroutine, Iterable, Optional
+
+# 以降のimportを計測するため、他のモジュールより先に有効化する
+from utils.startup_profiler import StartupProfiler
+if any(arg.split("=")[0] == "--profile-startup" for arg in sys.argv[1:]):
+    StartupProfiler().enable()
 
 import discord
 from discord.ext import commands
@@ -13,57 +25,269 @@ from utils.config import Config
 from utils.database import Database
 from utils.logging import setup_logging, get_logger
 from utils.status import StatusManager
-from utils.cog_loader import load_cogs
+from utils.outbound import OutboundScheduler
+from utils.spam_filter import SpamFilter
+from utils.rank_card import RankCardRenderer
+from utils.member_cache import MemberCache, get_profile
+from utils.cog_loader import load_cogs, reload_cog, reload_all_cogs
+from utils.command_sync import sync_commands
+from utils.ipc import SECRET_ENV, ClusterClient
+from utils.metrics import MetricsServer, Sample, registry
+from utils.loop_monitor import LoopWatchdog
+from utils.perf import PerfRecorder
+
+# ゲートウェイイベントの受信数（type: MESSAGE_CREATE など）
+GATEWAY_EVENTS = registry.counter("sumire_gateway_events_total", "ゲートウェイイベントの受信数", ("type",))
+
+# イベントリスナーの処理時間（listener: Cog名.メソッド名）
+LISTENER_SECONDS = registry.histogram("sumire_listener_seconds", "イベントリスナーの処理時間", ("listener",))
+
+
+def _event_guild_id(args: tuple) -> Optional[int]:
+    """イベントの最初の引数（Message・Member・Raw〜Event など）からサーバーIDを取得"""
+    if not args:
+        return None
+    obj = args[0]
+    if isinstance(obj, discord.Guild):
+        return obj.id
+    guild_id = getattr(obj, "guild_id", None)
+    if guild_id is None:
+        guild_id = getattr(getattr(obj, "guild", None), "id", None)
+    return guild_id
+
 
+class SumireBot(commands.AutoShardedBot):
+    """
+    すみれBot v2 メインクラス
 
-class SumireBot(commands.Bot):
-    """すみれBot v2 メインクラス"""
+    単独で起動した場合は1プロセスで全シャードを担当する。
+    launcher.py から起動した場合は指定されたシャードのみを担当するクラスターとして動作し、
+    他のクラスターとはランチャー経由のIPCで連携する。
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        profile_path: str = None,
+        profile_exit: bool = False,
+        cluster_id: Optional[int] = None,
+        shard_ids: Optional[list[int]] = None,
+        shard_count: Optional[int] = None,
+        ipc_port: Optional[int] = None
+    ) -> None:
         self.config = Config()
+        self.profile_path = profile_path
+        self.profile_exit = profile_exit
+        self.cluster_id = cluster_id
+        self.exit_code = 0
 
         intents = discord.Intents.default()
         intents.message_content = True
         intents.members = True
         intents.guilds = True
 
+        # メンバー・メッセージのキャッシュ方針
+        cache_profile = get_profile(self.config.cache_profile)
+
         super().__init__(
             command_prefix="!",
             intents=intents,
-            description=self.config.description
+            description=self.config.description,
+            member_cache_flags=cache_profile.member_cache_flags(),
+            chunk_guilds_at_startup=cache_profile.chunk_guilds_at_startup,
+            max_messages=cache_profile.max_messages,
+            shard_ids=shard_ids,
+            shard_count=shard_count if shard_ids is not None else self.config.shard_count
         )
 
         self.db = Database()
         self.logger = get_logger("sumire")
         self.status_manager = StatusManager(self)
+        self.outbound = OutboundScheduler(self)
+        self.spam_filter = SpamFilter()
+        self.member_cache = MemberCache(cache_profile)
+        self.loop_watchdog = LoopWatchdog(threshold=self.config.loop_block_threshold)
+        self.perf = PerfRecorder()
+        self.metrics_server: Optional[MetricsServer] = None
+        self.rank_cards = RankCardRenderer(
+            workers=self.config.rank_card_workers,
+            font_path=self.config.rank_card_font_path
+        )
+
+        # クラスターとして起動した場合のランチャーとの通信
+        self.cluster: Optional[ClusterClient] = None
+        if cluster_id is not None and ipc_port:
+            self.cluster = ClusterClient(self, cluster_id, ipc_port, os.environ.get(SECRET_ENV, ""))
+            self.cluster.register("reload_cogs", self._handle_reload_cogs)
+
+    @property
+    def is_primary_cluster(self) -> bool:
+        """
+        サーバーに依存しない定期処理（DB全体の掃除・起動時のコマンド同期など）を担当するか
+
+        単独起動時と、クラスター0のみTrue。
+        """
+        return not self.cluster_id
+
+    def owns_guild(self, guild_id: int) -> bool:
+        """
+        サーバーがこのプロセスの担当シャードに属するか
+
+        DBの行を元に処理する定期タスクは、他のクラスターが担当するサーバーの行を
+        「サーバーが見つからない」として削除しないよう、これで絞り込む。
+        """
+        if self.shard_ids is None or not self.shard_count:
+            return True
+        return (guild_id >> 22) % self.shard_count in self.shard_ids
+
+    async def request_exit(self, code: int) -> None:
+        """終了コードを指定してBotを終了（main() がこのコードでプロセスを終了する）"""
+        self.exit_code = code
+        await self.close()
+
+    async def _handle_reload_cogs(self, data: dict) -> dict:
+        """他のクラスターで /sync が実行された場合のCogリロード"""
+        cog = (data or {}).get("cog")
+        if cog:
+            success = await reload_cog(self, cog)
+            return {"success": int(success), "failed": int(not success)}
+        success_count, fail_count = await reload_all_cogs(self)
+        return {"success": success_count, "failed": fail_count}
+
+    def dispatch(self, event_name: str, /, *args: Any, **kwargs: Any) -> None:
+        """イベントを配信（ゲートウェイイベントの種類ごとの件数を記録）"""
+        if event_name == "socket_event_type":
+            GATEWAY_EVENTS.labels(args[0]).inc()
+            self.perf.gateway_events.add()
+        super().dispatch(event_name, *args, **kwargs)
+
+    async def _run_event(
+        self,
+        coro: Callable[..., Coroutine[Any, Any, Any]],
+        event_name: str,
+        *args: Any,
+        **kwargs: Any
+    ) -> None:
+        """イベントリスナーを実行（リスナー・サーバーごとの処理時間を記録）"""
+        started = time.perf_counter()
+        try:
+            await super()._run_event(coro, event_name, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            LISTENER_SECONDS.labels(getattr(coro, "__qualname__", event_name)).observe(elapsed)
+            guild_id = _event_guild_id(args)
+            if guild_id is not None:
+                self.perf.hotspots.add(guild_id, elapsed)
+
+    def _collect_metrics(self) -> Iterable[Sample]:
+        """既存の統計をメトリクスとして読み出す"""
+        yield "sumire_guilds", "gauge", "接続中のサーバー数", {}, len(self.guilds)
+        for shard_id, shard in self.shards.items():
+            # 最初のハートビートまでは nan / inf
+            if math.isfinite(shard.latency):
+                yield (
+                    "sumire_shard_latency_seconds", "gauge", "シャードのハートビート遅延",
+                    {"shard": str(shard_id)}, shard.latency
+                )
+
+        member = self.member_cache.stats()
+        yield "sumire_cache_lookups_total", "counter", "", {"cache": "member", "result": "hit"}, member["hits"]
+        yield (
+            "sumire_cache_lookups_total", "counter", "", {"cache": "member", "result": "miss"},
+            member["fetched"] + member["queried"] + member["chunked"]
+        )
+        cards = self.rank_cards.stats()
+        yield "sumire_cache_lookups_total", "counter", "", {"cache": "rank_card", "result": "hit"}, cards["card_hits"]
+        yield (
+            "sumire_cache_lookups_total", "counter", "", {"cache": "rank_card", "result": "miss"},
+            cards["rendered"] + cards["failed"]
+        )
+
+        outbound = self.outbound.stats()
+        yield "sumire_outbound_queued", "gauge", "送信待ちのメッセージ数", {}, outbound["queued"]
+        for key in ("sent", "dropped", "coalesced", "failed", "rate_limited"):
+            yield (
+                "sumire_outbound_messages_total", "counter", "送信スケジューラーの処理件数",
+                {"result": key}, outbound[key]
+            )
+
+        # RSSの取得は同期処理のため、/metrics・/perf が別スレッドで取得した値を使う
+        if self.perf.rss_bytes:
+            yield (
+                "sumire_process_resident_memory_bytes", "gauge", "プロセスのメモリ使用量（RSS）", {},
+                self.perf.rss_bytes
+            )
 
     async def setup_hook(self) -> None:
         """Bot起動時の初期化処理"""
+        profiler = StartupProfiler()
+
         # データベース接続
-        await self.db.connect(self.config.database_path)
+        with profiler.phase("db.connect"):
+            await self.db.connect(self.config.database_path, self.config.database_busy_timeout)
         self.logger.info("データベースに接続しました")
 
         # Cogsの読み込み
-        await load_cogs(self)
+        with profiler.phase("cogs.load"):
+            await load_cogs(self)
 
         # 永続的Viewの登録
-        from views import PersistentViewManager
-        await PersistentViewManager.register_all(self)
+        with profiler.phase("views.register"):
+            from views import PersistentViewManager
+            await PersistentViewManager.register_all(self)
         self.logger.info("永続的Viewを登録しました")
 
-        # スラッシュコマンドの同期
-        self.logger.info("スラッシュコマンドを同期中...")
-        await self.tree.sync()
-        self.logger.info("スラッシュコマンドを同期しました")
+        # ランチャーとの接続
+        if self.cluster:
+            self.cluster.start()
+
+        # イベントループの監視（Cog読み込みなど起動時の同期処理は対象外）
+        self.loop_watchdog.start()
+        self.perf.gc.start()
+        if self.config.asyncio_debug:
+            self.loop_watchdog.enable_debug(self.config.slow_callback_duration)
+
+        # メトリクス（計測は常に行い、公開は設定で有効な場合のみ）
+        registry.add_collector("bot", self._collect_metrics)
+        if self.config.metrics_enabled:
+            self.metrics_server = MetricsServer(
+                self.config.metrics_host,
+                self.config.metrics_port + (self.cluster_id or 0),
+                refresh=self.perf.refresh_memory
+            )
+            try:
+                await self.metrics_server.start()
+            except OSError as e:
+                self.logger.error(f"メトリクスの公開に失敗しました: {e}")
+                self.metrics_server = None
+
+        # スラッシュコマンドの同期（前回から変更がある場合のみ。クラスターではクラスター0のみ）
+        if self.is_primary_cluster:
+            with profiler.phase("tree.sync"):
+                try:
+                    await sync_commands(self)
+                except discord.HTTPException as e:
+                    self.logger.error(f"スラッシュコマンドの同期に失敗しました: {e}")
+
+        if profiler.enabled:
+            report = profiler.write(self.profile_path)
+            self.logger.info(f"起動プロファイルを書き出しました: {self.profile_path}\n{report}")
+            if self.profile_exit:
+                asyncio.create_task(self.close())
 
     async def on_ready(self) -> None:
         """Bot準備完了時"""
         self.logger.info(f"ログイン完了: {self.user} (ID: {self.user.id})")
         self.logger.info(f"接続サーバー数: {len(self.guilds)}")
+        self.logger.info(f"シャード: {list(self.shards)} / {self.shard_count}")
+        self.logger.info(f"キャッシュプロファイル: {self.member_cache.profile.name}")
 
         # ステータス更新タスクを開始
         self.status_manager.start()
 
+        # ランチャーに準備完了を通知（次のクラスターが起動する）
+        if self.cluster:
+            await self.cluster.notify_ready()
+
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """サーバー参加時"""
         await self.db.ensure_guild(guild.id)
@@ -72,24 +296,80 @@ class SumireBot(commands.Bot):
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         """サーバー退出時"""
         self.logger.info(f"サーバーから退出: {guild.name} (ID: {guild.id})")
+        self.spam_filter.forget_guild(guild.id)
 
     async def close(self) -> None:
         """Bot終了時のクリーンアップ"""
         self.logger.info("Botを終了します...")
         self.status_manager.stop()
-        await self.db.close()
+        # Cogのアンロード処理（セッション保存など）がDBを使うため、DBは最後に閉じる
         await super().close()
+        if self.cluster:
+            await self.cluster.close()
+        if self.metrics_server:
+            await self.metrics_server.close()
+        self.loop_watchdog.stop()
+        self.perf.gc.stop()
+        await self.outbound.close()
+        self.rank_cards.close()
+        await self.db.close()
 
 
-async def main() -> None:
-    """メイン関数"""
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="すみれBot v2")
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="logs/startup_profile.json",
+        default=None,
+        metavar="PATH",
+        help="起動時間を計測してJSON（と同名の .txt レポート）に書き出す"
+    )
+    parser.add_argument(
+        "--profile-exit",
+        action="store_true",
+        help="起動プロファイルを書き出したら終了する（CIのベンチマーク用）"
+    )
+
+    # launcher.py がクラスターとして起動する場合に指定する
+    cluster = parser.add_argument_group("クラスター（launcher.py が指定）")
+    cluster.add_argument("--cluster-id", type=int, default=None, help="クラスター番号")
+    cluster.add_argument(
+        "--shard-ids",
+        type=lambda value: [int(v) for v in value.split(",") if v],
+        default=None,
+        help="担当するシャード（カンマ区切り）"
+    )
+    cluster.add_argument("--shard-count", type=int, default=None, help="全体のシャード数")
+    cluster.add_argument("--ipc-port", type=int, default=None, help="ランチャーの通信ポート")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> int:
+    """
+    メイン関数
+
+    Returns:
+        int: プロセスの終了コード（/restart の場合は再起動用のコード）
+    """
     config = Config()
 
-    # ロギング設定
+    # ロギング設定（クラスターごとに別ファイル）
+    log_file = config.log_file
+    if log_file and args.cluster_id is not None:
+        path = Path(log_file)
+        log_file = str(path.with_name(f"{path.stem}.cluster{args.cluster_id}{path.suffix}"))
     setup_logging(
         level=config.log_level,
-        log_file=config.log_file,
-        console=config.log_console
+        log_file=log_file,
+        console=config.log_console,
+        rotation=config.log_rotation,
+        max_bytes=config.log_max_bytes,
+        when=config.log_when,
+        backup_count=config.log_backup_count,
+        json_format=config.log_json,
+        debug_per_second=config.log_debug_per_second
     )
 
     logger = get_logger("sumire")
@@ -98,10 +378,21 @@ async def main() -> None:
     # トークンチェック
     if not config.token or config.token == "YOUR_BOT_TOKEN_HERE":
         logger.error("BOTトークンが設定されていません。config.yaml を確認してください。")
-        return
+        return 1
+
+    if args.shard_ids is not None and not args.shard_count:
+        logger.error("--shard-ids を指定する場合は --shard-count も指定してください。")
+        return 1
 
     # Bot起動
-    bot = SumireBot()
+    bot = SumireBot(
+        profile_path=args.profile_startup,
+        profile_exit=args.profile_exit,
+        cluster_id=args.cluster_id,
+        shard_ids=args.shard_ids,
+        shard_count=args.shard_count,
+        ipc_port=args.ipc_port
+    )
 
     try:
         await bot.start(config.token)
@@ -115,6 +406,8 @@ async def main() -> None:
         if not bot.is_closed():
             await bot.close()
 
+    return bot.exit_code
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(asyncio.run(main(parse_args())))
@@ -1,5 +1,5 @@
 """
-Admin Cog - 管理コマンド（AutoRole, Owner）
+Admin Cog - 管理コマンド（AutoRole, Owner, Perf）
 """
 from __future__ import annotations
 
@@ -11,15 +11,17 @@ from discord.ext import commands
 from utils.config import Config
 from utils.database import Database
 from utils.checks import handle_app_command_error
+from utils.join_pipeline import RoleGrantQueue
 
 from .autorole import AutoRoleMixin
 from .owner import OwnerMixin
+from .perf import PerfMixin
 
 if TYPE_CHECKING:
     from bot import SumireBot
 
 
-class Admin(AutoRoleMixin, OwnerMixin, commands.Cog):
+class Admin(AutoRoleMixin, OwnerMixin, PerfMixin, commands.Cog):
     """管理コマンド"""
 
     def __init__(self, bot: SumireBot) -> None:
@@ -27,6 +29,19 @@ class Admin(AutoRoleMixin, OwnerMixin, commands.Cog):
         self.config = Config()
         self.db = Database()
 
+        # 参加パイプライン（レイド検知・ロール付与キュー）
+        self.role_grants = RoleGrantQueue(self.config.autorole_concurrency)
+        self._join_windows = {}
+        self._raid_states = {}
+
+    async def cog_unload(self) -> None:
+        """Cog アンロード時に付与キューとレイド監視を停止"""
+        for raid in self._raid_states.values():
+            if raid.task and not raid.task.done():
+                raid.task.cancel()
+        self._raid_states.clear()
+        await self.role_grants.close()
+
     # ==================== エラーハンドリング ====================
 
     async def cog_app_command_error(
@@ -3,6 +3,8 @@ AutoRole コマンドとイベント
 """
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Optional
 
 import discord
@@ -13,11 +15,14 @@ from utils.config import Config
 from utils.database import Database
 from utils.logging import get_logger
 from utils.checks import Checks
+from utils.join_pipeline import JoinRateWindow, RoleGrantQueue
+from utils.outbound import Priority
 from views.common_views import (
     CommonErrorView,
     CommonSuccessView,
     CommonWarningView
 )
+from views.log_views import LogRaidModeView
 
 logger = get_logger("sumire.cogs.admin.autorole")
 
@@ -248,14 +253,45 @@ class AutoRoleSettingsView(ui.LayoutView):
         logger.info(f"AutoRole {type_text}ロールクリア: {interaction.guild.name}")
 
 
+class _RaidState:
+    """サーバーごとのレイドモード状態"""
+
+    __slots__ = ("until", "join_count", "paused_count", "task")
+
+    def __init__(self, until: float, join_count: int) -> None:
+        self.until = until
+        self.join_count = join_count
+        self.paused_count = 0
+        self.task: Optional[asyncio.Task] = None
+
+
 class AutoRoleMixin:
     """AutoRoleコマンドとイベント Mixin"""
 
+    role_grants: RoleGrantQueue
+    _join_windows: dict[int, JoinRateWindow]
+    _raid_states: dict[int, _RaidState]
+
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
-        """メンバー参加時のロール付与"""
+        """メンバー参加時のロール付与（レイド検知・キュー経由）"""
         guild = member.guild
 
+        # 参加レートを計測し、閾値を超えたらレイドモード
+        window = self._join_windows.get(guild.id)
+        if window is None:
+            window = self._join_windows[guild.id] = JoinRateWindow(self.config.raid_window)
+        join_count = window.record()
+        surging = join_count >= self.config.raid_join_threshold
+
+        raid = self._raid_states.get(guild.id)
+        if raid is None and surging:
+            raid = self._enter_raid_mode(guild, join_count)
+        elif raid is not None:
+            raid.join_count += 1
+            if surging:
+                raid.until = time.monotonic() + self.config.raid_cooldown
+
         settings = await self.db.get_autorole_settings(guild.id)
         if not settings or not settings.get("enabled", 1):
             return
@@ -270,6 +306,11 @@ class AutoRoleMixin:
         if not role_id:
             return
 
+        # レイドモード中は付与しない
+        if raid is not None:
+            raid.paused_count += 1
+            return
+
         role = guild.get_role(role_id)
         if not role:
             logger.warning(f"AutoRole: ロールが見つかりません role_id={role_id}")
@@ -279,13 +320,59 @@ class AutoRoleMixin:
             logger.warning(f"AutoRole: 権限不足でロールを付与できません role={role.name}")
             return
 
-        try:
-            await member.add_roles(role, reason=f"AutoRole: {role_type}メンバー参加")
-            logger.info(f"AutoRole: {role.name} を {member} に付与 ({role_type})")
-        except discord.Forbidden:
-            logger.error(f"AutoRole: ロール付与権限なし role={role.name}, member={member}")
-        except discord.HTTPException as e:
-            logger.error(f"AutoRole: ロール付与エラー: {e}")
+        if not self.role_grants.submit(member, [role], f"AutoRole: {role_type}メンバー参加"):
+            logger.warning(f"AutoRole: 付与キューが満杯のため破棄 member={member}")
+
+    def _enter_raid_mode(self, guild: discord.Guild, join_count: int) -> _RaidState:
+        """レイドモードを開始"""
+        raid = self._raid_states[guild.id] = _RaidState(
+            until=time.monotonic() + self.config.raid_cooldown,
+            join_count=join_count
+        )
+        # 検知前にキューに入った付与も取り消す
+        raid.paused_count = self.role_grants.discard_guild(guild.id)
+        raid.task = asyncio.create_task(self._watch_raid_mode(guild))
+
+        logger.warning(
+            f"レイドモード開始: {guild.name} ({join_count}人 / {self.config.raid_window}秒)"
+        )
+        self._send_raid_alert(guild, LogRaidModeView(
+            is_active=True,
+            join_count=join_count,
+            window=self.config.raid_window
+        ))
+        return raid
+
+    async def _watch_raid_mode(self, guild: discord.Guild) -> None:
+        """大量参加が収まったらレイドモードを解除"""
+        raid = self._raid_states[guild.id]
+        while (remaining := raid.until - time.monotonic()) > 0:
+            await asyncio.sleep(remaining)
+
+        self._raid_states.pop(guild.id, None)
+        logger.info(f"レイドモード解除: {guild.name} (参加 {raid.join_count}人, 見送り {raid.paused_count}人)")
+        self._send_raid_alert(guild, LogRaidModeView(
+            is_active=False,
+            join_count=raid.join_count,
+            window=self.config.raid_window,
+            paused_count=raid.paused_count
+        ))
+
+    def _send_raid_alert(self, guild: discord.Guild, view: LogRaidModeView) -> None:
+        """ログチャンネルにレイド通知を送信"""
+        asyncio.create_task(self._deliver_raid_alert(guild, view))
+
+    async def _deliver_raid_alert(self, guild: discord.Guild, view: LogRaidModeView) -> None:
+        """ログ設定を確認して送信"""
+        settings = await self.db.get_logger_settings(guild.id)
+        if not settings or not settings.get("enabled"):
+            return
+
+        channel = guild.get_channel(settings.get("channel_id"))
+        if not channel:
+            return
+
+        self.bot.outbound.send(channel, view=view, priority=Priority.MODERATION)
 
     @app_commands.command(name="autorole", description="自動ロール付与の設定を行います")
     @app_commands.default_permissions(administrator=True)
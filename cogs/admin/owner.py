@@ -3,13 +3,14 @@ Owner コマンド（shutdown, restart, sync）
 """
 from __future__ import annotations
 
-import sys
+import asyncio
 
 import discord
 from discord import app_commands
 
 from utils.logging import get_logger
 from utils.cog_loader import get_cog_list, get_cog_names, reload_cog, reload_all_cogs
+from utils.command_sync import sync_commands
 from views.common_views import (
     CommonErrorView,
     CommonSuccessView,
@@ -41,14 +42,20 @@ class OwnerMixin:
             await interaction.response.send_message(view=view, ephemeral=True)
             return
 
+        cluster = self.bot.cluster
         view = CommonInfoView(
             title="シャットダウン",
-            description="Botをシャットダウンしています..."
+            description="全クラスターをシャットダウンしています..." if cluster and cluster.connected
+            else "Botをシャットダウンしています..."
         )
         await interaction.response.send_message(view=view)
 
         logger.info(f"シャットダウン実行: {interaction.user}")
-        await self.bot.close()
+        # クラスターの場合はランチャーが全クラスターに終了を指示する
+        if cluster and cluster.connected:
+            await cluster.control("shutdown")
+            return
+        await self.bot.request_exit(0)
 
     @app_commands.command(name="restart", description="Botを再起動します（オーナー専用）")
     async def restart(self, interaction: discord.Interaction) -> None:
@@ -61,26 +68,40 @@ class OwnerMixin:
             await interaction.response.send_message(view=view, ephemeral=True)
             return
 
-        view = CommonInfoView(
-            title="再起動",
-            description="Botを再起動しています...\n-# 起動スクリプトを使用している場合のみ自動再起動されます"
-        )
+        cluster = self.bot.cluster
+        if cluster and cluster.connected:
+            description = "全クラスターを再起動しています..."
+        else:
+            description = "Botを再起動しています...\n-# 起動スクリプト・ランチャーを使用している場合のみ自動再起動されます"
+        view = CommonInfoView(title="再起動", description=description)
         await interaction.response.send_message(view=view)
 
         logger.info(f"再起動実行: {interaction.user}")
-        await self.bot.close()
-        sys.exit(RESTART_EXIT_CODE)
+        # クラスターの場合はランチャーが全クラスターを順に再起動する
+        if cluster and cluster.connected:
+            await cluster.control("restart")
+            return
+        await self.bot.request_exit(RESTART_EXIT_CODE)
 
     @app_commands.command(name="sync", description="Cogをリロードしてコマンドを同期します（オーナー専用）")
     @app_commands.describe(
         cog="リロードするCog名（空欄で全Cog）",
-        reload="Cogをリロードするか（デフォルト: True）"
+        reload="Cogをリロードするか（デフォルト: True）",
+        scope="同期先（デフォルト: グローバル）",
+        force="変更がなくても同期するか（デフォルト: False）"
     )
+    @app_commands.choices(scope=[
+        app_commands.Choice(name="グローバル", value="global"),
+        app_commands.Choice(name="このサーバー（グローバルコマンドをコピーして即時反映）", value="guild"),
+        app_commands.Choice(name="このサーバーのコマンドを削除", value="guild_clear"),
+    ])
     async def sync(
         self,
         interaction: discord.Interaction,
         cog: str = None,
-        reload: bool = True
+        reload: bool = True,
+        scope: str = "global",
+        force: bool = False
     ) -> None:
         """Cogリロード + コマンド同期"""
         if not self._is_owner(interaction.user.id):
@@ -120,11 +141,34 @@ class OwnerMixin:
                 else:
                     result_lines.append(f"✅ 全{success_count}個のCogをリロード")
 
-        # コマンド同期
+            # 他のクラスターでも同じCogをリロード
+            if self.bot.cluster and self.bot.cluster.connected:
+                result_lines.append(await self._reload_other_clusters(cog_name if cog else None))
+
+        # コマンド同期（変更がない場合はスキップ）
+        guild = None
+        if scope != "global":
+            if not interaction.guild:
+                view = CommonErrorView(
+                    title="エラー",
+                    description="サーバーへの同期はサーバー内でのみ使用できます。"
+                )
+                await interaction.followup.send(view=view, ephemeral=True)
+                return
+            guild = interaction.guild
+            if scope == "guild":
+                self.bot.tree.copy_global_to(guild=guild)
+            else:
+                self.bot.tree.clear_commands(guild=guild)
+
+        target = f"`{guild.name}`" if guild else "グローバル"
         try:
-            synced = await self.bot.tree.sync()
-            result_lines.append(f"✅ {len(synced)}個のコマンドを同期")
-            logger.info(f"コマンド同期: {len(synced)} 個 by {interaction.user}")
+            synced = await sync_commands(self.bot, guild=guild, force=force)
+            if synced is None:
+                result_lines.append(f"✅ {target}: 変更がないため同期をスキップ\n-# `force` で強制的に同期できます")
+            else:
+                result_lines.append(f"✅ {target}: {synced}個のコマンドを同期")
+                logger.info(f"コマンド同期: {synced} 個 ({target}) by {interaction.user}")
         except Exception as e:
             result_lines.append(f"❌ コマンド同期失敗: {e}")
             logger.error(f"コマンド同期エラー: {e}")
@@ -151,6 +195,24 @@ class OwnerMixin:
 
         await interaction.followup.send(view=view, ephemeral=True)
 
+    async def _reload_other_clusters(self, cog_name: str = None) -> str:
+        """他のクラスターにCogのリロードを依頼し、結果を1行にまとめる"""
+        try:
+            replies = await self.bot.cluster.request("reload_cogs", {"cog": cog_name})
+        except (ConnectionError, asyncio.TimeoutError) as e:
+            return f"❌ 他のクラスターへのリロード依頼に失敗: {e!r}"
+
+        if not replies:
+            return "✅ 他のクラスターなし"
+
+        failed = [
+            str(cluster_id) for cluster_id, reply in sorted(replies.items())
+            if not isinstance(reply, dict) or reply.get("error") or reply.get("failed")
+        ]
+        if failed:
+            return f"⚠️ 他のクラスター: {len(replies)}個中 クラスター {', '.join(failed)} でリロード失敗あり"
+        return f"✅ 他の{len(replies)}個のクラスターでリロード"
+
     @sync.autocomplete("cog")
     async def sync_autocomplete(
         self,
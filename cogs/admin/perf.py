@@ -0,0 +1,266 @@
+"""
+Perf コマンド（パフォーマンス診断、オーナー専用）
+
+表示する値はプロセス内のリングバッファ・ヒストグラムをその場で集計したもので、
+コマンド自体は Discord API 以外の I/O を行わない（RSS の取得のみ別スレッド）。
+"""
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+import discord
+from discord import app_commands, ui
+
+from utils.logging import get_logger
+from utils.metrics import registry
+from utils.perf import percentile
+from views.common_views import CommonErrorView
+
+logger = get_logger("sumire.cogs.admin.perf")
+
+# 各項目に表示する件数
+TOP_N = 5
+
+# p99 の表示に必要な最低件数（少ないと外れ値だけになるため）
+MIN_SAMPLES = 20
+
+
+def _ms(seconds: float) -> str:
+    """秒をミリ秒表記に"""
+    return f"{seconds * 1000:.1f}ms"
+
+
+def _uptime(seconds: float) -> str:
+    """稼働時間の表記"""
+    minutes, _ = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}日{hours}時間"
+    if hours:
+        return f"{hours}時間{minutes}分"
+    return f"{minutes}分"
+
+
+def _histogram_rows(name: str, label: Callable[[tuple[str, ...]], str]) -> list[tuple[str, float, float, int]]:
+    """ヒストグラムのラベルごとの (名前, p50, p99, 件数)。p99 の大きい順"""
+    metric = registry.get(name)
+    if metric is None:
+        return []
+    rows = [
+        (label(key), value.quantile(0.5), value.quantile(0.99), value.count)
+        for key, value in metric.children().items()
+        if value.count >= MIN_SAMPLES
+    ]
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
+
+
+class PerfView(ui.LayoutView):
+    """パフォーマンス診断ダッシュボード (Components V2)"""
+
+    def __init__(
+        self,
+        snapshot: dict[str, Any],
+        refresh: Callable[[], Awaitable[dict[str, Any]]],
+        owner_id: int
+    ) -> None:
+        super().__init__(timeout=300)
+        self.snapshot = snapshot
+        self.refresh = refresh
+        self.owner_id = owner_id
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        """UIを構築"""
+        s = self.snapshot
+        lag_p99 = s["loop"]["p99"]
+        if lag_p99 < 0.05:
+            color = discord.Colour.green()
+        elif lag_p99 < 0.25:
+            color = discord.Colour.yellow()
+        else:
+            color = discord.Colour.red()
+
+        container = ui.Container(accent_colour=color)
+        container.add_item(ui.TextDisplay(f"# 📊 パフォーマンス\n-# {s['scope']} ・ 稼働 {s['uptime']}"))
+        container.add_item(ui.Separator())
+
+        # イベントループ・ゲートウェイ
+        loop = s["loop"]
+        lines = [
+            f"**イベントループ遅延（直近5分）:** p50 `{_ms(loop['p50'])}` / p99 `{_ms(loop['p99'])}` / "
+            f"最大 `{_ms(loop['max'])}`",
+            f"**ブロック検出:** {loop['blocks']}件" + (f"（直近: `{loop['last_block']}`）" if loop["last_block"] else ""),
+            f"**ゲートウェイ:** `{s['gateway']['rate']:.1f}` イベント/秒（直近1分）",
+        ]
+        if s["gateway"]["top"]:
+            lines.append("-# " + " ・ ".join(f"{name} {count:,}" for name, count in s["gateway"]["top"]))
+        container.add_item(ui.TextDisplay("\n".join(lines)))
+        container.add_item(ui.Separator())
+
+        # リスナー・DB
+        container.add_item(ui.TextDisplay(self._timing_section("🐢 遅いリスナー", s["listeners"])))
+        container.add_item(ui.TextDisplay(self._timing_section("🗄️ DB（メソッド別）", s["db"])))
+        container.add_item(ui.Separator())
+
+        # キャッシュ・送信キュー
+        if s["caches"]:
+            cache_lines = [
+                f"`{name}` {rate:.1%}（{total:,}回）" for name, rate, total in s["caches"]
+            ]
+            container.add_item(ui.TextDisplay("**🎯 キャッシュヒット率**\n" + "\n".join(cache_lines)))
+
+        outbound = s["outbound"]
+        outbound_text = (
+            f"**📤 送信キュー:** 待ち {outbound['queued']}件 / {outbound['channels']}チャンネル\n"
+            f"-# 送信 {outbound['sent']:,} ・ 破棄 {outbound['dropped']:,} ・ 統合 {outbound['coalesced']:,} ・ "
+            f"429 {outbound['rate_limited']:,}"
+        )
+        if s["queue_depths"]:
+            outbound_text += "\n" + "\n".join(f"<#{channel_id}> {depth}件" for channel_id, depth in s["queue_depths"])
+        container.add_item(ui.TextDisplay(outbound_text))
+        container.add_item(ui.Separator())
+
+        # サーバー別・プロセス
+        if s["hotspots"]:
+            hotspot_lines = [
+                f"{name} `{seconds:.2f}秒` / {count:,}件" for name, seconds, count in s["hotspots"]
+            ]
+            container.add_item(ui.TextDisplay("**🔥 処理時間の多いサーバー（直近5分）**\n" + "\n".join(hotspot_lines)))
+
+        process = s["process"]
+        container.add_item(ui.TextDisplay(
+            f"**💾 プロセス:** RSS `{process['rss_mb']:.1f}MB` ・ スレッド {process['threads']}\n"
+            f"**GC:** 回数 {' / '.join(str(c) for c in process['gc_collections'])}（世代0/1/2） ・ "
+            f"停止 p99 `{_ms(process['gc_p99'])}` / 最大 `{_ms(process['gc_max'])}`"
+        ))
+
+        row = ui.ActionRow()
+        row.add_item(ui.Button(label="更新", emoji="🔄", style=discord.ButtonStyle.secondary, custom_id="perf:refresh"))
+        container.add_item(row)
+        self.add_item(container)
+
+    @staticmethod
+    def _timing_section(title: str, rows: list[tuple[str, float, float, int]]) -> str:
+        if not rows:
+            return f"**{title}**\n-# 計測データなし"
+        lines = [f"`{name}` p50 `{_ms(p50)}` / p99 `{_ms(p99)}`（{count:,}回）" for name, p50, p99, count in rows]
+        return f"**{title}**\n" + "\n".join(lines)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """インタラクションのチェックとルーティング"""
+        if interaction.data.get("custom_id") != "perf:refresh":
+            return True
+
+        if interaction.user.id != self.owner_id:
+            view = CommonErrorView(
+                title="権限エラー",
+                description="このコマンドはBotオーナーのみ使用できます。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return False
+
+        await interaction.response.defer()
+        self.snapshot = await self.refresh()
+        self.clear_items()
+        self._build_ui()
+        await interaction.edit_original_response(view=self)
+        return False
+
+
+class PerfMixin:
+    """パフォーマンス診断コマンド Mixin"""
+
+    @app_commands.command(name="perf", description="パフォーマンス診断を表示します（オーナー専用）")
+    async def perf(self, interaction: discord.Interaction) -> None:
+        """パフォーマンス診断ダッシュボード"""
+        if not self._is_owner(interaction.user.id):
+            view = CommonErrorView(
+                title="権限エラー",
+                description="このコマンドはBotオーナーのみ使用できます。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        snapshot = await self._perf_snapshot()
+        view = PerfView(snapshot, self._perf_snapshot, interaction.user.id)
+        await interaction.response.send_message(view=view, ephemeral=True)
+
+    async def _perf_snapshot(self) -> dict[str, Any]:
+        """表示する値を集計"""
+        bot = self.bot
+        perf = bot.perf
+        watchdog = bot.loop_watchdog
+
+        # 対象（クラスター・シャード）
+        scope = f"シャード {', '.join(str(s) for s in bot.shards) or '-'} / {bot.shard_count or 1}"
+        if bot.cluster_id is not None:
+            scope = f"クラスター {bot.cluster_id} ・ {scope}"
+
+        lags = list(watchdog.lags)
+        collected = registry.collect("sumire_event_loop_blocks_total", "sumire_cache_lookups_total")
+        blocks = collected["sumire_event_loop_blocks_total"]
+
+        # ゲートウェイイベントの種類（起動後の累計）
+        gateway = registry.get("sumire_gateway_events_total")
+        gateway_top = sorted(
+            ((key[0], int(value.value)) for key, value in gateway.children().items()),
+            key=lambda item: item[1],
+            reverse=True
+        )[:3] if gateway else []
+
+        # キャッシュヒット率
+        caches: dict[str, list[float]] = {}
+        for labels, value in collected["sumire_cache_lookups_total"]:
+            counts = caches.setdefault(labels["cache"], [0.0, 0.0])
+            counts[0 if labels["result"] == "hit" else 1] += value
+        cache_rows = sorted(
+            (
+                (name, hits / (hits + misses), int(hits + misses))
+                for name, (hits, misses) in caches.items() if hits + misses
+            ),
+            key=lambda row: row[2],
+            reverse=True
+        )
+
+        # サーバー別の処理時間
+        hotspots = []
+        for guild_id, seconds, count in perf.hotspots.top(TOP_N):
+            guild = bot.get_guild(guild_id)
+            hotspots.append((guild.name if guild else str(guild_id), seconds, count))
+
+        rss = await perf.refresh_memory() / (1024 ** 2)
+        pauses = perf.gc.pauses()
+
+        return {
+            "scope": scope,
+            "uptime": _uptime(time.time() - perf.started),
+            "loop": {
+                "p50": percentile(lags, 0.5),
+                "p99": percentile(lags, 0.99),
+                "max": max(lags, default=0.0),
+                "blocks": int(sum(value for _, value in blocks)),
+                "last_block": watchdog.history[-1].coroutine if watchdog.history else None,
+            },
+            "gateway": {"rate": perf.gateway_events.rate(), "top": gateway_top},
+            "listeners": _histogram_rows("sumire_listener_seconds", lambda key: key[0])[:TOP_N],
+            "db": _histogram_rows(
+                "sumire_db_query_seconds",
+                lambda key: f"{key[0].removesuffix('Mixin')}.{key[1]}"
+            )[:TOP_N],
+            "caches": cache_rows[:8],
+            "outbound": bot.outbound.stats(),
+            "queue_depths": sorted(bot.outbound.queue_depths().items(), key=lambda item: item[1], reverse=True)[:3],
+            "hotspots": hotspots,
+            "process": {
+                "rss_mb": rss,
+                "threads": threading.active_count(),
+                "gc_collections": [stat["collections"] for stat in gc.get_stats()],
+                "gc_p99": percentile(pauses, 0.99),
+                "gc_max": max(pauses, default=0.0),
+            },
+        }
@@ -3,6 +3,8 @@ Ping コマンド
 """
 from __future__ import annotations
 
+from typing import Optional
+
 import discord
 from discord import app_commands, ui
 
@@ -10,7 +12,7 @@ from discord import app_commands, ui
 class PingView(ui.LayoutView):
     """Ping結果表示用View (Components V2)"""
 
-    def __init__(self, latency: int) -> None:
+    def __init__(self, latency: int, shard_id: Optional[int] = None) -> None:
         super().__init__(timeout=300)
 
         # レイテンシに応じた色とステータス
@@ -27,8 +29,10 @@ class PingView(ui.LayoutView):
         container = ui.Container(accent_colour=color)
         container.add_item(ui.TextDisplay("# 🏓 Pong!"))
         container.add_item(ui.Separator())
+        shard_text = f"**シャード:** `{shard_id}`\n" if shard_id is not None else ""
         container.add_item(ui.TextDisplay(
             f"**WebSocket:** `{latency}ms`\n"
+            f"{shard_text}"
             f"**ステータス:** {status}"
         ))
         self.add_item(container)
@@ -40,6 +44,10 @@ class PingMixin:
     @app_commands.command(name="ping", description="BOTのレイテンシを測定します")
     async def ping(self, interaction: discord.Interaction) -> None:
         """BOTのレイテンシを測定"""
-        ws_latency = round(self.bot.latency * 1000)
-        view = PingView(latency=ws_latency)
+        # サーバー内ではそのサーバーを担当するシャードのレイテンシ
+        shard = self.bot.get_shard(interaction.guild.shard_id) if interaction.guild else None
+        if shard is not None and self.bot.shard_count and self.bot.shard_count > 1:
+            view = PingView(latency=round(shard.latency * 1000), shard_id=shard.id)
+        else:
+            view = PingView(latency=round(self.bot.latency * 1000))
         await interaction.response.send_message(view=view)
@@ -3,6 +3,8 @@ Profile コマンド
 """
 from __future__ import annotations
 
+import io
+
 import discord
 from discord import app_commands
 
@@ -38,7 +40,7 @@ class ProfileMixin:
 
         # メンバーオブジェクトを取得（user引数がMemberでない場合に備えて）
         if not isinstance(member, discord.Member):
-            member = interaction.guild.get_member(member.id)
+            member = await self.bot.member_cache.get_member(interaction.guild, member.id)
             if not member:
                 view = CommonErrorView(
                     title="エラー",
@@ -51,24 +53,36 @@ class ProfileMixin:
 
         # データベースからアクティビティ統計を取得
         db = Database()
-        user_data = await db.get_user_level(interaction.guild.id, member.id)
+        user_data = await db.get_user_level_with_ranks(interaction.guild.id, member.id)
 
         vc_time = 0
         reactions_given = 0
         reactions_received = 0
+        card = None
 
         if user_data:
             vc_time = user_data.get("vc_time", 0)
             reactions_given = user_data.get("reactions_given", 0)
             reactions_received = user_data.get("reactions_received", 0)
+            card = await self.bot.rank_cards.render(
+                member,
+                level=user_data["level"],
+                xp=user_data["xp"],
+                rank=user_data.get("text_rank"),
+                accent=member.accent_color
+            )
 
         # プロフィールViewを作成
         view = ProfileView(
             member=member,
             vc_time=vc_time,
             reactions_given=reactions_given,
-            reactions_received=reactions_received
+            reactions_received=reactions_received,
+            card="rank.png" if card else None
         )
 
-        await interaction.followup.send(view=view)
+        if card:
+            await interaction.followup.send(view=view, file=discord.File(io.BytesIO(card), filename="rank.png"))
+        else:
+            await interaction.followup.send(view=view)
         logger.debug(f"Profile表示: {member} by {interaction.user}")
@@ -15,6 +15,7 @@ from discord.ext import commands, tasks
 from utils.config import Config
 from utils.database import Database
 from utils.logging import get_logger
+from utils.outbound import Priority
 from utils.time_parser import parse_duration, format_duration
 from utils.checks import Checks
 from views.giveaway_views import GiveawayView, GiveawayEndedView, GiveawayNoParticipantsView
@@ -36,13 +37,7 @@ class Giveaway(commands.Cog):
 
     async def cog_load(self) -> None:
         """Cog読み込み時"""
-        # 永続的Viewを登録
-        self.bot.add_view(GiveawayView(
-            prize="placeholder",
-            host=self.bot.user,
-            end_time=datetime.utcnow(),
-            participant_count=0
-        ))
+        # 参加ボタンは PersistentViewManager で DynamicItem として登録済み
         # チェックタスクを開始
         self.check_ended_giveaways.start()
         logger.info("Giveaway Cog loaded")
@@ -59,6 +54,9 @@ class Giveaway(commands.Cog):
             now = datetime.utcnow()
 
             for giveaway in giveaways:
+                # 他のクラスターが担当するサーバーは扱わない
+                if not self.bot.owns_guild(giveaway["guild_id"]):
+                    continue
                 end_time = datetime.fromisoformat(giveaway["end_time"])
                 if now >= end_time:
                     await self._end_giveaway(giveaway)
@@ -104,8 +102,9 @@ class Giveaway(commands.Cog):
             # 当選者のユーザーオブジェクトを取得
             winners = []
             guild = channel.guild
+            members = await self.bot.member_cache.get_members(guild, [*winners_ids, giveaway["host_id"]])
             for winner_id in winners_ids:
-                member = guild.get_member(winner_id)
+                member = members.get(winner_id)
                 if member:
                     winners.append(member)
                 else:
@@ -116,7 +115,7 @@ class Giveaway(commands.Cog):
                         pass
 
             # 主催者を取得
-            host = guild.get_member(giveaway["host_id"])
+            host = members.get(giveaway["host_id"])
             if not host:
                 try:
                     host = await self.bot.fetch_user(giveaway["host_id"])
@@ -139,9 +138,13 @@ class Giveaway(commands.Cog):
             # 当選者をメンション
             if winners:
                 winner_mentions = " ".join(w.mention for w in winners)
-                await channel.send(
-                    f"🎊 **おめでとうございます！** {winner_mentions}\n"
-                    f"「**{giveaway['prize']}**」に当選しました！"
+                self.bot.outbound.send(
+                    channel,
+                    content=(
+                        f"🎊 **おめでとうございます！** {winner_mentions}\n"
+                        f"「**{giveaway['prize']}**」に当選しました！"
+                    ),
+                    priority=Priority.NORMAL
                 )
 
             logger.info(f"Giveaway終了: {giveaway['prize']} - 当選者: {len(winners)}人")
@@ -341,8 +344,9 @@ class Giveaway(commands.Cog):
 
         # 当選者のユーザーオブジェクトを取得
         new_winners = []
+        members = await self.bot.member_cache.get_members(interaction.guild, new_winners_ids)
         for winner_id in new_winners_ids:
-            member = interaction.guild.get_member(winner_id)
+            member = members.get(winner_id)
             if member:
                 new_winners.append(member)
             else:
@@ -11,17 +11,19 @@ from discord.ext import commands
 from utils.config import Config
 from utils.database import Database
 from utils.checks import handle_app_command_error
+from utils.join_pipeline import RoleGrantQueue
 
 from .rank import RankMixin
 from .leaderboard import LeaderboardMixin
 from .settings import SettingsMixin
 from .events import EventsMixin
+from .rewards import LevelRewardsMixin
 
 if TYPE_CHECKING:
     from bot import SumireBot
 
 
-class Leveling(RankMixin, LeaderboardMixin, SettingsMixin, EventsMixin, commands.Cog):
+class Leveling(RankMixin, LeaderboardMixin, SettingsMixin, EventsMixin, LevelRewardsMixin, commands.Cog):
     """レベルシステム"""
 
     def __init__(self, bot: SumireBot) -> None:
@@ -29,6 +31,20 @@ class Leveling(RankMixin, LeaderboardMixin, SettingsMixin, EventsMixin, commands
         self.config = Config()
         self.db = Database()
 
+        # レベル報酬ロールの付与キューと実行中の同期
+        self.level_role_grants = RoleGrantQueue(self.config.autorole_concurrency, label="LevelRole")
+        self._level_role_syncs = {}
+
+        # XPクールダウン（(guild_id, user_id) -> 終了時刻）
+        self._xp_cooldowns = {}
+
+    async def cog_unload(self) -> None:
+        """Cog アンロード時に同期と付与キューを停止"""
+        for task in self._level_role_syncs.values():
+            task.cancel()
+        self._level_role_syncs.clear()
+        await self.level_role_grants.close()
+
     # ==================== ヘルパーメソッド ====================
 
     def _format_time(self, seconds: int) -> str:
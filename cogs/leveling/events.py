@@ -4,6 +4,7 @@ Leveling イベントリスナー
 from __future__ import annotations
 
 import random
+import time
 from datetime import datetime, timedelta
 
 import discord
@@ -18,10 +19,15 @@ XP_MIN = 10
 XP_MAX = 25
 XP_COOLDOWN_SECONDS = 60
 
+# クールダウンを保持する件数の目安（超えたら期限切れを削除）
+XP_COOLDOWN_CACHE_SIZE = 50000
+
 
 class EventsMixin:
     """Leveling イベントリスナー Mixin"""
 
+    _xp_cooldowns: dict[tuple[int, int], float]
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         """メッセージ送信時のXP獲得処理"""
@@ -31,25 +37,45 @@ class EventsMixin:
         guild_id = message.guild.id
         user_id = message.author.id
 
-        settings = await self.db.get_leveling_settings(guild_id)
-        if settings and not settings.get("enabled", True):
+        # コンパイル済みルールで除外・倍率を判定（DB参照なし）
+        rules = await self.db.get_xp_rules(guild_id)
+        channel = message.channel
+        role_ids = [role.id for role in message.author.roles] if rules.role_multipliers else []
+        multiplier = rules.multiplier_for(channel.id, getattr(channel, "parent_id", None), role_ids)
+        if multiplier <= 0:
             return
 
-        ignored_channels = settings.get("ignored_channels", []) if settings else []
-        if message.channel.id in ignored_channels:
+        # コピペ連投はXPなし
+        if self.bot.spam_filter.is_spam(message):
             return
 
-        last_xp_time = await self.db.get_user_last_xp_time(guild_id, user_id)
-        if last_xp_time:
-            cooldown_end = last_xp_time + timedelta(seconds=XP_COOLDOWN_SECONDS)
-            if datetime.utcnow() < cooldown_end:
+        # クールダウン判定（メモリ上で判定し、再起動直後のみDBを参照）
+        now = time.monotonic()
+        key = (guild_id, user_id)
+        cooldown_until = self._xp_cooldowns.get(key)
+        if cooldown_until is not None:
+            if now < cooldown_until:
                 return
-
-        xp_amount = random.randint(XP_MIN, XP_MAX)
+        else:
+            last_xp_time = await self.db.get_user_last_xp_time(guild_id, user_id)
+            if last_xp_time:
+                cooldown_end = last_xp_time + timedelta(seconds=XP_COOLDOWN_SECONDS)
+                if datetime.utcnow() < cooldown_end:
+                    self._xp_cooldowns[key] = now + (cooldown_end - datetime.utcnow()).total_seconds()
+                    return
+
+        self._xp_cooldowns[key] = now + XP_COOLDOWN_SECONDS
+        if len(self._xp_cooldowns) > XP_COOLDOWN_CACHE_SIZE:
+            self._xp_cooldowns = {k: v for k, v in self._xp_cooldowns.items() if v > now}
+
+        xp_amount = round(random.randint(XP_MIN, XP_MAX) * multiplier)
+        if xp_amount <= 0:
+            return
         new_xp, new_level, leveled_up = await self.db.add_user_xp(guild_id, user_id, xp_amount)
 
         if leveled_up:
             logger.info(f"レベルアップ: {message.author} -> Lv.{new_level} in {message.guild.name}")
+            await self._apply_level_roles(message.author, new_level)
 
     @commands.Cog.listener()
     async def on_leveling_voice_state_update(
@@ -65,8 +91,8 @@ class EventsMixin:
         guild_id = member.guild.id
         user_id = member.id
 
-        settings = await self.db.get_leveling_settings(guild_id)
-        if settings and not settings.get("enabled", True):
+        rules = await self.db.get_xp_rules(guild_id)
+        if not rules.enabled:
             return
 
         if before.channel is None and after.channel is not None:
@@ -96,8 +122,8 @@ class EventsMixin:
         reactor_id = payload.user_id
 
         # レベリング機能が有効かチェック
-        settings = await self.db.get_leveling_settings(guild_id)
-        if settings and not settings.get("enabled", True):
+        rules = await self.db.get_xp_rules(guild_id)
+        if not rules.enabled:
             return
 
         # メッセージを取得して投稿者を特定
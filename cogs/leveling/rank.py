@@ -3,6 +3,7 @@ Rank コマンド
 """
 from __future__ import annotations
 
+import io
 from typing import Optional
 
 import discord
@@ -24,7 +25,8 @@ class RankView(ui.LayoutView):
         vc_time: int,
         vc_rank: int,
         reactions_given: int = 0,
-        reactions_received: int = 0
+        reactions_received: int = 0,
+        card: Optional[str] = None
     ) -> None:
         super().__init__(timeout=300)
 
@@ -57,12 +59,16 @@ class RankView(ui.LayoutView):
         container.add_item(header_section)
         container.add_item(ui.Separator())
 
-        container.add_item(ui.TextDisplay(
-            f"### 💬 テキストレベル\n"
-            f"**Lv.{level}** (#{text_rank if text_rank else 'N/A'})\n"
-            f"{xp} / {next_level_xp} XP\n"
-            f"`{text_bar}` {text_percentage}%"
-        ))
+        if card:
+            # ランクカード画像（テキストレベルはカードに表示）
+            container.add_item(ui.MediaGallery(discord.MediaGalleryItem(f"attachment://{card}")))
+        else:
+            container.add_item(ui.TextDisplay(
+                f"### 💬 テキストレベル\n"
+                f"**Lv.{level}** (#{text_rank if text_rank else 'N/A'})\n"
+                f"{xp} / {next_level_xp} XP\n"
+                f"`{text_bar}` {text_percentage}%"
+            ))
 
         container.add_item(ui.Separator())
 
@@ -112,6 +118,16 @@ class RankMixin:
             await interaction.response.send_message(view=view)
             return
 
+        # カード生成（アバター取得・描画）が応答期限を超えないよう先に応答
+        await interaction.response.defer()
+
+        card = await self.bot.rank_cards.render(
+            target,
+            level=user_data["level"],
+            xp=user_data["xp"],
+            rank=user_data.get("text_rank")
+        )
+
         view = RankView(
             target=target,
             level=user_data["level"],
@@ -121,7 +137,11 @@ class RankMixin:
             vc_time=user_data.get("vc_time", 0),
             vc_rank=user_data.get("vc_rank"),
             reactions_given=user_data.get("reactions_given", 0),
-            reactions_received=user_data.get("reactions_received", 0)
+            reactions_received=user_data.get("reactions_received", 0),
+            card="rank.png" if card else None
         )
 
-        await interaction.response.send_message(view=view)
+        if card:
+            await interaction.followup.send(view=view, file=discord.File(io.BytesIO(card), filename="rank.png"))
+        else:
+            await interaction.followup.send(view=view)
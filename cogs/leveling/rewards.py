@@ -0,0 +1,237 @@
+"""
+Leveling レベル報酬ロール
+"""
+from __future__ import annotations
+
+import asyncio
+
+import discord
+from discord import app_commands
+
+from utils.checks import Checks
+from utils.join_pipeline import RoleGrantQueue
+from utils.logging import get_logger
+from utils.outbound import Priority
+from views.common_views import CommonErrorView, CommonInfoView, CommonSuccessView, CommonWarningView
+
+logger = get_logger("sumire.cogs.leveling.rewards")
+
+# バックフィルで一度に読み込むユーザー数
+BACKFILL_CHUNK_SIZE = 500
+
+# 付与待ちがこの件数を超えたらバックフィルの読み込みを待つ
+BACKFILL_HIGH_WATER = 200
+
+# 設定できるレベルの上限
+MAX_REWARD_LEVEL = 1000
+
+
+class LevelRewardsMixin:
+    """レベル報酬ロール Mixin"""
+
+    level_role_grants: RoleGrantQueue
+    _level_role_syncs: dict[int, asyncio.Task]
+
+    def _reward_roles_for(
+        self,
+        guild: discord.Guild,
+        level_roles: list[dict],
+        level: int
+    ) -> list[discord.Role]:
+        """レベルに応じて付与すべきロール（到達済みの報酬すべて）"""
+        roles = []
+        for reward in level_roles:
+            if reward["level"] > level:
+                break
+            role = guild.get_role(reward["role_id"])
+            if role and role < guild.me.top_role:
+                roles.append(role)
+        return roles
+
+    async def _apply_level_roles(self, member: discord.Member, level: int) -> None:
+        """レベルアップ時に報酬ロールを付与"""
+        level_roles = await self.db.get_level_roles(member.guild.id)
+        if not level_roles:
+            return
+
+        missing = [
+            role for role in self._reward_roles_for(member.guild, level_roles, level)
+            if not member.get_role(role.id)
+        ]
+        if missing:
+            self.level_role_grants.submit(member, missing, f"レベル報酬: Lv.{level}")
+
+    async def _sync_level_roles(self, guild: discord.Guild) -> tuple[int, int, int]:
+        """
+        既存メンバーのレベル報酬ロールを同期
+
+        user_levels をキーセットページネーションでチャンクごとに読み、
+        メンバーのロールと比較して不足分のみ付与する。メンバーはチャンクごとに取得し、
+        サーバーの全メンバーを一度にメモリに載せない。
+
+        Returns:
+            tuple[int, int, int]: (確認した人数, 付与した人数, 見つからなかった人数)
+        """
+        level_roles = await self.db.get_level_roles(guild.id)
+        if not level_roles:
+            return 0, 0, 0
+
+        min_level = level_roles[0]["level"]
+        checked = granted = missing_members = 0
+        after_user_id = 0
+
+        while True:
+            rows = await self.db.get_user_levels_after(
+                guild.id, after_user_id, BACKFILL_CHUNK_SIZE, min_level
+            )
+            if not rows:
+                break
+            after_user_id = rows[-1]["user_id"]
+
+            # このチャンクのメンバーのみ取得（キャッシュにない分はゲートウェイに問い合わせる）
+            members = await self.bot.member_cache.get_members(guild, [row["user_id"] for row in rows])
+            for row in rows:
+                checked += 1
+                member = members.get(row["user_id"])
+                if member is None:
+                    missing_members += 1
+                    continue
+
+                missing = [
+                    role for role in self._reward_roles_for(guild, level_roles, row["level"])
+                    if not member.get_role(role.id)
+                ]
+                if missing:
+                    self.level_role_grants.submit(member, missing, f"レベル報酬の同期: Lv.{row['level']}")
+                    granted += 1
+
+            # 付与が追いつくまで次のチャンクを読まない
+            while self.level_role_grants.pending >= BACKFILL_HIGH_WATER:
+                await asyncio.sleep(1)
+
+        return checked, granted, missing_members
+
+    async def _run_level_role_sync(
+        self,
+        guild: discord.Guild,
+        channel: discord.abc.Messageable
+    ) -> None:
+        """同期を実行して結果を送信"""
+        try:
+            checked, granted, missing_members = await self._sync_level_roles(guild)
+        except Exception as e:
+            logger.error(f"レベル報酬ロール同期エラー: {guild.name} - {e}")
+            view = CommonErrorView(
+                title="レベル報酬ロールの同期に失敗しました",
+                description=f"エラー: {e}"
+            )
+        else:
+            logger.info(
+                f"レベル報酬ロール同期: {guild.name} (確認 {checked}人, 付与 {granted}人, 不在 {missing_members}人)"
+            )
+            view = CommonSuccessView(
+                title="レベル報酬ロールを同期しました",
+                description=(
+                    f"**確認:** {checked}人\n"
+                    f"**ロール付与:** {granted}人\n"
+                    f"-# サーバーにいないユーザー {missing_members}人 はスキップしました"
+                )
+            )
+        finally:
+            self._level_role_syncs.pop(guild.id, None)
+
+        self.bot.outbound.send(channel, view=view, priority=Priority.NORMAL)
+
+    # ==================== コマンド ====================
+
+    @app_commands.command(name="level_role", description="レベル到達時に付与するロールを設定します")
+    @app_commands.describe(level="付与するレベル", role="付与するロール")
+    @app_commands.default_permissions(administrator=True)
+    @Checks.is_admin()
+    async def level_role(
+        self,
+        interaction: discord.Interaction,
+        level: app_commands.Range[int, 1, MAX_REWARD_LEVEL],
+        role: discord.Role
+    ) -> None:
+        """レベル報酬ロールを設定するコマンド"""
+        if role.managed or role.is_default():
+            view = CommonErrorView(
+                title="このロールは設定できません",
+                description="@everyone や連携ロールは報酬に設定できません。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        if role >= interaction.guild.me.top_role:
+            view = CommonErrorView(
+                title="権限エラー",
+                description="Botより上位のロールは設定できません。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        await self.db.set_level_role(interaction.guild.id, level, role.id)
+
+        view = CommonSuccessView(
+            title="レベル報酬ロールを設定しました",
+            description=(
+                f"**Lv.{level}** に到達したメンバーに {role.mention} を付与します。\n"
+                "-# 既存メンバーに付与するには `/level_role_sync` を実行してください"
+            )
+        )
+        await interaction.response.send_message(view=view, ephemeral=True)
+        logger.info(f"レベル報酬ロール設定: Lv.{level} -> {role.name} in {interaction.guild.name}")
+
+    @app_commands.command(name="level_role_remove", description="レベル報酬ロールの設定を解除します")
+    @app_commands.describe(role="解除するロール")
+    @app_commands.default_permissions(administrator=True)
+    @Checks.is_admin()
+    async def level_role_remove(self, interaction: discord.Interaction, role: discord.Role) -> None:
+        """レベル報酬ロールを解除するコマンド"""
+        removed = await self.db.remove_level_role(interaction.guild.id, role.id)
+
+        if removed:
+            view = CommonSuccessView(
+                title="レベル報酬ロールを解除しました",
+                description=f"{role.mention} は今後レベル報酬として付与されません。"
+            )
+        else:
+            view = CommonWarningView(
+                title="設定されていません",
+                description=f"{role.mention} はレベル報酬に設定されていません。"
+            )
+        await interaction.response.send_message(view=view, ephemeral=True)
+
+    @app_commands.command(name="level_role_sync", description="既存メンバーにレベル報酬ロールを付与します")
+    @app_commands.default_permissions(administrator=True)
+    @Checks.is_admin()
+    async def level_role_sync(self, interaction: discord.Interaction) -> None:
+        """レベル報酬ロールを同期するコマンド"""
+        guild = interaction.guild
+
+        if guild.id in self._level_role_syncs:
+            view = CommonWarningView(
+                title="同期中です",
+                description="このサーバーのレベル報酬ロールは現在同期中です。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        if not await self.db.get_level_roles(guild.id):
+            view = CommonErrorView(
+                title="レベル報酬ロールがありません",
+                description="先に `/level_role` で報酬ロールを設定してください。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        self._level_role_syncs[guild.id] = asyncio.create_task(
+            self._run_level_role_sync(guild, interaction.channel)
+        )
+
+        view = CommonInfoView(
+            title="レベル報酬ロールの同期を開始しました",
+            description="完了したらこのチャンネルに結果を送信します。"
+        )
+        await interaction.response.send_message(view=view, ephemeral=True)
@@ -3,6 +3,8 @@ Leveling 設定コマンド
 """
 from __future__ import annotations
 
+from typing import Optional
+
 import discord
 from discord import app_commands, ui
 
@@ -10,10 +12,14 @@ from utils.config import Config
 from utils.database import Database
 from utils.checks import Checks
 from utils.logging import get_logger
-from views.common_views import CommonErrorView
+from views.common_views import CommonErrorView, CommonSuccessView, CommonWarningView
 
 logger = get_logger("sumire.cogs.leveling.settings")
 
+# XP倍率の範囲（0でXPなし）
+MIN_XP_MULTIPLIER = 0.0
+MAX_XP_MULTIPLIER = 5.0
+
 
 class LevelingSettingsView(ui.LayoutView):
     """レベルシステム設定パネル"""
@@ -22,7 +28,9 @@ class LevelingSettingsView(ui.LayoutView):
         self,
         guild: discord.Guild,
         enabled: bool = True,
-        ignored_channels: list[int] = None
+        ignored_channels: list[int] = None,
+        level_roles: list[dict] = None,
+        multipliers: list[dict] = None
     ) -> None:
         super().__init__(timeout=300)
         self.guild = guild
@@ -30,6 +38,8 @@ class LevelingSettingsView(ui.LayoutView):
         self.config = Config()
         self.enabled = enabled
         self.ignored_channels = ignored_channels or []
+        self.level_roles = level_roles or []
+        self.multipliers = multipliers or []
 
         self._build_ui()
 
@@ -52,6 +62,25 @@ class LevelingSettingsView(ui.LayoutView):
         else:
             container.add_item(ui.TextDisplay("**XP除外チャンネル:** なし"))
 
+        if self.level_roles:
+            roles_text = "\n".join([f"• Lv.{r['level']} → <@&{r['role_id']}>" for r in self.level_roles[:10]])
+            if len(self.level_roles) > 10:
+                roles_text += f"\n... 他 {len(self.level_roles) - 10} ロール"
+            container.add_item(ui.TextDisplay(f"**レベル報酬ロール:**\n{roles_text}"))
+        else:
+            container.add_item(ui.TextDisplay("**レベル報酬ロール:** なし\n-# `/level_role` で設定できます"))
+
+        if self.multipliers:
+            lines = []
+            for m in self.multipliers[:10]:
+                target = f"<#{m['target_id']}>" if m["target_type"] == "channel" else f"<@&{m['target_id']}>"
+                lines.append(f"• {target} ×{m['multiplier']:g}")
+            if len(self.multipliers) > 10:
+                lines.append(f"... 他 {len(self.multipliers) - 10} 件")
+            container.add_item(ui.TextDisplay("**XP倍率:**\n" + "\n".join(lines)))
+        else:
+            container.add_item(ui.TextDisplay("**XP倍率:** なし\n-# `/xp_multiplier` で設定できます"))
+
         container.add_item(ui.Separator())
 
         toggle_row = ui.ActionRow()
@@ -175,11 +204,65 @@ class SettingsMixin:
         settings = await self.db.get_leveling_settings(interaction.guild.id)
         enabled = bool(settings.get("enabled", 1)) if settings else True
         ignored_channels = settings.get("ignored_channels", []) if settings else []
+        level_roles = await self.db.get_level_roles(interaction.guild.id)
+        multipliers = await self.db.get_xp_multipliers(interaction.guild.id)
 
         view = LevelingSettingsView(
             guild=interaction.guild,
             enabled=enabled,
-            ignored_channels=ignored_channels
+            ignored_channels=ignored_channels,
+            level_roles=level_roles,
+            multipliers=multipliers
         )
 
         await interaction.response.send_message(view=view, ephemeral=True)
+
+    @app_commands.command(name="xp_multiplier", description="チャンネル・ロールごとのXP倍率を設定します")
+    @app_commands.describe(
+        multiplier="XP倍率（1で解除）",
+        channel="倍率を設定するチャンネル",
+        role="倍率を設定するロール（複数持っている場合は最も高い倍率）"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @Checks.is_admin()
+    async def xp_multiplier(
+        self,
+        interaction: discord.Interaction,
+        multiplier: app_commands.Range[float, MIN_XP_MULTIPLIER, MAX_XP_MULTIPLIER],
+        channel: Optional[discord.TextChannel] = None,
+        role: Optional[discord.Role] = None
+    ) -> None:
+        """XP倍率を設定するコマンド"""
+        if (channel is None) == (role is None):
+            view = CommonErrorView(
+                title="対象を1つ指定してください",
+                description="`channel` か `role` のどちらか一方を指定してください。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        guild_id = interaction.guild.id
+        target = channel or role
+
+        if multiplier == 1:
+            removed = await self.db.remove_xp_multiplier(guild_id, target.id)
+            if removed:
+                view = CommonSuccessView(
+                    title="XP倍率を解除しました",
+                    description=f"{target.mention} のXP倍率を解除しました。"
+                )
+            else:
+                view = CommonWarningView(
+                    title="設定されていません",
+                    description=f"{target.mention} にXP倍率は設定されていません。"
+                )
+        else:
+            target_type = "channel" if channel else "role"
+            await self.db.set_xp_multiplier(guild_id, target.id, target_type, multiplier)
+            view = CommonSuccessView(
+                title="XP倍率を設定しました",
+                description=f"{target.mention} のXP倍率を **×{multiplier:g}** に設定しました。"
+            )
+            logger.info(f"XP倍率設定: {target} x{multiplier} in {interaction.guild.name}")
+
+        await interaction.response.send_message(view=view, ephemeral=True)
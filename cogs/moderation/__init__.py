@@ -1,5 +1,5 @@
 """
-Moderation Cog - モデレーションコマンド
+Moderation Cog - モデレーションコマンド（単体・一括）
 """
 from __future__ import annotations
 
@@ -12,12 +12,14 @@ from discord.ext import commands
 from utils.config import Config
 from utils.database import Database
 from utils.logging import get_logger
+from utils.outbound import Priority
 from utils.checks import handle_app_command_error
 from views.moderation_views import LogModerationActionView, ModerationDMView
 
 from .ban import BanMixin
 from .kick import KickMixin
 from .timeout import TimeoutMixin
+from .bulk import BulkModerationMixin
 
 if TYPE_CHECKING:
     from bot import SumireBot
@@ -25,7 +27,7 @@ if TYPE_CHECKING:
 logger = get_logger("sumire.cogs.moderation")
 
 
-class Moderation(BanMixin, KickMixin, TimeoutMixin, commands.Cog):
+class Moderation(BanMixin, KickMixin, TimeoutMixin, BulkModerationMixin, commands.Cog):
     """モデレーション機能"""
 
     def __init__(self, bot: SumireBot) -> None:
@@ -85,21 +87,18 @@ class Moderation(BanMixin, KickMixin, TimeoutMixin, commands.Cog):
         if not channel:
             return
 
-        try:
-            view = LogModerationActionView(
-                action_type=action_type,
-                target_name=str(target),
-                target_mention=target.mention,
-                target_avatar=target.display_avatar.url,
-                target_id=target.id,
-                moderator_name=str(moderator),
-                moderator_mention=moderator.mention,
-                reason=reason,
-                duration=duration
-            )
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログチャンネルへの送信権限がありません: guild_id={guild_id}")
+        view = LogModerationActionView(
+            action_type=action_type,
+            target_name=str(target),
+            target_mention=target.mention,
+            target_avatar=target.display_avatar.url,
+            target_id=target.id,
+            moderator_name=str(moderator),
+            moderator_mention=moderator.mention,
+            reason=reason,
+            duration=duration
+        )
+        self.bot.outbound.send(channel, view=view, priority=Priority.MODERATION)
 
     def _can_moderate(
         self,
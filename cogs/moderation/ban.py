@@ -44,7 +44,8 @@ class BanMixin:
         reason = reason or "理由なし"
 
         # メンバーとして取得可能な場合はロール階層チェック
-        member = interaction.guild.get_member(user.id)
+        # （サーバーにいるユーザーはインタラクションで Member として解決されるため、キャッシュに依存しない）
+        member = user if isinstance(user, discord.Member) else interaction.guild.get_member(user.id)
         if member:
             can_moderate, error_msg = self._can_moderate(interaction.user, member, interaction.guild)
             if not can_moderate:
@@ -0,0 +1,338 @@
+"""
+一括モデレーションコマンド（bulk_ban / bulk_kick / bulk_timeout）
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+import discord
+from discord import app_commands
+
+from utils.bulk_actions import BulkExecutor
+from utils.checks import Checks
+from utils.logging import get_logger
+from utils.outbound import Priority
+from views.moderation_views import BulkModerationView
+from views.common_views import CommonErrorView
+
+from .timeout import TIMEOUT_DURATIONS
+
+logger = get_logger("sumire.cogs.moderation")
+
+# 1回の一括操作で扱える最大人数
+MAX_BULK_TARGETS = 1000
+
+# キック・タイムアウトの同時実行数（同じサーバーのバケットを共有するため控えめに）
+BULK_CONCURRENCY = 3
+
+# bulk_ban 1リクエストあたりの最大人数（Discord API の上限）
+BULK_BAN_CHUNK = 200
+
+# 進捗表示を更新する間隔（秒）
+PROGRESS_INTERVAL = 2.0
+
+# 参加時間フィルタの上限（分）
+MAX_JOINED_WITHIN = 10080
+
+USER_ID_PATTERN = re.compile(r"\d{15,20}")
+
+
+class BulkModerationMixin:
+    """一括モデレーションコマンド Mixin"""
+
+    async def _resolve_bulk_targets(
+        self,
+        guild: discord.Guild,
+        members: Optional[str],
+        role: Optional[discord.Role],
+        joined_within: Optional[int]
+    ) -> tuple[list[discord.Member], int]:
+        """
+        対象メンバーを解決
+
+        メンバー指定（メンション・ID）と、ロール・参加時間のフィルタに一致する
+        メンバーの和集合を返す。ロールと参加時間を両方指定した場合は両方に一致するメンバー。
+        キャッシュにないメンバーは API から取得し、フィルタ指定時は全メンバーを取得する。
+
+        Returns:
+            tuple[list[discord.Member], int]: (対象メンバー, 見つからなかった指定の数)
+        """
+        targets: dict[int, discord.Member] = {}
+        not_found = 0
+
+        if members:
+            user_ids = list(dict.fromkeys(int(m) for m in USER_ID_PATTERN.findall(members)))
+            found = await self.bot.member_cache.get_members(guild, user_ids)
+            for user_id in user_ids:
+                member = found.get(user_id)
+                if member:
+                    targets[member.id] = member
+                else:
+                    not_found += 1
+
+        if role or joined_within:
+            candidates = await self.bot.member_cache.members(guild)
+            if role:
+                candidates = [m for m in candidates if m.get_role(role.id)]
+            if joined_within:
+                since = datetime.now(timezone.utc) - timedelta(minutes=joined_within)
+                candidates = [m for m in candidates if m.joined_at and m.joined_at >= since]
+            for member in candidates:
+                targets[member.id] = member
+
+        return list(targets.values()), not_found
+
+    async def _start_bulk_action(
+        self,
+        interaction: discord.Interaction,
+        action_type: str,
+        members: Optional[str],
+        role: Optional[discord.Role],
+        joined_within: Optional[int],
+        reason: Optional[str],
+        duration: Optional[int] = None
+    ) -> None:
+        """対象を確認する画面を表示し、確定したら一括操作を実行"""
+        guild = interaction.guild
+        if not guild:
+            view = CommonErrorView(
+                title="エラー",
+                description="このコマンドはサーバー内でのみ使用できます。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        if not members and not role and not joined_within:
+            view = CommonErrorView(
+                title="対象が指定されていません",
+                description="`members`・`role`・`joined_within` のいずれかを指定してください。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        reason = reason or "理由なし"
+
+        # キャッシュにないメンバーの取得・チャンクは3秒を超えることがあるため先に応答を保留
+        if not guild.chunked:
+            await interaction.response.defer(thinking=True)
+
+        async def respond(view: discord.ui.LayoutView, ephemeral: bool = False) -> None:
+            if interaction.response.is_done():
+                # 保留中の応答（公開）への最初のフォローアップは ephemeral が無視されるため、
+                # エラーは保留中の応答を削除してから本人のみに送る
+                if ephemeral:
+                    try:
+                        await interaction.delete_original_response()
+                    except discord.HTTPException:
+                        pass
+                await interaction.followup.send(view=view, ephemeral=ephemeral)
+            else:
+                await interaction.response.send_message(view=view, ephemeral=ephemeral)
+
+        candidates, not_found = await self._resolve_bulk_targets(guild, members, role, joined_within)
+
+        # ロール階層チェック
+        targets = [
+            m for m in candidates
+            if m.id != guild.me.id and self._can_moderate(interaction.user, m, guild)[0]
+        ]
+        skipped = len(candidates) - len(targets) + not_found
+
+        if not targets:
+            view = CommonErrorView(
+                title="対象がいません",
+                description="条件に一致する操作可能なメンバーが見つかりませんでした。"
+            )
+            await respond(view, ephemeral=True)
+            return
+
+        if len(targets) > MAX_BULK_TARGETS:
+            view = CommonErrorView(
+                title="対象が多すぎます",
+                description=f"一度に操作できるのは **{MAX_BULK_TARGETS}人** までです（対象: {len(targets)}人）。"
+            )
+            await respond(view, ephemeral=True)
+            return
+
+        duration_text = self._format_duration(duration) if duration else None
+
+        async def on_confirm(confirm_interaction: discord.Interaction) -> None:
+            await self._run_bulk_action(confirm_interaction, view, duration)
+
+        view = BulkModerationView(
+            action_type=action_type,
+            targets=targets,
+            reason=reason,
+            moderator_id=interaction.user.id,
+            duration=duration_text,
+            skipped=skipped,
+            on_confirm=on_confirm
+        )
+        await respond(view)
+
+    async def _run_bulk_action(
+        self,
+        interaction: discord.Interaction,
+        view: BulkModerationView,
+        duration: Optional[int]
+    ) -> None:
+        """一括操作を実行し、進捗を1つのメッセージで更新"""
+        guild = interaction.guild
+        moderator = interaction.user
+        audit_reason = f"{view.reason} (bulk by {moderator})"
+        executor: BulkExecutor = BulkExecutor(BULK_CONCURRENCY)
+
+        def on_error(target, error: Exception) -> None:
+            members = target if isinstance(target, list) else [target]
+            for member in members:
+                view.failures.append(f"{member.mention}: {error}")
+
+        action, items = self._bulk_action_for(view, guild, audit_reason, duration, executor)
+
+        async def report_progress() -> None:
+            while True:
+                await asyncio.sleep(PROGRESS_INTERVAL)
+                view.refresh()
+                try:
+                    await interaction.edit_original_response(view=view)
+                except discord.HTTPException:
+                    pass
+
+        reporter = asyncio.create_task(report_progress())
+        try:
+            await executor.run(items, action, on_error)
+        finally:
+            reporter.cancel()
+
+        view.state = "done"
+        view.refresh()
+        try:
+            await interaction.edit_original_response(view=view)
+        except discord.HTTPException:
+            # 15分以上かかった場合はインタラクションが失効するため新しく送信
+            self.bot.outbound.send(interaction.channel, view=view, priority=Priority.MODERATION)
+
+        logger.info(
+            f"BULK {view.action_type.upper()}: {view.succeeded}/{len(view.targets)} by {moderator} "
+            f"in {guild.name} (failed={len(view.failures)}, rate_limited={executor.rate_limited})"
+        )
+
+        # ログには結果のみ送信（1人ずつは送らない）
+        channel = await self._get_log_channel(guild.id)
+        if channel:
+            self.bot.outbound.send(channel, view=view, priority=Priority.MODERATION)
+
+    def _bulk_action_for(
+        self,
+        view: BulkModerationView,
+        guild: discord.Guild,
+        audit_reason: str,
+        duration: Optional[int],
+        executor: BulkExecutor
+    ) -> tuple[Callable[..., Awaitable[None]], list]:
+        """操作の種類に応じた1件分の処理と対象リストを返す"""
+        if view.action_type == "ban" and guild.me.guild_permissions.manage_guild:
+            # bulk_ban で最大200人ずつまとめてBAN
+            executor.concurrency = 1
+            chunks = [
+                view.targets[i:i + BULK_BAN_CHUNK]
+                for i in range(0, len(view.targets), BULK_BAN_CHUNK)
+            ]
+
+            async def ban_chunk(chunk: list[discord.Member]) -> None:
+                result = await guild.bulk_ban(chunk, reason=audit_reason, delete_message_seconds=0)
+                view.succeeded += len(result.banned)
+                for user in result.failed:
+                    view.failures.append(f"<@{user.id}>: BANできませんでした")
+
+            return ban_chunk, chunks
+
+        if view.action_type == "ban":
+            async def ban(member: discord.Member) -> None:
+                await guild.ban(member, reason=audit_reason, delete_message_seconds=0)
+                view.succeeded += 1
+
+            return ban, view.targets
+
+        if view.action_type == "kick":
+            async def kick(member: discord.Member) -> None:
+                await member.kick(reason=audit_reason)
+                view.succeeded += 1
+
+            return kick, view.targets
+
+        async def timeout(member: discord.Member) -> None:
+            await member.timeout(timedelta(minutes=duration), reason=audit_reason)
+            view.succeeded += 1
+
+        return timeout, view.targets
+
+    # ==================== コマンド ====================
+
+    @app_commands.command(name="bulk_ban", description="複数のメンバーをまとめてBANします")
+    @app_commands.describe(
+        members="BANするメンバー（メンションまたはIDをスペース区切り）",
+        role="このロールを持つメンバーを対象にする",
+        joined_within="この時間（分）以内に参加したメンバーを対象にする",
+        reason="BANの理由"
+    )
+    @app_commands.default_permissions(ban_members=True)
+    @Checks.has_permissions(ban_members=True)
+    async def bulk_ban(
+        self,
+        interaction: discord.Interaction,
+        members: Optional[str] = None,
+        role: Optional[discord.Role] = None,
+        joined_within: Optional[app_commands.Range[int, 1, MAX_JOINED_WITHIN]] = None,
+        reason: Optional[str] = None
+    ) -> None:
+        """複数のメンバーをBANするコマンド"""
+        await self._start_bulk_action(interaction, "ban", members, role, joined_within, reason)
+
+    @app_commands.command(name="bulk_kick", description="複数のメンバーをまとめてキックします")
+    @app_commands.describe(
+        members="キックするメンバー（メンションまたはIDをスペース区切り）",
+        role="このロールを持つメンバーを対象にする",
+        joined_within="この時間（分）以内に参加したメンバーを対象にする",
+        reason="キックの理由"
+    )
+    @app_commands.default_permissions(kick_members=True)
+    @Checks.has_permissions(kick_members=True)
+    async def bulk_kick(
+        self,
+        interaction: discord.Interaction,
+        members: Optional[str] = None,
+        role: Optional[discord.Role] = None,
+        joined_within: Optional[app_commands.Range[int, 1, MAX_JOINED_WITHIN]] = None,
+        reason: Optional[str] = None
+    ) -> None:
+        """複数のメンバーをキックするコマンド"""
+        await self._start_bulk_action(interaction, "kick", members, role, joined_within, reason)
+
+    @app_commands.command(name="bulk_timeout", description="複数のメンバーをまとめてタイムアウトします")
+    @app_commands.describe(
+        duration="タイムアウトの期間",
+        members="タイムアウトするメンバー（メンションまたはIDをスペース区切り）",
+        role="このロールを持つメンバーを対象にする",
+        joined_within="この時間（分）以内に参加したメンバーを対象にする",
+        reason="タイムアウトの理由"
+    )
+    @app_commands.choices(duration=TIMEOUT_DURATIONS)
+    @app_commands.default_permissions(moderate_members=True)
+    @Checks.has_permissions(moderate_members=True)
+    async def bulk_timeout(
+        self,
+        interaction: discord.Interaction,
+        duration: int,
+        members: Optional[str] = None,
+        role: Optional[discord.Role] = None,
+        joined_within: Optional[app_commands.Range[int, 1, MAX_JOINED_WITHIN]] = None,
+        reason: Optional[str] = None
+    ) -> None:
+        """複数のメンバーをタイムアウトするコマンド"""
+        await self._start_bulk_action(
+            interaction, "timeout", members, role, joined_within, reason, duration
+        )
@@ -4,7 +4,8 @@ Music Cog - 音楽プレイヤー
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Optional, cast
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Optional, cast
 
 import discord
 import wavelink
@@ -14,6 +15,8 @@ from discord.ext import commands
 from utils.config import Config
 from utils.database import Database
 from utils.logging import get_logger
+from utils.outbound import Priority
+from utils.metrics import Sample, registry
 from utils.checks import handle_app_command_error
 from views.music_views import MusicInfoView
 from views.common_views import CommonErrorView
@@ -23,6 +26,9 @@ from .skip import SkipMixin
 from .leave import LeaveMixin
 from .loop import LoopMixin
 from .events import EventsMixin
+from .lazy_queue import LazyQueueMixin, TrackStub
+from .persistence import PersistenceMixin
+from .panel import NowPlayingPanelMixin
 
 if TYPE_CHECKING:
     from bot import SumireBot
@@ -30,7 +36,17 @@ if TYPE_CHECKING:
 logger = get_logger("sumire.cogs.music")
 
 
-class Music(PlayMixin, SkipMixin, LeaveMixin, LoopMixin, EventsMixin, commands.Cog):
+class Music(
+    PlayMixin,
+    SkipMixin,
+    LeaveMixin,
+    LoopMixin,
+    EventsMixin,
+    LazyQueueMixin,
+    PersistenceMixin,
+    NowPlayingPanelMixin,
+    commands.Cog
+):
     """音楽プレイヤー"""
 
     def __init__(self, bot: SumireBot) -> None:
@@ -39,24 +55,85 @@ class Music(PlayMixin, SkipMixin, LeaveMixin, LoopMixin, EventsMixin, commands.C
         self.db = Database()
         self.loop_mode: dict[int, str] = {}
         self._auto_leave_tasks: dict[int, asyncio.Task] = {}
+        self._pending_tracks: dict[int, deque[TrackStub]] = {}
+        self._sessions_restored = False
+        self._last_snapshots: dict[int, tuple] = {}
+        self._panels: dict[int, discord.Message] = {}
+        self._panel_tasks: dict[int, asyncio.Task] = {}
+        self._panel_notices: dict[int, str] = {}
+        self._panel_messages_after: dict[int, int] = {}
+        self._lavalink_task: Optional[asyncio.Task] = None
 
     async def cog_load(self) -> None:
-        """Cog読み込み時にLavalinkに接続"""
-        node = wavelink.Node(
-            uri=self.config.lavalink_uri,
-            password=self.config.lavalink_password,
-        )
-        await wavelink.Pool.connect(nodes=[node], client=self.bot, cache_capacity=100)
-        logger.info(f"Lavalink に接続しました: {self.config.lavalink_uri}")
+        """Cog読み込み時にLavalinkへの接続を開始（起動を待たせないようバックグラウンドで接続）"""
+        self._lavalink_task = asyncio.create_task(self._connect_lavalink())
+
+        # セッションスナップショットタスクを開始
+        self.snapshot_sessions.change_interval(seconds=self.config.music_snapshot_interval)
+        self.snapshot_sessions.start()
+
+        registry.add_collector("music", self._collect_metrics)
 
     async def cog_unload(self) -> None:
         """Cog アンロード時にクリーンアップ"""
+        registry.remove_collector("music")
+
+        # 終了前に最新のセッションを保存
+        self.snapshot_sessions.cancel()
+        if self._sessions_restored:
+            try:
+                await self._flush_sessions()
+            except Exception as e:
+                logger.error(f"セッション保存エラー: {e}")
+
+        if self._lavalink_task and not self._lavalink_task.done():
+            self._lavalink_task.cancel()
+
         for task in self._auto_leave_tasks.values():
             task.cancel()
         self._auto_leave_tasks.clear()
+        self._pending_tracks.clear()
+        for task in self._panel_tasks.values():
+            task.cancel()
+        self._panel_tasks.clear()
 
     # ==================== ヘルパーメソッド ====================
 
+    async def _connect_lavalink(self) -> None:
+        """Lavalinkに接続（接続済みのノードがある場合は何もしない）"""
+        if self._lavalink_ready():
+            return
+
+        node = wavelink.Node(
+            uri=self.config.lavalink_uri,
+            password=self.config.lavalink_password,
+        )
+        try:
+            await wavelink.Pool.connect(nodes=[node], client=self.bot, cache_capacity=100)
+            logger.info(f"Lavalink に接続しました: {self.config.lavalink_uri}")
+        except Exception as e:
+            logger.error(f"Lavalink 接続エラー: {e}")
+
+    @staticmethod
+    def _lavalink_ready() -> bool:
+        """接続済みのLavalinkノードがあるか"""
+        return any(
+            node.status == wavelink.NodeStatus.CONNECTED
+            for node in wavelink.Pool.nodes.values()
+        )
+
+    def _collect_metrics(self) -> Iterable[Sample]:
+        """Lavalinkのプレイヤー数をメトリクスとして読み出す"""
+        players = [vc for vc in self.bot.voice_clients if isinstance(vc, wavelink.Player)]
+        states = {
+            "playing": sum(1 for p in players if p.playing and not p.paused),
+            "paused": sum(1 for p in players if p.paused),
+            "idle": sum(1 for p in players if not p.playing),
+        }
+        for state, count in states.items():
+            yield "sumire_lavalink_players", "gauge", "Lavalinkのプレイヤー数", {"state": state}, count
+        yield "sumire_lavalink_connected", "gauge", "接続済みのLavalinkノードがあるか", {}, int(self._lavalink_ready())
+
     def _start_auto_leave_timer(self, guild_id: int, player: wavelink.Player) -> None:
         """自動退出タイマーを開始"""
         if guild_id in self._auto_leave_tasks:
@@ -70,14 +147,11 @@ class Music(PlayMixin, SkipMixin, LeaveMixin, LoopMixin, EventsMixin, commands.C
                     logger.info(f"自動退出: guild_id={guild_id}")
 
                     if player.channel:
-                        try:
-                            view = MusicInfoView(
-                                title="自動退出",
-                                description="3分間何も再生されなかったため、ボイスチャンネルから退出しました。"
-                            )
-                            await player.channel.send(view=view)
-                        except discord.Forbidden:
-                            pass
+                        view = MusicInfoView(
+                            title="自動退出",
+                            description="3分間何も再生されなかったため、ボイスチャンネルから退出しました。"
+                        )
+                        self.bot.outbound.send(player.channel, view=view, priority=Priority.LOW)
             except asyncio.CancelledError:
                 pass
             finally:
@@ -154,6 +228,14 @@ class Music(PlayMixin, SkipMixin, LeaveMixin, LoopMixin, EventsMixin, commands.C
             await interaction.response.send_message(view=view, ephemeral=True)
             return None
 
+        if not self._lavalink_ready():
+            view = CommonErrorView(
+                title="音楽サーバーに接続中です",
+                description="音楽サーバー（Lavalink）にまだ接続できていません。\nしばらく待ってから再度お試しください。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return None
+
         player = cast(wavelink.Player, interaction.guild.voice_client)
 
         if not player:
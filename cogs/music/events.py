@@ -11,12 +11,6 @@ import wavelink
 from discord.ext import commands
 
 from utils.logging import get_logger
-from views.music_views import (
-    NowPlayingView,
-    MusicErrorView,
-    MusicWarningView,
-    MusicInfoView,
-)
 
 logger = get_logger("sumire.cogs.music.events")
 
@@ -29,6 +23,10 @@ class EventsMixin:
         """Wavelink ノード準備完了"""
         logger.info(f"Wavelink ノード準備完了: {payload.node.identifier}")
 
+        # 再起動前のセッションを復元
+        await self.bot.wait_until_ready()
+        await self._restore_sessions()
+
     @commands.Cog.listener()
     async def on_voice_state_update(
         self,
@@ -51,10 +49,14 @@ class EventsMixin:
                 self._auto_leave_tasks[guild_id].cancel()
                 del self._auto_leave_tasks[guild_id]
 
+            self._clear_panel(guild_id)
+
             player = cast(wavelink.Player, member.guild.voice_client)
             if player:
-                player.queue.clear()
+                self._clear_queue(player)
                 logger.info(f"キューをクリア: guild_id={guild_id}")
+            else:
+                self._pending_tracks.pop(guild_id, None)
 
     @commands.Cog.listener()
     async def on_wavelink_track_start(self, payload: wavelink.TrackStartEventPayload) -> None:
@@ -73,25 +75,11 @@ class EventsMixin:
             self._auto_leave_tasks[guild_id].cancel()
             del self._auto_leave_tasks[guild_id]
 
-        track = payload.track
-        playback_source = self._get_playback_source(track)
-        loop = self.loop_mode.get(guild_id, "off")
-
-        view = NowPlayingView(
-            title=track.title,
-            author=track.author,
-            duration=self._format_duration(track.length),
-            source=playback_source,
-            queue_count=len(player.queue) if player.queue else 0,
-            loop_mode=loop if loop != "off" else None,
-            thumbnail_url=getattr(track, 'artwork', None)
-        )
+        # 待機スタブから先読み分を補充
+        self._refill_queue(player)
 
-        if player.channel:
-            try:
-                await player.channel.send(view=view)
-            except discord.Forbidden:
-                pass
+        # Now Playing パネルを更新（連続スキップ時はまとめて1回だけ編集）
+        self._schedule_panel_update(player)
 
     @commands.Cog.listener()
     async def on_wavelink_track_end(self, payload: wavelink.TrackEndEventPayload) -> None:
@@ -114,11 +102,11 @@ class EventsMixin:
             await player.play(payload.track)
             return
         elif loop == "queue" and payload.track:
-            player.queue.put(payload.track)
+            self._enqueue_track(player, payload.track)
 
-        if not player.queue.is_empty:
+        if self._has_next(player):
             try:
-                next_track = player.queue.get()
+                next_track = self._next_track(player)
                 await player.play(next_track)
             except Exception as e:
                 logger.error(f"次のトラック再生エラー: {e}")
@@ -147,50 +135,34 @@ class EventsMixin:
         exception_msg = str(payload.exception) if payload.exception else "不明なエラー"
         logger.error(f"トラック再生エラー: {track.title if track else 'Unknown'} - {exception_msg}")
 
-        if player.channel:
-            try:
-                track_name = track.title if track else "曲"
-
-                if "No playable" in exception_msg or "not found" in exception_msg.lower():
-                    view = MusicErrorView(
-                        title="再生ソースが見つかりません",
-                        description=(
-                            f"**{track_name}** の再生ソースが見つかりませんでした。\n\n"
-                            "Spotifyのメタデータは取得できましたが、"
-                            "SoundCloudに同じ曲が存在しないか、利用できません。"
-                        ),
-                        hint="曲名やアーティスト名で直接検索してみてください。"
-                    )
-                elif "age restricted" in exception_msg.lower():
-                    view = MusicErrorView(
-                        title="年齢制限",
-                        description=f"**{track_name}** は年齢制限があるため再生できません。"
-                    )
-                elif "region" in exception_msg.lower() or "country" in exception_msg.lower():
-                    view = MusicErrorView(
-                        title="地域制限",
-                        description=f"**{track_name}** はこの地域では利用できません。"
-                    )
-                else:
-                    view = MusicErrorView(
-                        title="再生エラー",
-                        description=f"**{track_name}** の再生中にエラーが発生しました。\n\n`{exception_msg[:150]}`"
-                    )
-
-                await player.channel.send(view=view)
-
-                if not player.queue.is_empty:
-                    info_view = MusicInfoView(
-                        title="自動スキップ",
-                        description="次の曲を自動的に再生します..."
-                    )
-                    await player.channel.send(view=info_view)
-            except discord.Forbidden:
-                pass
-
-        if not player.queue.is_empty:
+        track_name = track.title if track else "曲"
+
+        if "No playable" in exception_msg or "not found" in exception_msg.lower():
+            notice = (
+                "❌ **再生ソースが見つかりません**\n"
+                f"**{track_name}** の再生ソースが見つかりませんでした。"
+                "SoundCloudに同じ曲が存在しないか、利用できません。\n"
+                "-# 💡 曲名やアーティスト名で直接検索してみてください。"
+            )
+        elif "age restricted" in exception_msg.lower():
+            notice = f"❌ **年齢制限**\n**{track_name}** は年齢制限があるため再生できません。"
+        elif "region" in exception_msg.lower() or "country" in exception_msg.lower():
+            notice = f"❌ **地域制限**\n**{track_name}** はこの地域では利用できません。"
+        else:
+            notice = (
+                "❌ **再生エラー**\n"
+                f"**{track_name}** の再生中にエラーが発生しました。\n`{exception_msg[:150]}`"
+            )
+
+        if self._has_next(player):
+            notice += "\n-# 次の曲を自動的に再生します..."
+
+        # 新規メッセージではなく Now Playing パネルに表示
+        self._schedule_panel_update(player, notice)
+
+        if self._has_next(player):
             try:
-                next_track = player.queue.get()
+                next_track = self._next_track(player)
                 await player.play(next_track)
             except Exception as e:
                 logger.error(f"次のトラック再生エラー: {e}")
@@ -205,26 +177,19 @@ class EventsMixin:
         track = payload.track
         logger.warning(f"トラックがスタック: {track.title if track else 'Unknown'} - threshold={payload.threshold}ms")
 
-        if player.channel:
-            try:
-                track_name = track.title if track else "曲"
-                footer = "次の曲を自動的に再生します..." if not player.queue.is_empty else None
-
-                view = MusicWarningView(
-                    title="再生が停止しました",
-                    description=(
-                        f"**{track_name}** の再生が停止しました。\n"
-                        "ストリーミングソースからの応答がありません。"
-                    ),
-                    footer=footer
-                )
-                await player.channel.send(view=view)
-            except discord.Forbidden:
-                pass
-
-        if not player.queue.is_empty:
+        track_name = track.title if track else "曲"
+        notice = (
+            "⚠️ **再生が停止しました**\n"
+            f"**{track_name}** の再生が停止しました。ストリーミングソースからの応答がありません。"
+        )
+        if self._has_next(player):
+            notice += "\n-# 次の曲を自動的に再生します..."
+
+        self._schedule_panel_update(player, notice)
+
+        if self._has_next(player):
             try:
-                next_track = player.queue.get()
+                next_track = self._next_track(player)
                 await player.play(next_track)
             except Exception as e:
                 logger.error(f"スタック後の再生エラー: {e}")
@@ -0,0 +1,199 @@
+"""
+プレイリストの遅延キュー
+
+大きなプレイリストは完全な Playable をすべて保持せず、軽量なスタブとして
+ギルドごとの待機列に積み、再生位置の数曲先までだけ Playable に解決して
+player.queue に補充する。
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Optional
+
+import wavelink
+
+from utils.logging import get_logger
+
+logger = get_logger("sumire.cogs.music.lazy_queue")
+
+# player.queue に先読みしておく解決済みトラック数
+PREFETCH_AHEAD = 3
+
+# ギルドごとの待機スタブ上限（メモリ上限）
+MAX_PENDING_TRACKS = 2000
+
+
+class TrackStub:
+    """再生前のトラックを表す軽量スタブ"""
+
+    __slots__ = (
+        "encoded", "identifier", "title", "author", "length",
+        "uri", "artwork", "source", "is_seekable", "is_stream",
+    )
+
+    def __init__(
+        self,
+        encoded: str,
+        identifier: str,
+        title: str,
+        author: str,
+        length: int,
+        uri: Optional[str],
+        artwork: Optional[str],
+        source: str,
+        is_seekable: bool,
+        is_stream: bool,
+    ) -> None:
+        self.encoded = encoded
+        self.identifier = identifier
+        self.title = title
+        self.author = author
+        self.length = length
+        self.uri = uri
+        self.artwork = artwork
+        self.source = source
+        self.is_seekable = is_seekable
+        self.is_stream = is_stream
+
+    @classmethod
+    def from_playable(cls, track: wavelink.Playable) -> TrackStub:
+        """Playable からスタブを作成"""
+        return cls(
+            encoded=track.encoded,
+            identifier=track.identifier,
+            title=track.title,
+            author=track.author,
+            length=track.length,
+            uri=track.uri,
+            artwork=getattr(track, "artwork", None),
+            source=track.source,
+            is_seekable=track.is_seekable,
+            is_stream=track.is_stream,
+        )
+
+    def resolve(self) -> wavelink.Playable:
+        """スタブを再生可能な Playable に解決"""
+        return wavelink.Playable({
+            "encoded": self.encoded,
+            "info": {
+                "identifier": self.identifier,
+                "isSeekable": self.is_seekable,
+                "author": self.author,
+                "length": self.length,
+                "isStream": self.is_stream,
+                "position": 0,
+                "title": self.title,
+                "uri": self.uri,
+                "artworkUrl": self.artwork,
+                "isrc": None,
+                "sourceName": self.source,
+            },
+            "pluginInfo": {},
+            "userData": {},
+        })
+
+
+class PlaylistStubs:
+    """プレイリストのスタブ列（総時間は必要になった時に計算）"""
+
+    def __init__(self, stubs: list[TrackStub], truncated: int = 0) -> None:
+        self.stubs = stubs
+        self.truncated = truncated
+        self._total_length: Optional[int] = None
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[wavelink.Playable], limit: int) -> PlaylistStubs:
+        """トラック列からスタブ列を作成（上限を超えた分は切り捨て）"""
+        stubs: list[TrackStub] = []
+        truncated = 0
+        for track in tracks:
+            if len(stubs) >= limit:
+                truncated += 1
+                continue
+            stubs.append(TrackStub.from_playable(track))
+        return cls(stubs, truncated)
+
+    def __len__(self) -> int:
+        return len(self.stubs)
+
+    @property
+    def total_length(self) -> int:
+        """総再生時間（ミリ秒）"""
+        if self._total_length is None:
+            self._total_length = sum(s.length for s in self.stubs)
+        return self._total_length
+
+
+class LazyQueueMixin:
+    """遅延キュー管理 Mixin"""
+
+    _pending_tracks: dict[int, deque[TrackStub]]
+
+    def _pending_count(self, guild_id: int) -> int:
+        """待機中のスタブ数"""
+        pending = self._pending_tracks.get(guild_id)
+        return len(pending) if pending else 0
+
+    def _queue_length(self, player: wavelink.Player) -> int:
+        """解決済みキューと待機スタブを合わせたキュー長"""
+        return len(player.queue) + self._pending_count(player.guild.id)
+
+    def _has_next(self, player: wavelink.Player) -> bool:
+        """次に再生できるトラックがあるか"""
+        return not player.queue.is_empty or self._pending_count(player.guild.id) > 0
+
+    def _pending_capacity(self, guild_id: int) -> int:
+        """待機列に追加できる残り件数"""
+        return max(0, MAX_PENDING_TRACKS - self._pending_count(guild_id))
+
+    def _enqueue_stubs(self, player: wavelink.Player, stubs: Iterable[TrackStub]) -> int:
+        """スタブを待機列に追加して先読み分を補充"""
+        guild_id = player.guild.id
+        pending = self._pending_tracks.setdefault(guild_id, deque())
+        added = 0
+        for stub in stubs:
+            if len(pending) >= MAX_PENDING_TRACKS:
+                break
+            pending.append(stub)
+            added += 1
+        self._refill_queue(player)
+        return added
+
+    def _enqueue_track(self, player: wavelink.Player, track: wavelink.Playable) -> None:
+        """トラックをキュー末尾に追加（待機スタブがあればその後ろへ）"""
+        pending = self._pending_tracks.get(player.guild.id)
+        if pending:
+            pending.append(TrackStub.from_playable(track))
+        else:
+            player.queue.put(track)
+
+    def _refill_queue(self, player: wavelink.Player) -> None:
+        """待機スタブを解決して player.queue を先読み数まで補充"""
+        guild_id = player.guild.id
+        pending = self._pending_tracks.get(guild_id)
+        if not pending:
+            return
+
+        while pending and len(player.queue) < PREFETCH_AHEAD:
+            stub = pending.popleft()
+            try:
+                player.queue.put(stub.resolve())
+            except Exception as e:
+                logger.warning(f"トラック解決エラー: {stub.title} - {e}")
+
+        if not pending:
+            del self._pending_tracks[guild_id]
+
+    def _next_track(self, player: wavelink.Player) -> Optional[wavelink.Playable]:
+        """次のトラックを取り出す（必要なら補充してから）"""
+        self._refill_queue(player)
+        if player.queue.is_empty:
+            return None
+        track = player.queue.get()
+        self._refill_queue(player)
+        return track
+
+    def _clear_queue(self, player: wavelink.Player) -> None:
+        """解決済みキューと待機スタブを両方クリア"""
+        player.queue.clear()
+        self._pending_tracks.pop(player.guild.id, None)
@@ -34,7 +34,7 @@ class LeaveMixin:
             return
 
         # キューをクリアして停止
-        player.queue.clear()
+        self._clear_queue(player)
         await player.stop()
 
         # ループモードをリセット
@@ -0,0 +1,153 @@
+"""
+Now Playing パネル
+
+ギルドごとに1つの Now Playing メッセージを保持して編集で更新する。
+短時間に曲が切り替わった場合（連続スキップなど）は編集をまとめ、
+パネルが埋もれた・削除された場合のみ再投稿する。
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+import discord
+import wavelink
+from discord import ui
+from discord.ext import commands
+
+from utils.logging import get_logger
+from utils.outbound import Priority
+from views.music_views import NowPlayingView, MusicInfoView
+
+logger = get_logger("sumire.cogs.music.panel")
+
+# 編集をまとめる待機時間（秒）
+PANEL_EDIT_DELAY = 1.5
+
+# パネルの後にこの件数以上メッセージが投稿されたら再投稿する
+PANEL_REPOST_AFTER = 15
+
+
+class NowPlayingPanelMixin:
+    """Now Playing パネル管理 Mixin"""
+
+    _panels: dict[int, discord.Message]
+    _panel_tasks: dict[int, asyncio.Task]
+    _panel_notices: dict[int, str]
+    _panel_messages_after: dict[int, int]
+
+    def _schedule_panel_update(self, player: wavelink.Player, notice: Optional[str] = None) -> None:
+        """パネル更新を予約（待機中の更新があればそれにまとめる）"""
+        guild_id = player.guild.id
+        if notice:
+            self._panel_notices[guild_id] = notice
+
+        task = self._panel_tasks.get(guild_id)
+        if task and not task.done():
+            return
+
+        self._panel_tasks[guild_id] = asyncio.create_task(self._run_panel_update(guild_id, player))
+
+    async def _run_panel_update(self, guild_id: int, player: wavelink.Player) -> None:
+        """待機後に最新の状態でパネルを更新"""
+        try:
+            await asyncio.sleep(PANEL_EDIT_DELAY)
+            await self._update_panel(player)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Now Playing パネル更新エラー: {e}")
+        finally:
+            # キャンセル後に予約された新しい更新タスクは残す
+            if self._panel_tasks.get(guild_id) is asyncio.current_task():
+                del self._panel_tasks[guild_id]
+
+    def _build_panel_view(self, player: wavelink.Player) -> ui.LayoutView:
+        """プレイヤーの現在の状態からパネルを作成"""
+        guild_id = player.guild.id
+        notice = self._panel_notices.pop(guild_id, None)
+        track = player.current
+
+        if not track:
+            return MusicInfoView(
+                title="再生待ち",
+                description=notice or "キューに曲がありません。"
+            )
+
+        loop = self.loop_mode.get(guild_id, "off")
+        return NowPlayingView(
+            title=track.title,
+            author=track.author,
+            duration=self._format_duration(track.length),
+            source=self._get_playback_source(track),
+            queue_count=self._queue_length(player),
+            loop_mode=loop if loop != "off" else None,
+            thumbnail_url=getattr(track, 'artwork', None),
+            notice=notice
+        )
+
+    async def _update_panel(self, player: wavelink.Player) -> None:
+        """パネルを編集、必要な場合のみ再投稿"""
+        if not player.guild or not player.channel:
+            return
+
+        guild_id = player.guild.id
+        view = self._build_panel_view(player)
+        message = self._panels.get(guild_id)
+
+        if message and self._panel_messages_after.get(guild_id, 0) < PANEL_REPOST_AFTER:
+            try:
+                await message.edit(view=view)
+                return
+            except discord.NotFound:
+                self._panels.pop(guild_id, None)
+                message = None
+            except discord.HTTPException as e:
+                logger.warning(f"Now Playing パネル編集失敗: {e}")
+
+        # 埋もれたパネルは削除して再投稿
+        if message:
+            try:
+                await message.delete()
+            except discord.HTTPException:
+                pass
+
+        message = await self.bot.outbound.send(
+            player.channel,
+            view=view,
+            priority=Priority.LOW,
+            coalesce_key=f"music_panel:{guild_id}"
+        )
+        if message:
+            self._panels[guild_id] = message
+            self._panel_messages_after[guild_id] = 0
+        else:
+            self._panels.pop(guild_id, None)
+
+    def _clear_panel(self, guild_id: int) -> None:
+        """パネルの状態を破棄"""
+        task = self._panel_tasks.pop(guild_id, None)
+        if task:
+            task.cancel()
+        self._panels.pop(guild_id, None)
+        self._panel_notices.pop(guild_id, None)
+        self._panel_messages_after.pop(guild_id, None)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        """パネルより後に投稿されたメッセージ数を数える"""
+        if not message.guild:
+            return
+        panel = self._panels.get(message.guild.id)
+        if panel and panel.channel.id == message.channel.id and panel.id != message.id:
+            guild_id = message.guild.id
+            self._panel_messages_after[guild_id] = self._panel_messages_after.get(guild_id, 0) + 1
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """パネルが削除されたら参照を破棄"""
+        if not payload.guild_id:
+            return
+        panel = self._panels.get(payload.guild_id)
+        if panel and panel.id == payload.message_id:
+            del self._panels[payload.guild_id]
@@ -0,0 +1,191 @@
+"""
+音楽セッションの永続化
+
+再生中のキュー・再生位置・ループモード・ボイスチャンネルを定期的に
+SQLite へスナップショットし、再起動後にプレイヤーを再接続して再開する。
+"""
+from __future__ import annotations
+
+from typing import Optional, cast
+
+import discord
+import wavelink
+from discord.ext import tasks
+
+from utils.logging import get_logger
+
+from .lazy_queue import PlaylistStubs
+
+logger = get_logger("sumire.cogs.music.persistence")
+
+# デコードAPIに一度に渡すトラック数
+DECODE_CHUNK_SIZE = 100
+
+
+class PersistenceMixin:
+    """セッション永続化 Mixin"""
+
+    _sessions_restored: bool
+    _last_snapshots: dict[int, tuple]
+
+    def _build_snapshot(self, player: wavelink.Player) -> Optional[dict]:
+        """プレイヤーの状態をスナップショット化（メモリ上のみ、I/Oなし）"""
+        if not player.guild or not player.channel or not player.current:
+            return None
+
+        guild_id = player.guild.id
+        queue = [track.encoded for track in player.queue]
+        pending = self._pending_tracks.get(guild_id)
+        if pending:
+            queue.extend(stub.encoded for stub in pending)
+
+        return {
+            "guild_id": guild_id,
+            "voice_channel_id": player.channel.id,
+            "current_track": player.current.encoded,
+            "position": int(player.position),
+            "loop_mode": self.loop_mode.get(guild_id, "off"),
+            "queue": queue,
+        }
+
+    async def _flush_sessions(self) -> None:
+        """全プレイヤーのスナップショットを一括で保存"""
+        sessions: list[dict] = []
+        active: set[int] = set()
+
+        for voice_client in self.bot.voice_clients:
+            if not isinstance(voice_client, wavelink.Player):
+                continue
+            snapshot = self._build_snapshot(voice_client)
+            if not snapshot:
+                continue
+
+            guild_id = snapshot["guild_id"]
+            active.add(guild_id)
+            key = (
+                snapshot["voice_channel_id"],
+                snapshot["current_track"],
+                snapshot["position"],
+                snapshot["loop_mode"],
+                len(snapshot["queue"]),
+            )
+            if self._last_snapshots.get(guild_id) != key:
+                self._last_snapshots[guild_id] = key
+                sessions.append(snapshot)
+
+        stale = [guild_id for guild_id in self._last_snapshots if guild_id not in active]
+        for guild_id in stale:
+            del self._last_snapshots[guild_id]
+
+        if not sessions and not stale:
+            return
+
+        async with self.db.transaction():
+            await self.db.save_music_sessions(sessions)
+            await self.db.delete_music_sessions(stale)
+        logger.debug(f"セッションを保存: 更新={len(sessions)}, 削除={len(stale)}")
+
+    @tasks.loop(seconds=30)
+    async def snapshot_sessions(self) -> None:
+        """セッションスナップショットを定期保存"""
+        # 復元前に書き込むと未復元のセッションを消してしまう
+        if not self._sessions_restored:
+            return
+        try:
+            await self._flush_sessions()
+        except Exception as e:
+            logger.error(f"セッション保存エラー: {e}")
+
+    @snapshot_sessions.before_loop
+    async def before_snapshot_sessions(self) -> None:
+        """スナップショットタスク開始前にBotの準備を待つ"""
+        await self.bot.wait_until_ready()
+
+    async def _decode_tracks(self, encoded: list[str]) -> list[wavelink.Playable]:
+        """エンコード済みトラック文字列を Lavalink でデコード"""
+        node = wavelink.Pool.get_node()
+        tracks: list[wavelink.Playable] = []
+        for i in range(0, len(encoded), DECODE_CHUNK_SIZE):
+            chunk = encoded[i:i + DECODE_CHUNK_SIZE]
+            data = await node.send("POST", path="v4/decodetracks", data=chunk)
+            tracks.extend(wavelink.Playable(payload) for payload in data)
+        return tracks
+
+    async def _restore_session(self, session: dict) -> bool:
+        """保存されたセッションを1件復元"""
+        guild = self.bot.get_guild(session["guild_id"])
+        if not guild:
+            return False
+
+        channel = guild.get_channel(session["voice_channel_id"])
+        if not isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
+            return False
+
+        # 誰もいないVCには戻らない
+        if not any(not m.bot for m in channel.members):
+            return False
+
+        encoded = ([session["current_track"]] if session["current_track"] else []) + session["queue"]
+        if not encoded:
+            return False
+
+        tracks = await self._decode_tracks(encoded)
+        if not tracks:
+            return False
+
+        player = await channel.connect(cls=wavelink.Player)
+        player = cast(wavelink.Player, player)
+        player.autoplay = wavelink.AutoPlayMode.disabled
+        await player.set_volume(self.config.music_default_volume)
+
+        if session["loop_mode"] and session["loop_mode"] != "off":
+            self.loop_mode[guild.id] = session["loop_mode"]
+
+        current, rest = tracks[0], tracks[1:]
+        if rest:
+            playlist = PlaylistStubs.from_tracks(rest, self._pending_capacity(guild.id))
+            self._enqueue_stubs(player, playlist.stubs)
+
+        start = session["position"] if session["current_track"] else 0
+        await player.play(current, start=start)
+        logger.info(f"セッションを復元: guild_id={guild.id}, キュー={len(rest)}曲")
+        return True
+
+    async def _restore_sessions(self) -> None:
+        """保存された全セッションを復元"""
+        if self._sessions_restored:
+            return
+
+        try:
+            sessions = await self.db.get_music_sessions()
+        except Exception as e:
+            logger.error(f"セッション読み込みエラー: {e}")
+            self._sessions_restored = True
+            return
+
+        # 他のクラスターが担当するサーバーのセッションは扱わない（失敗として削除しない）
+        sessions = [session for session in sessions if self.bot.owns_guild(session["guild_id"])]
+
+        failed: list[int] = []
+        for session in sessions:
+            guild_id = session["guild_id"]
+            guild = self.bot.get_guild(guild_id)
+            if guild and guild.voice_client:
+                # 既に接続中（Cogリロード時など）はそのまま引き継ぐ
+                self._last_snapshots[guild_id] = ()
+                continue
+            try:
+                if await self._restore_session(session):
+                    # 次回のスナップショットで状態を上書き・削除できるよう登録
+                    self._last_snapshots[guild_id] = ()
+                else:
+                    failed.append(guild_id)
+            except Exception as e:
+                logger.warning(f"セッション復元エラー: guild_id={guild_id} - {e}")
+                failed.append(guild_id)
+
+        if failed:
+            await self.db.delete_music_sessions(failed)
+
+        self._sessions_restored = True
+        logger.info(f"セッション復元完了: 成功={len(sessions) - len(failed)}, 失敗={len(failed)}")
@@ -18,6 +18,8 @@ from views.music_views import (
     MusicErrorView,
 )
 
+from .lazy_queue import PlaylistStubs
+
 logger = get_logger("sumire.cogs.music.play")
 
 # Spotify URL 正規表現（/intl-ja/ などのロケールプレフィックスに対応）
@@ -150,28 +152,28 @@ class PlayMixin:
         is_spotify: bool
     ) -> None:
         """プレイリスト/アルバムの処理"""
-        added_count = 0
-        for track in tracks:
-            player.queue.put(track)
-            added_count += 1
+        # 完全な Playable は保持せず、軽量スタブとして待機列に積む
+        playlist = PlaylistStubs.from_tracks(tracks, self._pending_capacity(player.guild.id))
+        added_count = self._enqueue_stubs(player, playlist.stubs)
 
         logger.info(f"プレイリストをキューに追加: {playlist_name} ({added_count}曲)")
+        if playlist.truncated:
+            logger.info(f"キュー上限のため {playlist.truncated} 曲を省略: {playlist_name}")
 
-        total_duration = sum(t.length for t in tracks)
         source_info = "Spotify → SoundCloud" if is_spotify else "SoundCloud"
         is_album = content_type == "album"
-        first_artwork = getattr(tracks[0], 'artwork', None) if tracks else None
+        first_artwork = playlist.stubs[0].artwork if playlist.stubs else None
 
-        if not player.playing and not player.queue.is_empty:
+        if not player.playing and self._has_next(player):
             try:
-                next_track = player.queue.get()
+                next_track = self._next_track(player)
                 await player.play(next_track)
                 logger.info(f"再生開始: {next_track.title}")
 
                 view = PlaylistAddView(
                     playlist_name=playlist_name,
                     track_count=added_count,
-                    total_duration=self._format_duration(total_duration),
+                    total_duration=self._format_duration(playlist.total_length),
                     source=source_info,
                     first_track=next_track.title,
                     is_album=is_album,
@@ -189,9 +191,9 @@ class PlayMixin:
             view = PlaylistAddView(
                 playlist_name=playlist_name,
                 track_count=added_count,
-                total_duration=self._format_duration(total_duration),
+                total_duration=self._format_duration(playlist.total_length),
                 source=source_info,
-                queue_count=len(player.queue),
+                queue_count=self._queue_length(player),
                 is_album=is_album,
                 thumbnail_url=first_artwork,
                 is_playing=False
@@ -238,12 +240,12 @@ class PlayMixin:
         track = tracks[0]
         source_info = self._get_source_info(track, is_spotify)
 
-        player.queue.put(track)
+        self._enqueue_track(player, track)
         logger.info(f"トラックをキューに追加: {track.title}")
 
         if not player.playing:
             try:
-                next_track = player.queue.get()
+                next_track = self._next_track(player)
                 await player.play(next_track)
                 logger.info(f"再生リクエスト: {next_track.title}")
                 view = TrackRequestView(
@@ -265,7 +267,7 @@ class PlayMixin:
                 title=track.title,
                 duration=self._format_duration(track.length),
                 source=source_info,
-                position=len(player.queue),
+                position=self._queue_length(player),
                 thumbnail_url=getattr(track, 'artwork', None)
             )
 
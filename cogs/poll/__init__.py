@@ -34,12 +34,7 @@ class Poll(commands.Cog):
 
     async def cog_load(self) -> None:
         """Cog読み込み時"""
-        # 永続的Viewを登録
-        self.bot.add_view(PollView(
-            question="placeholder",
-            options=["1", "2"],
-            votes={}
-        ))
+        # 投票ボタンは PersistentViewManager で DynamicItem として登録済み
         # チェックタスクを開始
         self.check_ended_polls.start()
         logger.info("Poll Cog loaded")
@@ -56,6 +51,9 @@ class Poll(commands.Cog):
             now = datetime.utcnow()
 
             for poll in polls:
+                # 他のクラスターが担当するサーバーは扱わない
+                if not self.bot.owns_guild(poll["guild_id"]):
+                    continue
                 if poll.get("end_time"):
                     end_time = datetime.fromisoformat(poll["end_time"])
                     if now >= end_time:
@@ -9,6 +9,7 @@ import discord
 from discord.ext import tasks
 
 from utils.logging import get_logger
+from utils.outbound import Priority
 from views.star_views import StarLeaderboardView
 
 logger = get_logger("sumire.cogs.star.weekly_report")
@@ -34,6 +35,9 @@ class StarWeeklyReportMixin:
 
             for guild_data in guilds:
                 guild_id = guild_data["guild_id"]
+                # 他のクラスターが担当するサーバーは扱わない
+                if not self.bot.owns_guild(guild_id):
+                    continue
                 channel_id = guild_data["weekly_report_channel_id"]
                 last_sent = guild_data.get("weekly_report_last_sent")
 
@@ -103,9 +107,11 @@ class StarWeeklyReportMixin:
                 period="weekly"
             )
 
-            await channel.send(
+            self.bot.outbound.send(
+                channel,
                 view=view,
-                allowed_mentions=discord.AllowedMentions.none()
+                allowed_mentions=discord.AllowedMentions.none(),
+                priority=Priority.LOW
             )
 
             # 最終送信日時を更新
@@ -10,7 +10,6 @@ from discord.ext import commands
 from utils.config import Config
 from utils.database import Database
 from utils.checks import handle_app_command_error
-from views.teamshuffle_views import TeamShufflePanelView
 from .teamshuffle import TeamShuffleMixin
 
 if TYPE_CHECKING:
@@ -25,10 +24,6 @@ class TeamShuffle(TeamShuffleMixin, commands.Cog):
         self.config = Config()
         self.db = Database()
 
-    async def cog_load(self) -> None:
-        """Cog読み込み時に永続的Viewを登録"""
-        self.bot.add_view(TeamShufflePanelView(self.bot))
-
     async def cog_app_command_error(
         self,
         interaction,
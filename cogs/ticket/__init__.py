@@ -6,17 +6,21 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from utils.config import Config
 from utils.database import Database
 from utils.checks import handle_app_command_error
+from utils.logging import get_logger
+from views.persistent import PersistentViewManager
 
 from .ticket import TicketMixin
 
 if TYPE_CHECKING:
     from bot import SumireBot
 
+logger = get_logger("sumire.cogs.ticket")
+
 
 class Ticket(TicketMixin, commands.Cog):
     """チケットシステム"""
@@ -26,6 +30,27 @@ class Ticket(TicketMixin, commands.Cog):
         self.config = Config()
         self.db = Database()
 
+    async def cog_load(self) -> None:
+        """Cog読み込み時に掃除タスクを開始"""
+        self.purge_persistent_views.start()
+
+    async def cog_unload(self) -> None:
+        """Cog解除時"""
+        self.purge_persistent_views.cancel()
+
+    @tasks.loop(hours=1)
+    async def purge_persistent_views(self) -> None:
+        """削除されたチャンネルのチケット制御パネルの行を削除"""
+        try:
+            await PersistentViewManager.purge_stale(self.bot)
+        except Exception as e:
+            logger.error(f"永続的Viewの掃除エラー: {e}")
+
+    @purge_persistent_views.before_loop
+    async def before_purge_persistent_views(self) -> None:
+        """掃除タスク開始前にBotの準備を待つ（キャッシュが揃う前に削除しないため）"""
+        await self.bot.wait_until_ready()
+
     # ==================== エラーハンドリング ====================
 
     async def cog_app_command_error(
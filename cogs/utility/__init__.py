@@ -1,9 +1,9 @@
 """
-Utility Cog - ユーティリティコマンド（Translate, Logger）
+Utility Cog - ユーティリティコマンド（Translate, Logger, Archive）
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from discord import app_commands
 from discord.ext import commands
@@ -11,18 +11,30 @@ from discord.ext import commands
 from utils.config import Config
 from utils.database import Database
 from utils.checks import handle_app_command_error
+from utils.audit_log import AuditLogFollower
+from utils.message_store import MessageStore
+from utils.metrics import Sample, registry
 
 from .translate import TranslateMixin
 from .logger import LoggerMixin
 from .confess import ConfessMixin
 from .context_menus import ContextMenusMixin
 from .shorturl import ShortUrlMixin
+from .archive import ArchiveMixin
 
 if TYPE_CHECKING:
     from bot import SumireBot
 
 
-class Utility(TranslateMixin, LoggerMixin, ConfessMixin, ContextMenusMixin, ShortUrlMixin, commands.Cog):
+class Utility(
+    TranslateMixin,
+    LoggerMixin,
+    ArchiveMixin,
+    ConfessMixin,
+    ContextMenusMixin,
+    ShortUrlMixin,
+    commands.Cog
+):
     """ユーティリティ機能"""
 
     def __init__(self, bot: SumireBot) -> None:
@@ -30,9 +42,57 @@ class Utility(TranslateMixin, LoggerMixin, ConfessMixin, ContextMenusMixin, Shor
         self.config = Config()
         self.db = Database()
 
+        # ログダイジェストのバッファ
+        self._log_digests = {}
+
+        # 削除・編集ログ用のメッセージストア
+        self.message_store = MessageStore(
+            self.db,
+            max_bytes=self.config.message_store_memory_mb * 1024 * 1024,
+            ttl_seconds=self.config.message_store_ttl_hours * 3600
+        )
+
+        # 実行者特定用の監査ログフォロワー（サーバーごとに共有）
+        self.audit_log = AuditLogFollower()
+
+        # メッセージアーカイブの書き出し待ちバッファ
+        self._archive_pending = {}
+        self._archive_edits = {}
+        self._archive_deletes = set()
+
         # 翻訳機能の初期化
         self._init_translator()
 
+    async def cog_load(self) -> None:
+        """Cog読み込み時にメッセージストア・アーカイブのタスクを開始"""
+        self.flush_message_store.start()
+        self.purge_message_store.start()
+        self.flush_archive.start()
+        self.maintain_archive.start()
+        registry.add_collector("utility", self._collect_metrics)
+        await super().cog_load()
+
+    async def cog_unload(self) -> None:
+        """Cog アンロード時に溜まっているログ・メッセージ・アーカイブを書き出す"""
+        registry.remove_collector("utility")
+        await self._flush_all_log_digests()
+        self.flush_message_store.cancel()
+        self.purge_message_store.cancel()
+        self.flush_archive.cancel()
+        self.maintain_archive.cancel()
+        await self._flush_message_store()
+        await self._flush_archive()
+        await super().cog_unload()
+
+    def _collect_metrics(self) -> Iterable[Sample]:
+        """監査ログ・メッセージストアの統計をメトリクスとして読み出す"""
+        yield "sumire_cache_lookups_total", "counter", "", {"cache": "audit_log", "result": "hit"}, self.audit_log.hits
+        yield "sumire_cache_lookups_total", "counter", "", {"cache": "audit_log", "result": "miss"}, self.audit_log.misses
+        yield (
+            "sumire_message_store_bytes", "gauge", "メッセージストアのメモリ使用量の概算", {},
+            self.message_store.memory_bytes
+        )
+
     # ==================== エラーハンドリング ====================
 
     async def cog_app_command_error(
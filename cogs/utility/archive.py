@@ -0,0 +1,267 @@
+"""
+メッセージアーカイブ（全文検索）コマンドとイベント
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+
+from utils.checks import Checks
+from utils.logging import get_logger
+from views.archive_views import ArchiveSearchView
+from views.common_views import CommonSuccessView, CommonWarningView, CommonErrorView
+
+logger = get_logger("sumire.cogs.utility.archive")
+
+# この件数溜まったら定期書き出しを待たずに書き出す
+ARCHIVE_FLUSH_THRESHOLD = 500
+
+# 1回のメンテナンスで統合する全文検索インデックスのページ数
+ARCHIVE_MERGE_PAGES = 500
+
+# 検索結果の1ページあたりの件数
+SEARCH_PAGE_SIZE = 5
+
+# 保存期間の上限（日）
+ARCHIVE_MAX_RETENTION_DAYS = 365
+
+
+class ArchiveMixin:
+    """メッセージアーカイブ Mixin"""
+
+    _archive_pending: dict[int, tuple]
+    _archive_edits: dict[int, str]
+    _archive_deletes: set[int]
+
+    async def _should_archive(self, guild_id: int) -> bool:
+        """アーカイブ対象のサーバーか"""
+        settings = await self.db.get_archive_settings(guild_id)
+        return bool(settings and settings.get("enabled"))
+
+    # ==================== イベント ====================
+
+    @commands.Cog.listener("on_message")
+    async def on_archive_message(self, message: discord.Message) -> None:
+        """アーカイブ有効サーバーのメッセージをバッファに追加"""
+        if not message.guild or message.author.bot or not message.content:
+            return
+
+        if not await self._should_archive(message.guild.id):
+            return
+
+        self._archive_pending[message.id] = (
+            message.id,
+            message.guild.id,
+            message.channel.id,
+            message.author.id,
+            str(message.author),
+            message.content,
+            int(message.created_at.timestamp()),
+        )
+        if len(self._archive_pending) >= ARCHIVE_FLUSH_THRESHOLD:
+            await self._flush_archive()
+
+    @commands.Cog.listener("on_raw_message_edit")
+    async def on_archive_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """編集されたメッセージの内容を更新"""
+        if not payload.guild_id:
+            return
+
+        content = payload.data.get("content")
+        if content is None or not await self._should_archive(payload.guild_id):
+            return
+
+        pending = self._archive_pending.get(payload.message_id)
+        if pending:
+            self._archive_pending[payload.message_id] = pending[:5] + (content, pending[6])
+        else:
+            self._archive_edits[payload.message_id] = content
+
+    @commands.Cog.listener("on_raw_message_delete")
+    async def on_archive_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """削除されたメッセージをアーカイブからも削除"""
+        if payload.guild_id and await self._should_archive(payload.guild_id):
+            self._forget_archived([payload.message_id])
+
+    @commands.Cog.listener("on_raw_bulk_message_delete")
+    async def on_archive_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """一括削除されたメッセージをアーカイブからも削除"""
+        if payload.guild_id and await self._should_archive(payload.guild_id):
+            self._forget_archived(list(payload.message_ids))
+
+    def _forget_archived(self, message_ids: list[int]) -> None:
+        """メッセージを削除対象に追加"""
+        for message_id in message_ids:
+            self._archive_pending.pop(message_id, None)
+            self._archive_edits.pop(message_id, None)
+            self._archive_deletes.add(message_id)
+
+    # ==================== 書き出し・メンテナンス ====================
+
+    async def _flush_archive(self) -> None:
+        """バッファをまとめてデータベースに書き出す"""
+        if not self._archive_pending and not self._archive_edits and not self._archive_deletes:
+            return
+
+        # 書き込み中の追加・編集・削除は次回に回すため、バッファを入れ替えてから書き込む
+        pending, self._archive_pending = self._archive_pending, {}
+        edits, self._archive_edits = self._archive_edits, {}
+        deletes, self._archive_deletes = self._archive_deletes, set()
+
+        try:
+            async with self.db.transaction():
+                await self.db.archive_messages(list(pending.values()))
+                await self.db.update_archived_messages(
+                    [(content, message_id) for message_id, content in edits.items()]
+                )
+                await self.db.delete_archived_messages(list(deletes))
+        except Exception as e:
+            # 他のクラスターの書き込み中（SQLITE_BUSY）などは次回に再試行する
+            # （書き込み中に更新・削除されたものは新しい方を優先し、古い分を先頭に戻す）
+            logger.error(f"アーカイブ書き出しエラー（次回に再試行）: {e}")
+            new_deletes = self._archive_deletes
+            self._archive_pending = {
+                **{mid: row for mid, row in pending.items() if mid not in new_deletes},
+                **self._archive_pending,
+            }
+            self._archive_edits = {
+                **{mid: content for mid, content in edits.items() if mid not in new_deletes},
+                **self._archive_edits,
+            }
+            self._archive_deletes = {
+                mid for mid in deletes if mid not in self._archive_pending
+            } | new_deletes
+            return
+
+        logger.debug(f"アーカイブ書き出し: 追加={len(pending)}, 更新={len(edits)}, 削除={len(deletes)}")
+
+    @tasks.loop(seconds=15)
+    async def flush_archive(self) -> None:
+        """アーカイブのバッファを定期的に書き出す"""
+        await self._flush_archive()
+
+    @tasks.loop(hours=1)
+    async def maintain_archive(self) -> None:
+        """保存期間・件数を超えたメッセージを削除し、インデックスを少しずつ統合"""
+        # DB全体が対象のため、クラスターではクラスター0のみ実行
+        if not self.bot.is_primary_cluster:
+            return
+        try:
+            purged = await self.db.purge_archive(self.config.archive_max_messages)
+            if purged:
+                logger.info(f"アーカイブ: {purged}件の古いメッセージを削除")
+            await self.db.optimize_archive(ARCHIVE_MERGE_PAGES)
+        except Exception as e:
+            logger.error(f"アーカイブメンテナンスエラー: {e}")
+
+    # ==================== コマンド ====================
+
+    @app_commands.command(name="archive", description="/search 用のメッセージアーカイブを設定します")
+    @app_commands.describe(
+        enabled="アーカイブを有効にするか（無効にすると保存済みのメッセージも削除されます）",
+        retention_days="保存期間（日）"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @Checks.is_admin()
+    async def archive_command(
+        self,
+        interaction: discord.Interaction,
+        enabled: bool,
+        retention_days: Optional[app_commands.Range[int, 1, ARCHIVE_MAX_RETENTION_DAYS]] = None
+    ) -> None:
+        """メッセージアーカイブを設定するコマンド"""
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = interaction.guild_id
+        if retention_days is None:
+            settings = await self.db.get_archive_settings(guild_id)
+            retention_days = (
+                settings["retention_days"] if settings
+                else self.config.archive_default_retention_days
+            )
+
+        await self.db.set_archive_settings(guild_id, enabled, retention_days)
+
+        if enabled:
+            view = CommonSuccessView(
+                title="メッセージアーカイブを有効化しました",
+                description=(
+                    f"これ以降のメッセージを **{retention_days}日間** 保存し、`/search` で検索できるようにします。\n"
+                    "-# 削除・編集されたメッセージはアーカイブにも反映されます"
+                )
+            )
+        else:
+            self._archive_pending = {
+                message_id: row for message_id, row in self._archive_pending.items()
+                if row[1] != guild_id
+            }
+            deleted = await self.db.clear_archive(guild_id)
+            view = CommonWarningView(
+                title="メッセージアーカイブを無効化しました",
+                description=f"保存済みのメッセージ {deleted}件 を削除しました。"
+            )
+
+        await interaction.followup.send(view=view)
+        logger.info(f"アーカイブ設定変更: guild_id={guild_id}, enabled={enabled}, retention_days={retention_days}")
+
+    @app_commands.command(name="search", description="アーカイブされたメッセージを検索します")
+    @app_commands.describe(
+        query="検索する語句",
+        author="投稿者で絞り込み",
+        channel="チャンネルで絞り込み"
+    )
+    @app_commands.default_permissions(manage_guild=True)
+    @Checks.is_mod()
+    async def search_command(
+        self,
+        interaction: discord.Interaction,
+        query: app_commands.Range[str, 1, 100],
+        author: Optional[discord.User] = None,
+        channel: Optional[discord.TextChannel] = None
+    ) -> None:
+        """アーカイブを全文検索するコマンド"""
+        guild = interaction.guild
+
+        if not await self._should_archive(guild.id):
+            view = CommonErrorView(
+                title="アーカイブが無効です",
+                description="先に `/archive` でメッセージアーカイブを有効化してください。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        # 直近のメッセージも検索できるように書き出す
+        await self._flush_archive()
+
+        # 実行者が閲覧できないチャンネルは結果から除外
+        member = interaction.user
+        hidden_channels = [
+            ch.id for ch in (*guild.channels, *guild.threads)
+            if not ch.permissions_for(member).read_message_history
+        ]
+
+        async def fetch_page(page: int) -> list[dict]:
+            return await self.db.search_archive(
+                guild.id,
+                query,
+                limit=SEARCH_PAGE_SIZE + 1,
+                offset=page * SEARCH_PAGE_SIZE,
+                author_id=author.id if author else None,
+                channel_id=channel.id if channel else None,
+                excluded_channels=hidden_channels
+            )
+
+        view = ArchiveSearchView(
+            guild_id=guild.id,
+            query=query,
+            fetch_page=fetch_page,
+            page_size=SEARCH_PAGE_SIZE,
+            user_id=member.id
+        )
+        await view.load(0)
+        await interaction.followup.send(view=view)
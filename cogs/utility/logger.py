@@ -3,14 +3,19 @@
 """
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timezone
 from typing import Optional, Union
 
 import discord
 from discord import app_commands, ui
-from discord.ext import commands
+from discord.ext import commands, tasks
 
+from utils.audit_log import AuditLogFollower
 from utils.checks import Checks
 from utils.logging import get_logger
+from utils.message_store import MessageStore, StoredMessage
+from utils.outbound import Priority
 from views.common_views import CommonSuccessView, CommonWarningView, CommonErrorView
 from views.log_views import (
     LogMessageDeleteView,
@@ -23,15 +28,42 @@ from views.log_views import (
     LogBulkDeleteView,
     LogMemberTimeoutView,
     LogChannelUpdateView,
-    LogRoleUpdateView
+    LogRoleUpdateView,
+    LogDigestView
 )
 
 logger = get_logger("sumire.cogs.utility.logger")
 
+# ダイジェストに溜めるイベント数の上限（超えたら即時送信）
+DIGEST_MAX_EVENTS = 25
+
+# ダイジェスト集計時間の上限（秒）
+DIGEST_MAX_WINDOW = 300
+
+# アンロード時にダイジェストの送信完了を待つ時間（秒）
+DIGEST_FLUSH_TIMEOUT = 10
+
+
+class _LogDigest:
+    """ギルドごとのダイジェストバッファ"""
+
+    __slots__ = ("channel", "events", "priority", "started_at", "task")
+
+    def __init__(self, channel: discord.TextChannel) -> None:
+        self.channel = channel
+        self.events: list[tuple[str, str]] = []
+        self.priority = Priority.LOG
+        self.started_at = datetime.now(timezone.utc)
+        self.task: Optional[asyncio.Task] = None
+
 
 class LoggerMixin:
     """ログシステム Mixin"""
 
+    _log_digests: dict[int, _LogDigest]
+    message_store: MessageStore
+    audit_log: AuditLogFollower
+
     async def _get_log_channel(self, guild_id: int) -> Optional[discord.TextChannel]:
         """ログチャンネルを取得"""
         settings = await self.db.get_logger_settings(guild_id)
@@ -63,6 +95,80 @@ class LoggerMixin:
 
         return bool(settings.get(setting_key, True))
 
+    async def _send_log(
+        self,
+        channel: discord.TextChannel,
+        view: ui.LayoutView,
+        category: str,
+        summary: str,
+        priority: Priority = Priority.LOG
+    ) -> None:
+        """ログを送信（ダイジェストモードのギルドはバッファに追加）"""
+        settings = await self.db.get_logger_settings(channel.guild.id)
+        window = settings.get("digest_window") if settings else 0
+        if not window:
+            self.bot.outbound.send(channel, view=view, priority=priority)
+            return
+
+        guild_id = channel.guild.id
+        digest = self._log_digests.get(guild_id)
+        if digest is None:
+            digest = self._log_digests[guild_id] = _LogDigest(channel)
+            digest.task = asyncio.create_task(self._flush_log_digest_later(guild_id, window))
+
+        digest.events.append((category, summary))
+        digest.priority = min(digest.priority, priority)
+
+        # バッファが満杯なら待たずに送信
+        if len(digest.events) >= DIGEST_MAX_EVENTS:
+            self._flush_log_digest(guild_id)
+
+    async def _flush_log_digest_later(self, guild_id: int, window: int) -> None:
+        """集計時間の経過後にダイジェストを送信"""
+        try:
+            await asyncio.sleep(window)
+        except asyncio.CancelledError:
+            return
+        self._flush_log_digest(guild_id)
+
+    def _flush_log_digest(self, guild_id: int) -> Optional[asyncio.Future]:
+        """ダイジェストを1件のメッセージとして送信（送信完了の Future を返す）"""
+        digest = self._log_digests.pop(guild_id, None)
+        if not digest or not digest.events:
+            return None
+
+        if digest.task and digest.task is not asyncio.current_task():
+            digest.task.cancel()
+
+        view = LogDigestView(
+            events=digest.events,
+            started_at=digest.started_at,
+            ended_at=datetime.now(timezone.utc)
+        )
+        return self.bot.outbound.send(digest.channel, view=view, priority=digest.priority)
+
+    async def _flush_all_log_digests(self) -> None:
+        """
+        全ギルドのダイジェストを送信し、送信完了まで待つ
+
+        終了時は Cog のアンロード後に HTTP セッションと送信キューが閉じられるため、
+        キューに積むだけでは送信されずに失われる。
+        """
+        futures = [
+            future for guild_id in list(self._log_digests)
+            if (future := self._flush_log_digest(guild_id)) is not None
+        ]
+        if not futures:
+            return
+        _, pending = await asyncio.wait(futures, timeout=DIGEST_FLUSH_TIMEOUT)
+        if pending:
+            logger.warning(f"ダイジェストの送信が時間内に完了しませんでした: {len(pending)}件")
+
+    @staticmethod
+    def _executor_suffix(executor: Optional[str]) -> str:
+        """ダイジェスト用の実行者表記"""
+        return f"（実行者: {executor}）" if executor else ""
+
     def _get_channel_type_name(self, channel: discord.abc.GuildChannel) -> str:
         """チャンネルタイプの日本語名を取得"""
         type_names = {
@@ -92,6 +198,7 @@ class LoggerMixin:
         if current_settings and current_settings.get("enabled"):
             if current_settings.get("channel_id") == channel_id:
                 await self.db.disable_logger(guild_id)
+                self.audit_log.forget(guild_id)
                 view = CommonWarningView(
                     title="ログシステムを無効化しました",
                     description="サーバーログの記録を停止しました。"
@@ -109,6 +216,49 @@ class LoggerMixin:
         await interaction.followup.send(view=view)
         logger.info(f"ログ設定変更: guild_id={guild_id}, channel_id={channel_id}")
 
+    @app_commands.command(name="logger_digest", description="サーバーログをまとめて送信するダイジェストモードを設定します")
+    @app_commands.describe(window="まとめる時間（秒）。0で無効（1件ずつ送信）")
+    @app_commands.default_permissions(administrator=True)
+    @Checks.is_admin()
+    async def logger_digest_command(
+        self,
+        interaction: discord.Interaction,
+        window: app_commands.Range[int, 0, DIGEST_MAX_WINDOW]
+    ) -> None:
+        """ダイジェストモードを設定するコマンド"""
+        guild_id = interaction.guild_id
+        settings = await self.db.get_logger_settings(guild_id)
+
+        if not settings or not settings.get("enabled"):
+            view = CommonErrorView(
+                title="ログシステムが無効です",
+                description="先に `/logger` でログチャンネルを設定してください。"
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        await self.db.set_logger_digest(guild_id, window)
+
+        # 溜まっているイベントは旧設定のまま送信
+        self._flush_log_digest(guild_id)
+
+        if window:
+            view = CommonSuccessView(
+                title="ダイジェストモードを有効化しました",
+                description=(
+                    f"ログを **{window}秒** ごとにまとめて送信します。\n"
+                    f"-# {DIGEST_MAX_EVENTS}件溜まった場合はすぐに送信します"
+                )
+            )
+        else:
+            view = CommonSuccessView(
+                title="ダイジェストモードを無効化しました",
+                description="ログを1件ずつ送信します。"
+            )
+
+        await interaction.response.send_message(view=view, ephemeral=True)
+        logger.info(f"ログダイジェスト設定変更: guild_id={guild_id}, window={window}")
+
     def _create_logger_enabled_view(self, channel_mention: str) -> ui.LayoutView:
         """ログシステム有効化時のView"""
         view = ui.LayoutView(timeout=300)
@@ -129,100 +279,185 @@ class LoggerMixin:
         view.add_item(container)
         return view
 
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """サーバー退出時に監査ログのキャッシュを破棄"""
+        self.audit_log.forget(guild.id)
+
     # ==================== メッセージイベント ====================
 
+    def _author_avatar(self, guild: Optional[discord.Guild], author_id: int) -> str:
+        """投稿者のアバターURLを取得（メンバーが見つからない場合はデフォルト）"""
+        member = guild.get_member(author_id) if guild else None
+        if member:
+            return member.display_avatar.url
+        return f"https://cdn.discordapp.com/embed/avatars/{(author_id >> 22) % 6}.png"
+
     @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message) -> None:
-        """メッセージ削除イベント"""
+    async def on_message(self, message: discord.Message) -> None:
+        """ログ有効サーバーのメッセージをストアに記録"""
         if not message.guild or message.author.bot:
             return
 
         if not await self._should_log(message.guild.id, "messages"):
             return
 
-        channel = await self._get_log_channel(message.guild.id)
+        self.message_store.add(StoredMessage.from_message(message))
+        if self.message_store.needs_flush:
+            await self._flush_message_store()
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """メッセージ削除イベント（キャッシュ外のメッセージも対象）"""
+        if not payload.guild_id:
+            return
+
+        # ログ無効のサーバーはストアを参照しない（記録していないため。残った行は期限切れで削除される）
+        if not await self._should_log(payload.guild_id, "messages"):
+            return
+
+        stored = await self.message_store.pop(payload.message_id)
+
+        if stored is None:
+            message = payload.cached_message
+            if not message or message.author.bot:
+                return
+            stored = StoredMessage.from_message(message)
+
+        channel = await self._get_log_channel(payload.guild_id)
         if not channel:
             return
 
-        content = message.content or ""
-        if message.attachments:
-            attachments = "\n".join([f"📎 {a.filename}" for a in message.attachments])
+        content = stored.content
+        if stored.attachments:
+            attachments = "\n".join(f"📎 {name}" for name in stored.attachments.split("\n"))
             if content:
                 content += f"\n\n{attachments}"
             else:
                 content = attachments
 
+        executor = await self.audit_log.find_executor(
+            channel.guild,
+            discord.AuditLogAction.message_delete,
+            stored.author_id,
+            channel_id=stored.channel_id,
+            attempts=1
+        )
+
         view = LogMessageDeleteView(
-            author_name=str(message.author),
-            author_avatar=message.author.display_avatar.url,
-            author_id=message.author.id,
-            channel_mention=message.channel.mention,
-            content=content
+            author_name=stored.author_name,
+            author_avatar=self._author_avatar(channel.guild, stored.author_id),
+            author_id=stored.author_id,
+            channel_mention=f"<#{stored.channel_id}>",
+            content=content,
+            executor=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={message.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "messages",
+            f"🗑️ <@{stored.author_id}> のメッセージを削除（<#{stored.channel_id}>）: {content[:80]}" + self._executor_suffix(executor)
+        )
 
     @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
-        """メッセージ編集イベント"""
-        if not after.guild or after.author.bot:
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """メッセージ編集イベント（キャッシュ外のメッセージも対象）"""
+        if not payload.guild_id:
             return
 
-        if before.content == after.content:
+        # 埋め込み展開などの内容を含まない更新は無視
+        new_content = payload.data.get("content")
+        if new_content is None:
             return
 
-        if not await self._should_log(after.guild.id, "messages"):
+        if not await self._should_log(payload.guild_id, "messages"):
             return
 
-        channel = await self._get_log_channel(after.guild.id)
+        before = await self.message_store.update_content(payload.message_id, new_content)
+        if before is None:
+            message = payload.cached_message
+            if not message or message.author.bot:
+                return
+            before = StoredMessage.from_message(message)
+
+        if before.content == new_content:
+            return
+
+        channel = await self._get_log_channel(payload.guild_id)
         if not channel:
             return
 
+        jump_url = f"https://discord.com/channels/{payload.guild_id}/{payload.channel_id}/{payload.message_id}"
         view = LogMessageEditView(
-            author_name=str(after.author),
-            author_avatar=after.author.display_avatar.url,
-            author_id=after.author.id,
-            channel_mention=after.channel.mention,
-            jump_url=after.jump_url,
-            before_content=before.content or "",
-            after_content=after.content or ""
+            author_name=before.author_name,
+            author_avatar=self._author_avatar(channel.guild, before.author_id),
+            author_id=before.author_id,
+            channel_mention=f"<#{payload.channel_id}>",
+            jump_url=jump_url,
+            before_content=before.content,
+            after_content=new_content
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={after.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "messages",
+            f"✏️ <@{before.author_id}> がメッセージを編集（[ジャンプ]({jump_url})）"
+        )
 
     @commands.Cog.listener()
-    async def on_bulk_message_delete(self, messages: list[discord.Message]) -> None:
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
         """一括メッセージ削除イベント"""
-        if not messages:
+        if not payload.guild_id or not payload.message_ids:
             return
 
-        guild = messages[0].guild
-        if not guild:
+        if not await self._should_log(payload.guild_id, "messages"):
             return
 
-        if not await self._should_log(guild.id, "messages"):
-            return
+        self.message_store.forget(list(payload.message_ids))
 
-        channel = await self._get_log_channel(guild.id)
+        channel = await self._get_log_channel(payload.guild_id)
         if not channel:
             return
 
-        channel_mention = messages[0].channel.mention if messages[0].channel else "不明"
+        channel_mention = f"<#{payload.channel_id}>"
         view = LogBulkDeleteView(
-            message_count=len(messages),
+            message_count=len(payload.message_ids),
             channel_mention=channel_mention
         )
 
+        await self._send_log(
+            channel,
+            view,
+            "messages",
+            f"🧹 {channel_mention} で {len(payload.message_ids)} 件を一括削除"
+        )
+
+    # ==================== メッセージストア ====================
+
+    async def _flush_message_store(self) -> None:
+        """メッセージストアの書き出し"""
+        try:
+            await self.message_store.flush()
+        except Exception as e:
+            logger.error(f"メッセージストア書き出しエラー: {e}")
+
+    @tasks.loop(seconds=10)
+    async def flush_message_store(self) -> None:
+        """メッセージストアを定期的に書き出す"""
+        await self._flush_message_store()
+
+    @tasks.loop(hours=1)
+    async def purge_message_store(self) -> None:
+        """保存期間を過ぎたメッセージを削除"""
         try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={guild.id}")
+            # DBは全サーバー共通のため、クラスターではクラスター0のみ削除
+            purged = await self.message_store.purge(purge_db=self.bot.is_primary_cluster)
+            if purged:
+                logger.info(f"メッセージストア: {purged}件の期限切れメッセージを削除")
+        except Exception as e:
+            logger.error(f"メッセージストア削除エラー: {e}")
 
     # ==================== メンバーイベント ====================
 
@@ -246,23 +481,39 @@ class LoggerMixin:
             member_count=member.guild.member_count
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={member.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "members",
+            f"📥 {member.mention}（{member}）が参加"
+        )
 
     @commands.Cog.listener()
-    async def on_member_remove(self, member: discord.Member) -> None:
-        """メンバー退出イベント"""
-        if not await self._should_log(member.guild.id, "members"):
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        """メンバー退出イベント（キャッシュにないメンバーも対象）"""
+        if not await self._should_log(payload.guild_id, "members"):
             return
 
-        channel = await self._get_log_channel(member.guild.id)
-        if not channel:
+        guild = self.bot.get_guild(payload.guild_id)
+        channel = await self._get_log_channel(payload.guild_id)
+        if not guild or not channel:
             return
 
-        joined_at = discord.utils.format_dt(member.joined_at, "R") if member.joined_at else "不明"
-        roles = [r.name for r in member.roles if r.name != "@everyone"]
+        # キャッシュ済みの場合は Member（参加日時・ロールあり）、それ以外は User
+        member = payload.user
+        if isinstance(member, discord.Member):
+            joined_at = discord.utils.format_dt(member.joined_at, "R") if member.joined_at else "不明"
+            roles = [r.name for r in member.roles if r.name != "@everyone"]
+        else:
+            joined_at = "不明"
+            roles = []
+
+        executor = await self.audit_log.find_executor(
+            guild,
+            discord.AuditLogAction.kick,
+            member.id,
+            attempts=1
+        )
 
         view = LogMemberLeaveView(
             member_name=str(member),
@@ -270,13 +521,16 @@ class LoggerMixin:
             member_avatar=member.display_avatar.url,
             member_id=member.id,
             joined_at=joined_at,
-            roles=roles
+            roles=roles,
+            kicked_by=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={member.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "members",
+            f"📤 {member.mention}（{member}）が退出" + self._executor_suffix(executor)
+        )
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: Union[discord.Member, discord.User]) -> None:
@@ -288,18 +542,24 @@ class LoggerMixin:
         if not channel:
             return
 
+        executor = await self.audit_log.find_executor(guild, discord.AuditLogAction.ban, user.id)
+
         view = LogMemberBanView(
             user_name=str(user),
             user_mention=user.mention,
             user_avatar=user.display_avatar.url,
             user_id=user.id,
-            is_unban=False
+            is_unban=False,
+            executor=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "moderation",
+            f"🔨 {user.mention}（{user}）をBan" + self._executor_suffix(executor),
+            Priority.MODERATION
+        )
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User) -> None:
@@ -311,18 +571,24 @@ class LoggerMixin:
         if not channel:
             return
 
+        executor = await self.audit_log.find_executor(guild, discord.AuditLogAction.unban, user.id)
+
         view = LogMemberBanView(
             user_name=str(user),
             user_mention=user.mention,
             user_avatar=user.display_avatar.url,
             user_id=user.id,
-            is_unban=True
+            is_unban=True,
+            executor=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "moderation",
+            f"🔓 {user.mention}（{user}）のBanを解除" + self._executor_suffix(executor),
+            Priority.MODERATION
+        )
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
@@ -350,10 +616,18 @@ class LoggerMixin:
                 timeout_until=timeout_until
             )
 
-            try:
-                await channel.send(view=view)
-            except discord.Forbidden:
-                logger.warning(f"ログ送信権限なし: guild_id={after.guild.id}")
+            if is_remove:
+                summary = f"⏰ {after.mention} のタイムアウトを解除"
+            else:
+                summary = f"⏰ {after.mention} をタイムアウト（解除予定: {timeout_until}）"
+
+            await self._send_log(
+                channel,
+                view,
+                "moderation",
+                summary,
+                Priority.MODERATION
+            )
 
     # ==================== チャンネルイベント ====================
 
@@ -367,18 +641,25 @@ class LoggerMixin:
         if not log_channel:
             return
 
+        executor = await self.audit_log.find_executor(
+            channel.guild, discord.AuditLogAction.channel_create, channel.id
+        )
+
         view = LogChannelView(
             channel_name=channel.name,
             channel_type=self._get_channel_type_name(channel),
             channel_id=channel.id,
             is_delete=False,
-            channel_mention=channel.mention
+            channel_mention=channel.mention,
+            executor=executor
         )
 
-        try:
-            await log_channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={channel.guild.id}")
+        await self._send_log(
+            log_channel,
+            view,
+            "channels",
+            f"➕ {channel.mention} を作成" + self._executor_suffix(executor)
+        )
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
@@ -390,17 +671,24 @@ class LoggerMixin:
         if not log_channel:
             return
 
+        executor = await self.audit_log.find_executor(
+            channel.guild, discord.AuditLogAction.channel_delete, channel.id
+        )
+
         view = LogChannelView(
             channel_name=channel.name,
             channel_type=self._get_channel_type_name(channel),
             channel_id=channel.id,
-            is_delete=True
+            is_delete=True,
+            executor=executor
         )
 
-        try:
-            await log_channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={channel.guild.id}")
+        await self._send_log(
+            log_channel,
+            view,
+            "channels",
+            f"➖ #{channel.name} を削除" + self._executor_suffix(executor)
+        )
 
     @commands.Cog.listener()
     async def on_guild_channel_update(
@@ -428,17 +716,24 @@ class LoggerMixin:
         if not changes:
             return
 
+        executor = await self.audit_log.find_executor(
+            after.guild, discord.AuditLogAction.channel_update, after.id
+        )
+
         view = LogChannelUpdateView(
             channel_name=after.name,
             channel_mention=after.mention,
             channel_id=after.id,
-            changes=changes
+            changes=changes,
+            executor=executor
         )
 
-        try:
-            await log_channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={after.guild.id}")
+        await self._send_log(
+            log_channel,
+            view,
+            "channels",
+            f"🔧 {after.mention}: " + " / ".join(changes) + self._executor_suffix(executor)
+        )
 
     # ==================== ロールイベント ====================
 
@@ -452,18 +747,25 @@ class LoggerMixin:
         if not channel:
             return
 
+        executor = await self.audit_log.find_executor(
+            role.guild, discord.AuditLogAction.role_create, role.id
+        )
+
         view = LogRoleView(
             role_name=role.name,
             role_id=role.id,
             is_delete=False,
             role_mention=role.mention,
-            role_colour=role.colour if role.colour.value else None
+            role_colour=role.colour if role.colour.value else None,
+            executor=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={role.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "roles",
+            f"➕ {role.mention} を作成" + self._executor_suffix(executor)
+        )
 
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role) -> None:
@@ -475,17 +777,24 @@ class LoggerMixin:
         if not channel:
             return
 
+        executor = await self.audit_log.find_executor(
+            role.guild, discord.AuditLogAction.role_delete, role.id
+        )
+
         view = LogRoleView(
             role_name=role.name,
             role_id=role.id,
             is_delete=True,
-            role_colour=role.colour if role.colour.value else None
+            role_colour=role.colour if role.colour.value else None,
+            executor=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={role.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "roles",
+            f"➖ @{role.name} を削除" + self._executor_suffix(executor)
+        )
 
     @commands.Cog.listener()
     async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
@@ -511,15 +820,22 @@ class LoggerMixin:
         if not changes:
             return
 
+        executor = await self.audit_log.find_executor(
+            after.guild, discord.AuditLogAction.role_update, after.id
+        )
+
         view = LogRoleUpdateView(
             role_name=after.name,
             role_mention=after.mention,
             role_id=after.id,
             changes=changes,
-            role_colour=after.colour if after.colour.value else None
+            role_colour=after.colour if after.colour.value else None,
+            executor=executor
         )
 
-        try:
-            await channel.send(view=view)
-        except discord.Forbidden:
-            logger.warning(f"ログ送信権限なし: guild_id={after.guild.id}")
+        await self._send_log(
+            channel,
+            view,
+            "roles",
+            f"🔧 {after.mention}: " + " / ".join(changes) + self._executor_suffix(executor)
+        )
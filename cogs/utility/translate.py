@@ -3,19 +3,17 @@
 """
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import importlib.util
+from typing import Any, Optional
 
 import discord
 from discord import app_commands, ui
 
 from utils.logging import get_logger
 
-try:
-    from googletrans import Translator, LANGUAGES
-    TRANSLATOR_AVAILABLE = True
-except ImportError:
-    TRANSLATOR_AVAILABLE = False
-    LANGUAGES = {}
+# googletrans（httpx などを含み重い）は初回使用時に読み込む
+TRANSLATOR_AVAILABLE = importlib.util.find_spec("googletrans") is not None
 
 logger = get_logger("sumire.cogs.utility.translate")
 
@@ -62,12 +60,28 @@ LANGUAGE_NAMES_JA = {
 }
 
 
+_languages: Optional[dict[str, str]] = None
+
+
+def get_languages() -> dict[str, str]:
+    """googletrans の対応言語（初回呼び出し時に読み込み）"""
+    global _languages
+    if _languages is None:
+        if TRANSLATOR_AVAILABLE:
+            from googletrans import LANGUAGES
+            _languages = LANGUAGES
+        else:
+            _languages = {}
+    return _languages
+
+
 def get_language_name(code: str) -> str:
     """言語コードから日本語名を取得"""
     if code in LANGUAGE_NAMES_JA:
         return LANGUAGE_NAMES_JA[code]
-    if code in LANGUAGES:
-        return LANGUAGES[code].title()
+    languages = get_languages()
+    if code in languages:
+        return languages[code].title()
     return code
 
 
@@ -87,8 +101,9 @@ async def language_autocomplete(
             choices.append(app_commands.Choice(name=f"{name} ({code})", value=code))
 
     # その他の言語
-    if LANGUAGES:
-        for code, name in LANGUAGES.items():
+    languages = get_languages()
+    if languages:
+        for code, name in languages.items():
             if code in primary_langs:
                 continue
             ja_name = get_language_name(code)
@@ -160,13 +175,19 @@ class TranslateMixin:
     """翻訳コマンド Mixin"""
 
     def _init_translator(self) -> None:
-        """翻訳機能の初期化"""
-        if TRANSLATOR_AVAILABLE:
-            self.translator = Translator()
-        else:
-            self.translator = None
+        """翻訳機能の初期化（Translator は初回の翻訳時に作成）"""
+        self._translator: Optional[Any] = None
+        if not TRANSLATOR_AVAILABLE:
             logger.warning("googletrans が利用できません。翻訳機能は無効です。")
 
+    @property
+    def translator(self) -> Optional[Any]:
+        """googletrans の Translator（利用できない場合None）"""
+        if self._translator is None and TRANSLATOR_AVAILABLE:
+            from googletrans import Translator
+            self._translator = Translator()
+        return self._translator
+
     @app_commands.command(name="translate", description="テキストを翻訳します")
     @app_commands.describe(
         text="翻訳するテキスト",
@@ -194,7 +215,7 @@ class TranslateMixin:
         target_lang = target or self.config.default_target_language
 
         # 言語コードの検証
-        if target_lang not in LANGUAGES and target_lang not in ["zh-cn", "zh-tw"]:
+        if target_lang not in get_languages() and target_lang not in ["zh-cn", "zh-tw"]:
             view = TranslateErrorView(
                 title="無効な言語",
                 description=f"`{target_lang}` は有効な言語コードではありません。\n言語を選択するか、有効な言語コードを入力してください。"
@@ -212,8 +233,8 @@ class TranslateMixin:
             return
 
         try:
-            # 翻訳実行
-            result = self.translator.translate(text, dest=target_lang)
+            # 翻訳実行（googletrans は同期通信のため別スレッドで実行）
+            result = await asyncio.to_thread(self.translator.translate, text, dest=target_lang)
 
             # 元の言語を取得
             source_lang = result.src
@@ -7,6 +7,7 @@ import discord
 from discord.ext import commands
 
 from utils.logging import get_logger
+from utils.outbound import Priority
 
 logger = get_logger("sumire.cogs.wordcounter.events")
 
@@ -32,6 +33,10 @@ class WordCounterEventsMixin:
         if not words:
             return
 
+        # コピペ連投はカウントしない
+        if self.bot.spam_filter.is_spam(message):
+            return
+
         milestones = settings.get("milestones", [10, 50, 100, 200, 300, 500, 1000])
 
         for word in words:
@@ -56,9 +61,11 @@ class WordCounterEventsMixin:
                 for milestone in sorted(milestones):
                     if last_milestone < milestone <= new_total:
                         # 通知送信
-                        await message.channel.send(
-                            f"🎉 {message.author.mention} が「**{word}**」を **{milestone}回** 達成しました！",
-                            allowed_mentions=discord.AllowedMentions(users=[message.author])
+                        self.bot.outbound.send(
+                            message.channel,
+                            content=f"🎉 {message.author.mention} が「**{word}**」を **{milestone}回** 達成しました！",
+                            allowed_mentions=discord.AllowedMentions(users=[message.author]),
+                            priority=Priority.LOW
                         )
                         await self.db.update_last_milestone(
                             guild_id, message.author.id, word, milestone
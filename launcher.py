@@ -0,0 +1,402 @@
+"""
+すみれBot v2 - クラスターランチャー
+
+シャードを複数のプロセス（クラスター）に分割して起動し、1台のマシンの複数コアで
+ゲートウェイイベントを処理する。各クラスターは bot.py を担当シャードを指定して起動したもの。
+
+- データベースのテーブル作成・マイグレーションは起動前にランチャーで1回だけ行う
+- クラスターは1つずつ起動し、準備完了を待ってから次を起動する（IDENTIFY の集中を避ける）
+- /restart・/shutdown・/sync はIPC（127.0.0.1）経由で全クラスターに反映する
+- 異常終了したクラスターは自動で再起動する
+
+使い方:
+    python launcher.py [--processes N] [--shard-count N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hmac
+import os
+import secrets
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import discord
+
+from utils.config import Config
+from utils.database import Database
+from utils.ipc import MAX_MESSAGE_SIZE, SECRET_ENV, read_message, write_message
+from utils.logging import get_logger, setup_logging
+
+logger = get_logger("sumire.launcher")
+
+BOT_SCRIPT = Path(__file__).resolve().parent / "bot.py"
+
+# cogs/admin/owner.py と同じ再起動用の終了コード
+RESTART_EXIT_CODE = 26
+
+# 準備完了を待つ時間（秒）: 基本 + シャードあたり（IDENTIFY は5秒に1回）
+READY_TIMEOUT_BASE = 60.0
+READY_TIMEOUT_PER_SHARD = 10.0
+
+# 終了要求から強制終了までの待ち時間（秒）
+CLOSE_TIMEOUT = 30.0
+
+# 異常終了時の再起動待ち時間（秒、連続するほど長くする）
+CRASH_BACKOFF_BASE = 5.0
+CRASH_BACKOFF_MAX = 300.0
+
+# この秒数以上動いていれば連続異常終了の回数をリセット
+CRASH_RESET_SECONDS = 600.0
+
+
+def split_shards(shard_count: int, processes: int) -> list[list[int]]:
+    """シャードを連続した範囲でプロセスに均等に分割"""
+    processes = max(1, min(processes, shard_count))
+    size, extra = divmod(shard_count, processes)
+    ranges = []
+    start = 0
+    for i in range(processes):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+class _Cluster:
+    """1プロセス分の状態"""
+
+    def __init__(self, cluster_id: int, shard_ids: list[int]) -> None:
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.ready = asyncio.Event()
+        self.expected_exit = False
+        self.started_at = 0.0
+        self.crashes = 0
+
+    @property
+    def label(self) -> str:
+        return f"cluster {self.cluster_id} (shards {self.shard_ids[0]}-{self.shard_ids[-1]})"
+
+
+class ClusterLauncher:
+    """クラスタープロセスの起動・監視とIPCの中継"""
+
+    def __init__(self, shard_count: int, processes: int, port: int) -> None:
+        self.shard_count = shard_count
+        self.port = port
+        self.clusters = [
+            _Cluster(i, shard_ids) for i, shard_ids in enumerate(split_shards(shard_count, processes))
+        ]
+        self._secret = secrets.token_hex(32)
+        self._stopping = asyncio.Event()
+        self._restart_lock = asyncio.Lock()
+        self._watchers: list[asyncio.Task] = []
+        # request ごとの返信（キーは (送信元クラスターID, nonce)）
+        self._replies: dict[tuple[int, Any], dict[int, Any]] = {}
+        self._reply_events: dict[tuple[int, Any], asyncio.Event] = {}
+
+    # ==================== プロセス管理 ====================
+
+    async def _spawn(self, cluster: _Cluster) -> None:
+        """クラスタープロセスを起動"""
+        cluster.ready.clear()
+        cluster.expected_exit = False
+        cluster.started_at = time.monotonic()
+        cluster.process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(BOT_SCRIPT),
+            "--cluster-id", str(cluster.cluster_id),
+            "--shard-ids", ",".join(map(str, cluster.shard_ids)),
+            "--shard-count", str(self.shard_count),
+            "--ipc-port", str(self.port),
+            env={**os.environ, SECRET_ENV: self._secret},
+        )
+        logger.info(f"{cluster.label} を起動しました (pid={cluster.process.pid})")
+        self._watchers = [task for task in self._watchers if not task.done()]
+        self._watchers.append(asyncio.create_task(self._watch(cluster, cluster.process)))
+
+    async def _start_all(self) -> None:
+        """全クラスターを1つずつ起動（準備完了を待ってから次を起動）"""
+        for cluster in self.clusters:
+            if self._stopping.is_set():
+                return
+            await self._spawn(cluster)
+            timeout = READY_TIMEOUT_BASE + READY_TIMEOUT_PER_SHARD * len(cluster.shard_ids)
+            # 準備完了か、起動に失敗して終了するまで待つ
+            ready = asyncio.create_task(cluster.ready.wait())
+            exited = asyncio.create_task(cluster.process.wait())
+            done, _ = await asyncio.wait({ready, exited}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            ready.cancel()
+            exited.cancel()
+            if not done:
+                logger.warning(f"{cluster.label} の準備完了を待たずに次を起動します")
+
+    async def _watch(self, cluster: _Cluster, process: asyncio.subprocess.Process) -> None:
+        """プロセスの終了を監視し、必要なら再起動"""
+        code = await process.wait()
+        if cluster.process is not process:
+            return
+        cluster.writer = None
+        uptime = time.monotonic() - cluster.started_at
+        logger.info(f"{cluster.label} が終了しました (code={code}, 稼働 {uptime:.0f}s)")
+
+        if self._stopping.is_set() or cluster.expected_exit:
+            return
+
+        if code == 0:
+            # 単独で /shutdown された場合（ランチャーに接続できなかったなど）は再起動しない
+            logger.info(f"{cluster.label} は正常終了したため再起動しません")
+            if all(c.process is None or c.process.returncode is not None for c in self.clusters):
+                self._stopping.set()
+            return
+
+        if code == RESTART_EXIT_CODE:
+            delay = 0.0
+        else:
+            cluster.crashes = 1 if uptime >= CRASH_RESET_SECONDS else cluster.crashes + 1
+            delay = min(CRASH_BACKOFF_MAX, CRASH_BACKOFF_BASE * 2 ** (cluster.crashes - 1))
+            logger.error(f"{cluster.label} が異常終了しました。{delay:.0f}秒後に再起動します")
+
+        await asyncio.sleep(delay)
+        if not self._stopping.is_set() and not cluster.expected_exit:
+            await self._spawn(cluster)
+
+    async def _close_all(self, code: int) -> None:
+        """全クラスターに終了を要求し、時間内に終了しなければ強制終了"""
+        running = [c for c in self.clusters if c.process and c.process.returncode is None]
+        for cluster in running:
+            cluster.expected_exit = True
+            if cluster.writer is not None:
+                try:
+                    await write_message(cluster.writer, {"op": "close", "code": code})
+                    continue
+                except ConnectionError:
+                    pass
+            cluster.process.terminate()
+
+        for cluster in running:
+            try:
+                await asyncio.wait_for(cluster.process.wait(), timeout=CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"{cluster.label} が終了しないため強制終了します")
+                cluster.process.kill()
+                await cluster.process.wait()
+
+    async def restart(self) -> None:
+        """全クラスターを再起動"""
+        async with self._restart_lock:
+            logger.info("全クラスターを再起動します")
+            await self._close_all(RESTART_EXIT_CODE)
+            await self._start_all()
+
+    async def shutdown(self) -> None:
+        """全クラスターを終了してランチャーも終了"""
+        logger.info("全クラスターを終了します")
+        self._stopping.set()
+        await self._close_all(0)
+
+    # ==================== IPC ====================
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """クラスターからの接続を処理"""
+        cluster: Optional[_Cluster] = None
+        try:
+            hello = await asyncio.wait_for(read_message(reader), timeout=10)
+            if not hello or hello.get("op") != "identify":
+                return
+            if not hmac.compare_digest(str(hello.get("secret", "")), self._secret):
+                logger.warning("認証に失敗したIPC接続を切断しました")
+                return
+            cluster_id = hello.get("cluster_id")
+            if not isinstance(cluster_id, int) or not 0 <= cluster_id < len(self.clusters):
+                return
+
+            cluster = self.clusters[cluster_id]
+            cluster.writer = writer
+            logger.debug(f"{cluster.label} がIPCに接続しました")
+
+            while (message := await read_message(reader)) is not None:
+                await self._dispatch(cluster, message)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            if cluster is not None and cluster.writer is writer:
+                cluster.writer = None
+            writer.close()
+
+    async def _dispatch(self, cluster: _Cluster, message: dict[str, Any]) -> None:
+        op = message.get("op")
+        if op == "ready":
+            cluster.ready.set()
+            logger.info(f"{cluster.label} の準備が完了しました")
+        elif op == "request":
+            asyncio.create_task(self._relay_request(cluster, message))
+        elif op == "reply":
+            key = (message.get("origin"), message.get("nonce"))
+            replies = self._replies.get(key)
+            if replies is not None:
+                replies[cluster.cluster_id] = message.get("data")
+                self._reply_events[key].set()
+        elif op == "control":
+            action = message.get("action")
+            logger.info(f"{cluster.label} から操作要求: {action}")
+            if action == "restart":
+                asyncio.create_task(self.restart())
+            elif action == "shutdown":
+                asyncio.create_task(self.shutdown())
+
+    async def _relay_request(self, origin: _Cluster, message: dict[str, Any]) -> None:
+        """イベントを対象のクラスターに送り、返信をまとめて送信元に返す"""
+        key = (origin.cluster_id, message.get("nonce"))
+        targets = [
+            c for c in self.clusters
+            if c.writer is not None and (c is not origin or message.get("include_self"))
+        ]
+        replies: dict[int, Any] = {}
+        self._replies[key] = replies
+        self._reply_events[key] = event = asyncio.Event()
+
+        event_message = {
+            "op": "event",
+            "origin": origin.cluster_id,
+            "nonce": message.get("nonce"),
+            "event": message.get("event"),
+            "data": message.get("data"),
+        }
+        sent = []
+        for cluster in targets:
+            try:
+                await write_message(cluster.writer, event_message)
+                sent.append(cluster.cluster_id)
+            except (ConnectionError, AttributeError):
+                pass
+
+        timeout = float(message.get("timeout") or 15.0)
+        deadline = time.monotonic() + timeout
+        try:
+            while len(replies) < len(sent):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                event.clear()
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            self._replies.pop(key, None)
+            self._reply_events.pop(key, None)
+
+        if origin.writer is not None:
+            try:
+                await write_message(origin.writer, {
+                    "op": "response",
+                    "nonce": message.get("nonce"),
+                    "replies": {str(k): v for k, v in replies.items()},
+                })
+            except ConnectionError:
+                pass
+
+    # ==================== 起動 ====================
+
+    async def run(self) -> None:
+        """全クラスターを起動し、終了まで監視"""
+        server = await asyncio.start_server(
+            self._handle_connection, "127.0.0.1", self.port, limit=MAX_MESSAGE_SIZE
+        )
+        logger.info(
+            f"{len(self.clusters)} クラスター / {self.shard_count} シャードで起動します "
+            f"(IPC: 127.0.0.1:{self.port})"
+        )
+
+        try:
+            await self._start_all()
+            await self._stopping.wait()
+        finally:
+            self._stopping.set()
+            await self._close_all(0)
+            for task in self._watchers:
+                task.cancel()
+            for cluster in self.clusters:
+                if cluster.writer is not None:
+                    cluster.writer.close()
+            server.close()
+            await server.wait_closed()
+            logger.info("ランチャーを終了しました")
+
+
+async def fetch_recommended_shards(token: str) -> int:
+    """Discord の推奨シャード数を取得"""
+    http = discord.http.HTTPClient(asyncio.get_running_loop())
+    try:
+        await http.static_login(token)
+        shards, _url, _limit = await http.get_bot_gateway()
+        return shards
+    finally:
+        await http.close()
+
+
+async def prepare_database(config: Config) -> None:
+    """テーブル作成・マイグレーションをクラスターの起動前に1回だけ実行"""
+    db = Database()
+    await db.connect(config.database_path, config.database_busy_timeout)
+    await db.close()
+
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="すみれBot v2 クラスターランチャー")
+    parser.add_argument("--processes", type=int, default=None, help="起動するプロセス数（省略時は config.yaml）")
+    parser.add_argument("--shard-count", type=int, default=None, help="合計シャード数（省略時は config.yaml）")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """メイン関数"""
+    config = Config()
+    log_file = config.log_file
+    if log_file:
+        path = Path(log_file)
+        log_file = str(path.with_name(f"{path.stem}.launcher{path.suffix}"))
+    setup_logging(
+        level=config.log_level,
+        log_file=log_file,
+        console=config.log_console,
+        rotation=config.log_rotation,
+        max_bytes=config.log_max_bytes,
+        when=config.log_when,
+        backup_count=config.log_backup_count,
+        json_format=config.log_json
+    )
+
+    if not config.token or config.token == "YOUR_BOT_TOKEN_HERE":
+        logger.error("BOTトークンが設定されていません。config.yaml を確認してください。")
+        return
+
+    shard_count = args.shard_count or config.shard_count
+    if not shard_count:
+        try:
+            shard_count = await fetch_recommended_shards(config.token)
+        except discord.HTTPException as e:
+            logger.error(f"推奨シャード数を取得できませんでした: {e}")
+            return
+        logger.info(f"Discord の推奨シャード数: {shard_count}")
+
+    processes = args.processes or config.cluster_processes
+    await prepare_database(config)
+
+    launcher = ClusterLauncher(shard_count, processes, config.cluster_ipc_port)
+    await launcher.run()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -1,5 +1,8 @@
 # SumireBot 起動スクリプト
 # /restart コマンドでの自動再起動をサポート
+# -Cluster を指定するとクラスターランチャー (launcher.py) で起動（再起動はランチャーが行う）
+
+param([switch]$Cluster)
 
 $RESTART_CODE = 26
 
@@ -15,7 +18,11 @@ if (Test-Path ".venv\Scripts\Activate.ps1") {
 while ($true) {
     Write-Host "[$(Get-Date -Format 'yyyy-MM-dd HH:mm:ss')] Bot を起動します..." -ForegroundColor Green
 
-    python bot.py
+    if ($Cluster) {
+        python launcher.py
+    } else {
+        python bot.py
+    }
     $exitCode = $LASTEXITCODE
 
     Write-Host ""
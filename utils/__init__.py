@@ -1,5 +1,19 @@
 # utils package
-from .config import Config
-from .database import Database
-from .embeds import EmbedBuilder
-from .checks import Checks
+# 各クラスは初回アクセス時に読み込む（utils.xxx のimportで重い依存を読み込まないため）
+from importlib import import_module
+
+_EXPORTS = {
+    "Config": ".config",
+    "Database": ".database",
+    "EmbedBuilder": ".embeds",
+    "Checks": ".checks",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -0,0 +1,246 @@
+"""
+監査ログフォロワー
+
+ログ有効サーバーの監査ログをサーバーごとに一定間隔で1回だけ取得してキャッシュし、
+ログイベントと照合して実行者を特定する。イベントごとに監査ログを取得しない。
+メッセージ削除は同じ実行者・投稿者・チャンネルの削除が1件のエントリにまとめられ、
+件数（extra.count）だけが増えるため、取得ごとの件数の増加でイベントと照合する。
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import discord
+
+from utils.logging import get_logger
+
+logger = get_logger("sumire.audit_log")
+
+# 同じサーバーの監査ログを取得する最小間隔（秒）
+POLL_INTERVAL = 5.0
+
+# 1回の取得件数
+FETCH_LIMIT = 25
+
+# サーバーごとにキャッシュするエントリ数
+CACHE_SIZE = 100
+
+# イベントとエントリを照合する時間幅（秒）
+MATCH_WINDOW = 30
+
+# 同じ実行者・対象・チャンネルの操作が1件のエントリにまとめられ、extra.count が増えるアクション
+GROUPED_ACTIONS = {discord.AuditLogAction.message_delete}
+
+
+class _GuildAuditState:
+    """サーバーごとの監査ログキャッシュ"""
+
+    __slots__ = ("entries", "counts", "unclaimed", "last_poll", "task")
+
+    def __init__(self) -> None:
+        # エントリID → エントリ（ID順）
+        self.entries: dict[int, discord.AuditLogEntry] = {}
+        # まとめられるエントリの前回取得時の extra.count
+        self.counts: dict[int, int] = {}
+        # まとめられるエントリの、まだイベントと照合していない増加分（エントリID → (件数, 検出時刻)）
+        self.unclaimed: dict[int, tuple[int, float]] = {}
+        self.last_poll = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+
+class AuditLogFollower:
+    """監査ログの共有ポーラー"""
+
+    def __init__(self, interval: float = POLL_INTERVAL) -> None:
+        self.interval = interval
+        self._states: dict[int, _GuildAuditState] = {}
+        self.polls = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _targets(
+        entry: discord.AuditLogEntry,
+        action: discord.AuditLogAction,
+        target_id: int,
+        channel_id: Optional[int]
+    ) -> bool:
+        """エントリがイベントの対象と一致するか"""
+        if entry.action != action or getattr(entry.target, "id", None) != target_id:
+            return False
+        if channel_id is not None:
+            extra_channel = getattr(entry.extra, "channel", None)
+            if getattr(extra_channel, "id", None) != channel_id:
+                return False
+        return True
+
+    def _match(
+        self,
+        state: _GuildAuditState,
+        action: discord.AuditLogAction,
+        target_id: int,
+        channel_id: Optional[int]
+    ) -> Optional[discord.AuditLogEntry]:
+        """キャッシュからイベントに対応するエントリを探す"""
+        if action in GROUPED_ACTIONS:
+            return self._claim(state, action, target_id, channel_id)
+
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=MATCH_WINDOW)
+        for entry in reversed(state.entries.values()):
+            if entry.created_at < cutoff:
+                break
+            if self._targets(entry, action, target_id, channel_id):
+                return entry
+        return None
+
+    def _claim(
+        self,
+        state: _GuildAuditState,
+        action: discord.AuditLogAction,
+        target_id: int,
+        channel_id: Optional[int]
+    ) -> Optional[discord.AuditLogEntry]:
+        """
+        まとめられるエントリから、件数が増えたものを1件分照合済みにして返す
+
+        エントリの作成日時は最初の操作の時刻のため、時刻ではなく件数の増加で照合する。
+        増加のないエントリ（投稿者自身による削除など）には一致させない。
+        """
+        expired = time.monotonic() - MATCH_WINDOW
+        for entry_id, (remaining, detected) in reversed(state.unclaimed.items()):
+            if detected < expired:
+                continue
+            entry = state.entries.get(entry_id)
+            if entry is None or not self._targets(entry, action, target_id, channel_id):
+                continue
+            if remaining > 1:
+                state.unclaimed[entry_id] = (remaining - 1, detected)
+            else:
+                del state.unclaimed[entry_id]
+            return entry
+        return None
+
+    async def _fetch(self, guild: discord.Guild, state: _GuildAuditState) -> None:
+        """監査ログの直近のエントリを取得（既知のエントリは件数の増加を確認）"""
+        self.polls += 1
+        try:
+            entries = [entry async for entry in guild.audit_logs(limit=FETCH_LIMIT)]
+        except discord.Forbidden:
+            return
+        except discord.HTTPException as e:
+            logger.warning(f"監査ログ取得失敗: guild_id={guild.id} - {e}")
+            return
+
+        now = time.monotonic()
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=MATCH_WINDOW)
+        for entry in sorted(entries, key=lambda e: e.id):
+            state.entries[entry.id] = entry
+            if entry.action not in GROUPED_ACTIONS:
+                continue
+
+            count = getattr(entry.extra, "count", 1)
+            previous = state.counts.get(entry.id)
+            if previous is None:
+                # 初めて見るエントリは、作成直後のもののみ全件を新しい操作とみなす
+                increase = count if entry.created_at >= cutoff else 0
+            else:
+                increase = count - previous
+            state.counts[entry.id] = count
+            if increase > 0:
+                remaining = state.unclaimed.get(entry.id, (0, now))[0]
+                state.unclaimed[entry.id] = (remaining + increase, now)
+
+        # 古いエントリ・期限切れの増加分を破棄
+        while len(state.entries) > CACHE_SIZE:
+            oldest = next(iter(state.entries))
+            del state.entries[oldest]
+            state.counts.pop(oldest, None)
+            state.unclaimed.pop(oldest, None)
+        for entry_id in [i for i, (_, detected) in state.unclaimed.items() if detected < now - MATCH_WINDOW]:
+            del state.unclaimed[entry_id]
+
+    async def _poll(self, guild: discord.Guild, state: _GuildAuditState) -> None:
+        """間隔を守って監査ログを取得（同時に呼ばれた場合は1回の取得を共有）"""
+        if state.task and not state.task.done():
+            await asyncio.shield(state.task)
+            return
+
+        wait = state.last_poll + self.interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+            if state.task and not state.task.done():
+                await asyncio.shield(state.task)
+                return
+            if time.monotonic() - state.last_poll < self.interval:
+                return
+
+        state.last_poll = time.monotonic()
+        state.task = asyncio.create_task(self._fetch(guild, state))
+        await asyncio.shield(state.task)
+
+    async def find_entry(
+        self,
+        guild: discord.Guild,
+        action: discord.AuditLogAction,
+        target_id: int,
+        channel_id: Optional[int] = None,
+        attempts: int = 2
+    ) -> Optional[discord.AuditLogEntry]:
+        """
+        イベントに対応する監査ログエントリを取得
+
+        Args:
+            guild: サーバー
+            action: 監査ログのアクション
+            target_id: 対象（ユーザー・チャンネル・ロールなど）のID
+            channel_id: メッセージ削除の場合のチャンネルID
+            attempts: 見つからない場合に取得を待つ回数
+
+        Returns:
+            Optional[discord.AuditLogEntry]: 見つからない場合None
+        """
+        if not guild.me or not guild.me.guild_permissions.view_audit_log:
+            return None
+
+        state = self._states.get(guild.id)
+        if state is None:
+            state = self._states[guild.id] = _GuildAuditState()
+
+        entry = self._match(state, action, target_id, channel_id)
+        if entry:
+            self.hits += 1
+            return entry
+
+        # イベント直後は監査ログへの反映が遅れることがあるため、複数回取得を待つ
+        for _ in range(attempts):
+            await self._poll(guild, state)
+            entry = self._match(state, action, target_id, channel_id)
+            if entry:
+                self.hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    async def find_executor(
+        self,
+        guild: discord.Guild,
+        action: discord.AuditLogAction,
+        target_id: int,
+        channel_id: Optional[int] = None,
+        attempts: int = 2
+    ) -> Optional[str]:
+        """イベントの実行者をメンション文字列で取得"""
+        entry = await self.find_entry(guild, action, target_id, channel_id, attempts)
+        if entry and entry.user:
+            return f"{entry.user.mention}（{entry.user}）"
+        return None
+
+    def forget(self, guild_id: int) -> None:
+        """サーバーのキャッシュを破棄"""
+        state = self._states.pop(guild_id, None)
+        if state and state.task and not state.task.done():
+            state.task.cancel()
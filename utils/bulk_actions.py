@@ -0,0 +1,96 @@
+"""
+一括操作の実行器
+
+同じレート制限バケットを使う操作（同じサーバーへのキック・タイムアウトなど）を
+同時実行数を制限して実行する。429 を受けたら全ワーカーを一時停止して待機する。
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Iterable, Optional, TypeVar
+
+import discord
+
+from utils.logging import get_logger
+
+logger = get_logger("sumire.bulk_actions")
+
+T = TypeVar("T")
+
+# 429 を受けた場合の再試行回数
+MAX_RETRIES = 3
+
+
+class BulkExecutor(Generic[T]):
+    """同時実行数を制限した一括操作の実行器"""
+
+    def __init__(self, concurrency: int = 3) -> None:
+        self.concurrency = max(1, concurrency)
+        self._resume = asyncio.Event()
+        self._resume.set()
+
+        self.rate_limited = 0
+
+    async def _pause(self, seconds: float) -> None:
+        """全ワーカーを一時停止（同じバケットを使うため）"""
+        self.rate_limited += 1
+        if not self._resume.is_set():
+            await self._resume.wait()
+            return
+        self._resume.clear()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self._resume.set()
+
+    async def _run_one(
+        self,
+        item: T,
+        action: Callable[[T], Awaitable[None]],
+        on_error: Callable[[T, Exception], None]
+    ) -> None:
+        """1件実行（429は待機して再試行）"""
+        for attempt in range(MAX_RETRIES):
+            await self._resume.wait()
+            try:
+                await action(item)
+                return
+            except discord.RateLimited as e:
+                await self._pause(e.retry_after)
+            except discord.HTTPException as e:
+                if e.status != 429:
+                    on_error(item, e)
+                    return
+                await self._pause(2 ** attempt)
+            except Exception as e:
+                on_error(item, e)
+                return
+
+        on_error(item, RuntimeError("再試行上限に達しました"))
+
+    async def run(
+        self,
+        items: Iterable[T],
+        action: Callable[[T], Awaitable[None]],
+        on_error: Optional[Callable[[T, Exception], None]] = None
+    ) -> None:
+        """
+        全件を実行
+
+        Args:
+            items: 対象
+            action: 1件分の操作（成功時の集計は呼び出し側で行う）
+            on_error: 失敗時に呼ばれる関数
+        """
+        on_error = on_error or (lambda item, e: logger.warning(f"一括操作失敗: {item} - {e}"))
+        queue: asyncio.Queue[T] = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+
+        async def worker() -> None:
+            while not queue.empty():
+                item = queue.get_nowait()
+                await self._run_one(item, action, on_error)
+
+        workers = min(self.concurrency, queue.qsize())
+        await asyncio.gather(*(worker() for _ in range(workers)))
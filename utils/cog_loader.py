@@ -3,9 +3,12 @@ Cog読み込み管理
 """
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING
 
 from utils.logging import get_logger
+from utils.startup_profiler import StartupProfiler
 
 if TYPE_CHECKING:
     from discord.ext.commands import Bot
@@ -30,30 +33,57 @@ COGS = [
     "cogs.wordcounter",
 ]
 
+# Cogの依存関係（キーのCogは値のCogの読み込みが成功してから読み込む）
+# 記載のないCogは互いに独立しているため並行して読み込む
+#
+# 現在は依存関係がない: Cog間で共有する outbound・member_cache・spam_filter・rank_cards は
+# SumireBot.__init__ で作成済みで、get_cog で他のCogを参照するCogや、Botに属性を追加するCogもない
+# （logger と message_store はどちらも utility Cog 内）。追加する場合はここに記載する。
+COG_DEPENDENCIES: dict[str, tuple[str, ...]] = {}
+
 
 async def load_cogs(bot: Bot) -> tuple[int, int]:
     """
     全Cogを読み込む
 
+    互いに独立したCogは並行して読み込み、COG_DEPENDENCIES に記載された
+    Cogは依存先の読み込みが完了するまで待つ。
+    起動プロファイルのCogごとの時間は、他のCogの読み込みと重なった経過時間になる。
+
     Args:
         bot: Botインスタンス
 
     Returns:
         tuple[int, int]: (成功数, 失敗数)
     """
-    success_count = 0
-    fail_count = 0
+    profiler = StartupProfiler()
+    loaded: dict[str, asyncio.Future[bool]] = {
+        cog: asyncio.get_running_loop().create_future() for cog in COGS
+    }
 
-    for cog in COGS:
+    async def load(cog: str) -> bool:
+        ok = False
         try:
-            await bot.load_extension(cog)
-            logger.info(f"Cogを読み込みました: {cog}")
-            success_count += 1
-        except Exception as e:
-            logger.error(f"Cogの読み込みに失敗: {cog} - {e}")
-            fail_count += 1
-
-    return success_count, fail_count
+            for dependency in COG_DEPENDENCIES.get(cog, ()):
+                if dependency not in loaded or not await loaded[dependency]:
+                    logger.error(f"Cogの読み込みに失敗: {cog} - 依存Cog {dependency} が読み込まれていません")
+                    return False
+
+            start = time.perf_counter()
+            try:
+                await bot.load_extension(cog)
+                logger.info(f"Cogを読み込みました: {cog}")
+                ok = True
+            except Exception as e:
+                logger.error(f"Cogの読み込みに失敗: {cog} - {e}")
+            profiler.record_cog(cog, time.perf_counter() - start, ok)
+            return ok
+        finally:
+            loaded[cog].set_result(ok)
+
+    results = await asyncio.gather(*(load(cog) for cog in COGS))
+    success_count = sum(results)
+    return success_count, len(results) - success_count
 
 
 async def reload_cog(bot: Bot, cog_name: str) -> bool:
@@ -0,0 +1,80 @@
+"""
+スラッシュコマンド同期管理
+
+コマンドツリーをシリアライズしたハッシュを保存しておき、
+前回の同期から変更があった場合のみ同期する（同期はレート制限が厳しいため）。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Optional
+
+import discord
+
+from utils.database import Database
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from discord.ext.commands import Bot
+
+logger = get_logger("sumire.command_sync")
+
+# グローバルコマンドの scope
+GLOBAL_SCOPE = 0
+
+
+async def tree_hash(bot: Bot, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """
+    コマンドツリーのハッシュを計算
+
+    同期時に送信するペイロードと同じ内容をキー順に並べてハッシュする。
+    アプリケーションIDも含めるため、別のBotで同じDBを使った場合も同期される。
+    """
+    tree = bot.tree
+    commands = tree.get_commands(guild=guild)
+    translator = tree.translator
+    if translator:
+        payload = [await command.get_translated_payload(tree, translator) for command in commands]
+    else:
+        payload = [command.to_dict(tree) for command in commands]
+
+    payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+    serialized = json.dumps(
+        {"application_id": bot.application_id, "commands": payload},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+async def sync_commands(
+    bot: Bot,
+    guild: Optional[discord.abc.Snowflake] = None,
+    force: bool = False
+) -> Optional[int]:
+    """
+    変更がある場合のみコマンドを同期
+
+    Args:
+        bot: Botインスタンス
+        guild: 同期するサーバー（Noneでグローバル）
+        force: 変更がなくても同期する
+
+    Returns:
+        Optional[int]: 同期したコマンド数（変更がなくスキップした場合None）
+    """
+    db = Database()
+    scope = guild.id if guild else GLOBAL_SCOPE
+    current = await tree_hash(bot, guild)
+
+    if not force and await db.get_command_sync_hash(scope) == current:
+        logger.info(f"コマンドツリーに変更がないため同期をスキップしました (scope={scope})")
+        return None
+
+    synced = await bot.tree.sync(guild=guild)
+    await db.set_command_sync_hash(scope, current)
+    logger.info(f"コマンドを同期しました: {len(synced)} 個 (scope={scope})")
+    return len(synced)
@@ -99,6 +99,11 @@ class Config:
         """データベースファイルパス"""
         return self.get("database", "path", default="database/sumire.db")
 
+    @property
+    def database_busy_timeout(self) -> float:
+        """他のプロセスの書き込みを待つ時間（秒）"""
+        return self.get("database", "busy_timeout", default=10.0)
+
     # ログ設定
     @property
     def log_level(self) -> str:
@@ -115,6 +120,144 @@ class Config:
         """コンソール出力の有無"""
         return self.get("logging", "console", default=True)
 
+    @property
+    def log_rotation(self) -> str:
+        """ログファイルのローテーション（size / time / none）"""
+        return self.get("logging", "rotation", default="size")
+
+    @property
+    def log_max_bytes(self) -> int:
+        """rotation=size の場合のファイルサイズ上限（バイト）"""
+        return int(self.get("logging", "max_mb", default=10) * 1024 * 1024)
+
+    @property
+    def log_when(self) -> str:
+        """rotation=time の場合の切り替えタイミング"""
+        return self.get("logging", "when", default="midnight")
+
+    @property
+    def log_backup_count(self) -> int:
+        """残す古いログファイルの数"""
+        return self.get("logging", "backup_count", default=7)
+
+    @property
+    def log_json(self) -> bool:
+        """ログファイルをJSON形式で出力するか"""
+        return self.get("logging", "json", default=False)
+
+    @property
+    def log_debug_per_second(self) -> int:
+        """同じ箇所のDEBUGログを1秒あたり出力する件数（0で間引かない）"""
+        return self.get("logging", "debug_per_second", default=20)
+
+    # シャーディング・クラスター設定
+    @property
+    def shard_count(self) -> Optional[int]:
+        """シャード数（None で Discord の推奨数）"""
+        return self.get("sharding", "shard_count", default=1)
+
+    @property
+    def cluster_processes(self) -> int:
+        """クラスターランチャーで起動するプロセス数"""
+        return self.get("sharding", "processes", default=1)
+
+    @property
+    def cluster_ipc_port(self) -> int:
+        """ランチャーとクラスター間の通信ポート（127.0.0.1）"""
+        return self.get("sharding", "ipc_port", default=8790)
+
+    # キャッシュ設定
+    @property
+    def cache_profile(self) -> str:
+        """メンバー・メッセージキャッシュのプロファイル（full / balanced / minimal）"""
+        return self.get("cache", "profile", default="full")
+
+    # メトリクス設定
+    @property
+    def metrics_enabled(self) -> bool:
+        """Prometheus形式のメトリクスをHTTPで公開するか"""
+        return self.get("metrics", "enabled", default=False)
+
+    @property
+    def metrics_host(self) -> str:
+        """メトリクスの待ち受けアドレス"""
+        return self.get("metrics", "host", default="127.0.0.1")
+
+    @property
+    def metrics_port(self) -> int:
+        """メトリクスの待ち受けポート（クラスターごとに + クラスター番号）"""
+        return self.get("metrics", "port", default=9108)
+
+    # イベントループ監視設定
+    @property
+    def loop_block_threshold(self) -> float:
+        """イベントループのブロックとして警告する時間（秒）"""
+        return self.get("monitoring", "block_threshold", default=0.25)
+
+    @property
+    def asyncio_debug(self) -> bool:
+        """asyncio のデバッグモード（遅いコールバックをログに出す）"""
+        return self.get("monitoring", "asyncio_debug", default=False)
+
+    @property
+    def slow_callback_duration(self) -> float:
+        """asyncio デバッグモードで遅いコールバックとしてログに出す時間（秒）"""
+        return self.get("monitoring", "slow_callback_duration", default=0.1)
+
+    # メッセージストア設定
+    @property
+    def message_store_memory_mb(self) -> int:
+        """メッセージストアのメモリ上限（MB）"""
+        return self.get("message_store", "memory_mb", default=16)
+
+    @property
+    def message_store_ttl_hours(self) -> int:
+        """メッセージストアの保存期間（時間）"""
+        return self.get("message_store", "ttl_hours", default=168)
+
+    # 自動ロール・参加パイプライン設定
+    @property
+    def raid_join_threshold(self) -> int:
+        """レイドとみなす参加数（raid_window 秒以内）"""
+        return self.get("autorole", "raid_join_threshold", default=10)
+
+    @property
+    def raid_window(self) -> int:
+        """参加レートを数える時間幅（秒）"""
+        return self.get("autorole", "raid_window", default=10)
+
+    @property
+    def raid_cooldown(self) -> int:
+        """最後の大量参加からレイドモードを解除するまでの時間（秒）"""
+        return self.get("autorole", "raid_cooldown", default=300)
+
+    @property
+    def autorole_concurrency(self) -> int:
+        """ロール付与の同時実行数"""
+        return self.get("autorole", "concurrency", default=2)
+
+    # メッセージアーカイブ設定
+    @property
+    def archive_max_messages(self) -> int:
+        """メッセージアーカイブのサーバーごとの最大保存件数"""
+        return self.get("archive", "max_messages", default=500000)
+
+    @property
+    def archive_default_retention_days(self) -> int:
+        """メッセージアーカイブのデフォルト保存期間（日）"""
+        return self.get("archive", "default_retention_days", default=30)
+
+    # ランクカード設定
+    @property
+    def rank_card_workers(self) -> int:
+        """ランクカードを描画するプロセス数"""
+        return self.get("rank_card", "workers", default=2)
+
+    @property
+    def rank_card_font_path(self) -> str:
+        """ランクカードに使うフォントのパス（空欄で内蔵フォント）"""
+        return self.get("rank_card", "font_path", default="")
+
     # 翻訳設定
     @property
     def default_target_language(self) -> str:
@@ -159,6 +302,11 @@ class Config:
         """自動退出時間（秒）"""
         return self.get("music", "auto_leave_timeout", default=180)
 
+    @property
+    def music_snapshot_interval(self) -> int:
+        """セッションスナップショットの保存間隔（秒）"""
+        return self.get("music", "snapshot_interval", default=30)
+
     @property
     def spotify_client_id(self) -> str:
         """Spotify Client ID"""
@@ -8,7 +8,7 @@ Usage:
     await db.connect("path/to/db.sqlite")
     await db.add_user_xp(guild_id, user_id, 10)
 """
-from .core import DatabaseCore
+from .core import DatabaseCore, instrument_queries
 from .guild import GuildMixin
 from .logger import LoggerMixin
 from .persistent import PersistentViewMixin
@@ -21,6 +21,9 @@ from .poll import PollMixin
 from .star import StarMixin
 from .teamshuffle import TeamShuffleMixin
 from .wordcounter import WordCounterMixin
+from .message_store import MessageStoreMixin
+from .archive import ArchiveMixin
+from .command_sync import CommandSyncMixin
 
 
 class Database(
@@ -36,6 +39,9 @@ class Database(
     StarMixin,
     TeamShuffleMixin,
     WordCounterMixin,
+    MessageStoreMixin,
+    ArchiveMixin,
+    CommandSyncMixin,
     DatabaseCore,  # 最後に配置（MRO対策）
 ):
     """
@@ -59,4 +65,6 @@ class Database(
     pass
 
 
+instrument_queries(Database)
+
 __all__ = ["Database"]
@@ -0,0 +1,232 @@
+"""
+メッセージアーカイブ関連のデータベース操作
+"""
+from __future__ import annotations
+
+import json
+import time
+from typing import Optional, TYPE_CHECKING
+
+from utils.metrics import cache_lookup
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+# trigram トークナイザで索引検索できる最小文字数
+TRIGRAM_MIN_LENGTH = 3
+
+
+class ArchiveMixin:
+    """メッセージアーカイブ関連のデータベース操作"""
+
+    _db: aiosqlite.Connection
+
+    # アーカイブ設定のキャッシュ（全メッセージで参照されるため）
+    _archive_settings_cache: dict[int, Optional[dict]] = {}
+
+    async def get_archive_settings(self, guild_id: int) -> Optional[dict]:
+        """アーカイブ設定を取得（キャッシュ付き）"""
+        if guild_id in self._archive_settings_cache:
+            cache_lookup("archive_settings", True)
+            return self._archive_settings_cache[guild_id]
+        cache_lookup("archive_settings", False)
+
+        async with self._db.execute(
+            "SELECT * FROM archive_settings WHERE guild_id = ?",
+            (guild_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            result = dict(row) if row else None
+
+        self._archive_settings_cache[guild_id] = result
+        return result
+
+    async def set_archive_settings(self, guild_id: int, enabled: bool, retention_days: int) -> None:
+        """アーカイブ設定を保存"""
+        await self._db.execute("""
+            INSERT INTO archive_settings (guild_id, enabled, retention_days)
+            VALUES (?, ?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET
+                enabled = excluded.enabled,
+                retention_days = excluded.retention_days
+        """, (guild_id, int(enabled), retention_days))
+        await self._commit()
+        self._archive_settings_cache.pop(guild_id, None)
+
+    async def archive_messages(self, rows: list[tuple]) -> None:
+        """
+        メッセージをまとめてアーカイブ
+
+        Args:
+            rows: (message_id, guild_id, channel_id, author_id, author_name,
+                   content, created_at) のリスト
+        """
+        if not rows:
+            return
+        await self._db.executemany("""
+            INSERT INTO message_archive (
+                message_id, guild_id, channel_id, author_id, author_name,
+                content, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(message_id) DO UPDATE SET
+                content = excluded.content
+        """, rows)
+        await self._commit()
+
+    async def update_archived_messages(self, rows: list[tuple[str, int]]) -> None:
+        """アーカイブ済みメッセージの内容を更新（(content, message_id) のリスト）"""
+        if not rows:
+            return
+        await self._db.executemany(
+            "UPDATE message_archive SET content = ? WHERE message_id = ?",
+            rows
+        )
+        await self._commit()
+
+    async def delete_archived_messages(self, message_ids: list[int]) -> None:
+        """アーカイブ済みメッセージを削除"""
+        if not message_ids:
+            return
+        await self._db.executemany(
+            "DELETE FROM message_archive WHERE message_id = ?",
+            [(message_id,) for message_id in message_ids]
+        )
+        await self._commit()
+
+    async def clear_archive(self, guild_id: int) -> int:
+        """サーバーのアーカイブをすべて削除"""
+        cursor = await self._db.execute(
+            "DELETE FROM message_archive WHERE guild_id = ?",
+            (guild_id,)
+        )
+        await self._commit()
+        return cursor.rowcount
+
+    async def search_archive(
+        self,
+        guild_id: int,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        author_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        excluded_channels: Optional[list[int]] = None
+    ) -> list[dict]:
+        """
+        アーカイブを全文検索（関連度順）
+
+        Args:
+            guild_id: サーバーID
+            query: 検索語（フレーズとして扱う。3文字未満は部分一致）
+            limit: 取得件数
+            offset: 取得開始位置
+            author_id: 投稿者で絞り込み
+            channel_id: チャンネルで絞り込み
+            excluded_channels: 除外するチャンネルID
+
+        Returns:
+            list[dict]: 検索結果
+        """
+        conditions = ["a.guild_id = ?"]
+        params: list = [guild_id]
+
+        if author_id is not None:
+            conditions.append("a.author_id = ?")
+            params.append(author_id)
+        if channel_id is not None:
+            conditions.append("a.channel_id = ?")
+            params.append(channel_id)
+        if excluded_channels:
+            # 非公開スレッドの多いサーバーでは件数がバインド変数の上限を超えるため、JSON配列1つで渡す
+            conditions.append("a.channel_id NOT IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(excluded_channels))
+
+        if len(query) >= TRIGRAM_MIN_LENGTH:
+            phrase = '"' + query.replace('"', '""') + '"'
+            sql = f"""
+                SELECT a.*
+                FROM message_archive_fts
+                JOIN message_archive a ON a.message_id = message_archive_fts.rowid
+                WHERE message_archive_fts MATCH ? AND {" AND ".join(conditions)}
+                ORDER BY message_archive_fts.rank, a.created_at DESC
+                LIMIT ? OFFSET ?
+            """
+            params.insert(0, phrase)
+        else:
+            # trigram は3文字未満を索引できないため、新しい順の部分一致で検索
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            sql = f"""
+                SELECT a.*
+                FROM message_archive a
+                WHERE {" AND ".join(conditions)} AND a.content LIKE ? ESCAPE '\\'
+                ORDER BY a.created_at DESC
+                LIMIT ? OFFSET ?
+            """
+            params.append(pattern)
+
+        params.extend([limit, offset])
+        async with self._db.execute(sql, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    async def purge_archive(self, max_messages: int) -> int:
+        """
+        保存期間・件数の上限を超えたアーカイブを削除
+
+        Args:
+            max_messages: サーバーごとの最大保存件数
+
+        Returns:
+            int: 削除件数
+        """
+        now = int(time.time())
+        purged = 0
+
+        # 無効化されたサーバーのアーカイブ
+        cursor = await self._db.execute("""
+            DELETE FROM message_archive
+            WHERE guild_id NOT IN (SELECT guild_id FROM archive_settings WHERE enabled = 1)
+        """)
+        purged += cursor.rowcount
+
+        async with self._db.execute(
+            "SELECT guild_id, retention_days FROM archive_settings WHERE enabled = 1"
+        ) as cursor:
+            guilds = await cursor.fetchall()
+
+        for row in guilds:
+            # 保存期間
+            cursor = await self._db.execute(
+                "DELETE FROM message_archive WHERE guild_id = ? AND created_at < ?",
+                (row["guild_id"], now - row["retention_days"] * 86400)
+            )
+            purged += cursor.rowcount
+
+            # 件数上限（古いものから削除）
+            cursor = await self._db.execute("""
+                DELETE FROM message_archive
+                WHERE guild_id = ? AND created_at < (
+                    SELECT created_at FROM message_archive
+                    WHERE guild_id = ?
+                    ORDER BY created_at DESC
+                    LIMIT 1 OFFSET ?
+                )
+            """, (row["guild_id"], row["guild_id"], max_messages))
+            purged += cursor.rowcount
+
+        await self._commit()
+        return purged
+
+    async def optimize_archive(self, pages: int) -> None:
+        """
+        全文検索インデックスを少しずつ統合（インクリメンタル optimize）
+
+        一度に全体を optimize すると長時間ロックするため、
+        merge コマンドで指定ページ数ずつセグメントを統合する。
+        """
+        await self._db.execute(
+            "INSERT INTO message_archive_fts(message_archive_fts, rank) VALUES ('merge', ?)",
+            (pages,)
+        )
+        await self._commit()
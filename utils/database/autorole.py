@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
+from utils.metrics import cache_lookup
+
 if TYPE_CHECKING:
     import aiosqlite
 
@@ -14,16 +16,25 @@ class AutoroleMixin:
 
     _db: aiosqlite.Connection
 
+    # 自動ロール設定のキャッシュ（参加ごとに参照されるため）
+    _autorole_settings_cache: dict[int, Optional[dict]] = {}
+
     async def get_autorole_settings(self, guild_id: int) -> Optional[dict]:
-        """自動ロール設定を取得"""
+        """自動ロール設定を取得（キャッシュ付き）"""
+        if guild_id in self._autorole_settings_cache:
+            cache_lookup("autorole_settings", True)
+            return self._autorole_settings_cache[guild_id]
+        cache_lookup("autorole_settings", False)
+
         async with self._db.execute(
             "SELECT * FROM autorole_settings WHERE guild_id = ?",
             (guild_id,)
         ) as cursor:
             row = await cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            result = dict(row) if row else None
+
+        self._autorole_settings_cache[guild_id] = result
+        return result
 
     async def set_autorole(
         self,
@@ -52,6 +63,7 @@ class AutoroleMixin:
             """, (guild_id, human_role_id, bot_role_id, 1 if enabled is None else (1 if enabled else 0)))
 
         await self._commit()
+        self._autorole_settings_cache.pop(guild_id, None)
 
     async def clear_autorole(self, guild_id: int, role_type: str) -> None:
         """自動ロール設定をクリア（human または bot）"""
@@ -66,3 +78,4 @@ class AutoroleMixin:
                 (guild_id,)
             )
         await self._commit()
+        self._autorole_settings_cache.pop(guild_id, None)
@@ -0,0 +1,40 @@
+"""
+スラッシュコマンド同期状態関連のデータベース操作
+"""
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+
+class CommandSyncMixin:
+    """スラッシュコマンド同期状態関連のデータベース操作"""
+
+    _db: aiosqlite.Connection
+
+    async def get_command_sync_hash(self, scope: int) -> Optional[str]:
+        """
+        最後に同期したコマンドツリーのハッシュを取得
+
+        Args:
+            scope: 0でグローバル、それ以外はサーバーID
+        """
+        async with self._db.execute(
+            "SELECT tree_hash FROM command_sync_state WHERE scope = ?",
+            (scope,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            return row["tree_hash"] if row else None
+
+    async def set_command_sync_hash(self, scope: int, tree_hash: str) -> None:
+        """同期したコマンドツリーのハッシュを保存"""
+        await self._db.execute("""
+            INSERT INTO command_sync_state (scope, tree_hash, synced_at)
+            VALUES (?, ?, strftime('%s', 'now'))
+            ON CONFLICT(scope) DO UPDATE SET
+                tree_hash = excluded.tree_hash,
+                synced_at = excluded.synced_at
+        """, (scope, tree_hash))
+        await self._commit()
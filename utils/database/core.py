@@ -4,36 +4,161 @@
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+import time
 import aiosqlite
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, AsyncIterator
+from typing import Any, Callable, Optional, AsyncIterator
+
+from utils.metrics import registry
+from utils.startup_profiler import StartupProfiler
+
+# Mixinのメソッドごとの所要時間（キャッシュから返した場合も含む）
+QUERY_SECONDS = registry.histogram(
+    "sumire_db_query_seconds",
+    "データベース操作の所要時間",
+    ("mixin", "method")
+)
+
+
+def _timed(func: Callable[..., Any], mixin: str) -> Callable[..., Any]:
+    # 呼ばれていないメソッドは公開しないよう、初回呼び出し時にラベルを作る
+    child = None
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal child
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            if child is None:
+                child = QUERY_SECONDS.labels(mixin, func.__name__)
+            child.observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+def instrument_queries(cls: type) -> type:
+    """
+    Mixinの公開コルーチンメソッドを所要時間の計測付きに置き換える
+
+    Database の定義後に1回だけ呼ぶ（DatabaseCore の接続管理は対象外）。
+    """
+    wrapped: set[str] = set()
+    for base in cls.__mro__[1:]:
+        if base in (DatabaseCore, object):
+            continue
+        for name, func in vars(base).items():
+            if name.startswith("_") or name in wrapped or not inspect.iscoroutinefunction(func):
+                continue
+            setattr(cls, name, _timed(func, base.__name__))
+            wrapped.add(name)
+    return cls
+
+
+class _Statement:
+    """
+    書き込みロックを取って実行する文
+
+    aiosqlite の execute と同様に、await と async with の両方で使える。
+    """
+
+    def __init__(self, core: DatabaseCore, method: Callable[..., Any], *args: Any) -> None:
+        self._core = core
+        self._method = method
+        self._args = args
+        self._cursor: Optional[aiosqlite.Cursor] = None
+
+    async def _run(self) -> aiosqlite.Cursor:
+        async with self._core._statement_slot():
+            return await self._method(*self._args)
+
+    def __await__(self):
+        return self._run().__await__()
+
+    async def __aenter__(self) -> aiosqlite.Cursor:
+        self._cursor = await self._run()
+        return self._cursor
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._cursor.close()
+
+
+class _SerializedConnection:
+    """
+    文の実行を書き込みロックの下で行う aiosqlite.Connection のラッパー
+
+    接続は全タスクで共有しているため、他のタスクのトランザクション中に実行された文は
+    そのトランザクションに含まれ、rollback されると一緒に失われる。
+    トランザクション中は開始したタスク以外の文を終了まで待たせる（それ以外は並行して実行する）。
+    execute 以外の属性は元の接続にそのまま委譲する。
+    """
+
+    def __init__(self, connection: aiosqlite.Connection, core: DatabaseCore) -> None:
+        self._connection = connection
+        self._core = core
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def execute(self, sql: str, parameters: Any = None) -> _Statement:
+        return _Statement(self._core, self._connection.execute, sql, parameters)
+
+    def executemany(self, sql: str, parameters: Any) -> _Statement:
+        return _Statement(self._core, self._connection.executemany, sql, parameters)
+
+    def executescript(self, script: str) -> _Statement:
+        return _Statement(self._core, self._connection.executescript, script)
 
 
 class DatabaseCore:
     """データベース接続とトランザクション管理（シングルトン）"""
 
     _instance: Optional[DatabaseCore] = None
-    _db: Optional[aiosqlite.Connection] = None
-    _in_transaction: bool = False
+    _db: Optional[_SerializedConnection] = None
+    # 実行中のトランザクションを開始したタスク（このタスクの文と _commit はロックを取らずにまとめる）
+    _transaction_task: Optional[asyncio.Task] = None
+    # トランザクションと commit をプロセス内で1つずつ実行するためのロック
+    _write_lock: Optional[asyncio.Lock] = None
+    # トランザクション中でない間セットされる（他のタスクの文はセットされるまで待つ）
+    _no_transaction: Optional[asyncio.Event] = None
+    # 実行中の文の数と、それが0の間セットされるイベント（トランザクションは0になるまで待って開始する）
+    _statements_running: int = 0
+    _statements_idle: Optional[asyncio.Event] = None
 
     def __new__(cls) -> DatabaseCore:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    async def connect(self, db_path: str) -> None:
-        """データベースに接続"""
+    async def connect(self, db_path: str, busy_timeout: float = 10.0) -> None:
+        """
+        データベースに接続
+
+        Args:
+            db_path: データベースファイルのパス
+            busy_timeout: 他のプロセス（クラスター）が書き込み中の場合に待つ時間（秒）
+        """
         path = Path(db_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._db = await aiosqlite.connect(db_path)
-        self._db.row_factory = aiosqlite.Row
+        connection = await aiosqlite.connect(db_path, timeout=busy_timeout)
+        connection.row_factory = aiosqlite.Row
+        self._db = _SerializedConnection(connection, self)
+        self._no_transaction = asyncio.Event()
+        self._no_transaction.set()
+        self._statements_idle = asyncio.Event()
+        self._statements_idle.set()
 
         # WALモード有効化（読み書き並列可能、ロック競合軽減）
         await self._db.execute("PRAGMA journal_mode=WAL")
 
-        await self._init_tables()
+        with StartupProfiler().phase("db.init_tables"):
+            await self._init_tables()
 
     async def close(self) -> None:
         """データベース接続を閉じる"""
@@ -53,24 +178,74 @@ class DatabaseCore:
                 await db.add_reaction_given(...)
             # ここで自動commit
         """
-        self._in_transaction = True
+        task = asyncio.current_task()
+        # 同じタスク内の入れ子は外側のトランザクションにまとめる
+        if self._transaction_task is task:
+            yield
+            return
+
+        # 同じ接続を共有する他のタスクのトランザクションと重ならないよう、プロセス内では1つずつ実行する
+        # （プロセス間は BEGIN IMMEDIATE と busy_timeout で待つ）
+        async with self._get_write_lock():
+            # 他のタスクの文がトランザクションに混ざらないよう、新しい文を止めて実行中の文の完了を待つ
+            self._no_transaction.clear()
+            self._transaction_task = task
+            try:
+                await self._statements_idle.wait()
+                # ロック待ちの間に他のタスクが実行した commit 前の書き込みは、
+                # このトランザクションの rollback で失われないよう先に確定する
+                if self._db.in_transaction:
+                    await self._db.commit()
+                # 読み取りから始まるトランザクションは、他のプロセスが先に書き込むと
+                # 書き込みへの昇格時に待たずに失敗するため、最初に書き込みロックを取る
+                await self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    yield
+                    await self._db.commit()
+                except BaseException:
+                    await self._db.rollback()
+                    raise
+            finally:
+                self._transaction_task = None
+                self._no_transaction.set()
+
+    def _get_write_lock(self) -> asyncio.Lock:
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        return self._write_lock
+
+    def _in_own_transaction(self) -> bool:
+        return self._transaction_task is not None and self._transaction_task is asyncio.current_task()
+
+    @asynccontextmanager
+    async def _statement_slot(self) -> AsyncIterator[None]:
+        """他のタスクのトランザクション中は、その終了を待ってから文を実行する"""
+        if self._in_own_transaction():
+            yield
+            return
+        # 待っている間に次のトランザクションが始まることがあるため、実行直前に確認し直す
+        while not self._no_transaction.is_set():
+            await self._no_transaction.wait()
+        self._statements_running += 1
+        self._statements_idle.clear()
         try:
             yield
-            await self._db.commit()
-        except Exception:
-            await self._db.rollback()
-            raise
         finally:
-            self._in_transaction = False
-
-    async def _commit_if_not_in_transaction(self) -> None:
-        """トランザクション外の場合のみcommit"""
-        if not self._in_transaction:
-            await self._db.commit()
+            self._statements_running -= 1
+            if self._statements_running == 0:
+                self._statements_idle.set()
 
     async def _commit(self) -> None:
-        """内部用commit（トランザクション対応）"""
-        await self._commit_if_not_in_transaction()
+        """
+        内部用commit（トランザクション対応）
+
+        トランザクションを開始したタスクからの場合はまとめて commit されるため何もしない。
+        他のタスクのトランザクション中は、その終了を待ってから commit する。
+        """
+        if self._in_own_transaction():
+            return
+        async with self._get_write_lock():
+            await self._db.commit()
 
     async def _init_tables(self) -> None:
         """テーブルを初期化"""
@@ -135,6 +310,29 @@ class DatabaseCore:
                 music_channel_id INTEGER
             );
 
+            -- 削除・編集ログ用のメッセージストア（ログ有効サーバーのみ）
+            CREATE TABLE IF NOT EXISTS message_store (
+                message_id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                author_id INTEGER NOT NULL,
+                author_name TEXT,
+                content TEXT,
+                attachments TEXT,
+                created_at INTEGER NOT NULL
+            );
+
+            -- 音楽セッションのスナップショット（再起動後の再開用）
+            CREATE TABLE IF NOT EXISTS music_sessions (
+                guild_id INTEGER PRIMARY KEY,
+                voice_channel_id INTEGER NOT NULL,
+                current_track TEXT,
+                position INTEGER DEFAULT 0,
+                loop_mode TEXT DEFAULT 'off',
+                queue TEXT DEFAULT '[]',
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
             -- 自動ロール設定（サーバーごと）
             CREATE TABLE IF NOT EXISTS autorole_settings (
                 guild_id INTEGER PRIMARY KEY,
@@ -150,6 +348,23 @@ class DatabaseCore:
                 ignored_channels TEXT DEFAULT '[]'
             );
 
+            -- レベル報酬ロール（レベル到達で付与）
+            CREATE TABLE IF NOT EXISTS level_roles (
+                guild_id INTEGER NOT NULL,
+                role_id INTEGER NOT NULL,
+                level INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, role_id)
+            );
+
+            -- XP倍率（チャンネル・ロールごと）
+            CREATE TABLE IF NOT EXISTS xp_multipliers (
+                guild_id INTEGER NOT NULL,
+                target_id INTEGER NOT NULL,
+                target_type TEXT NOT NULL,
+                multiplier REAL NOT NULL,
+                PRIMARY KEY (guild_id, target_id)
+            );
+
             -- ユーザーレベルデータ
             CREATE TABLE IF NOT EXISTS user_levels (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -250,6 +465,54 @@ class DatabaseCore:
                 UNIQUE(guild_id, user_id, word)
             );
 
+            -- メッセージアーカイブ設定（サーバーごとにオプトイン）
+            CREATE TABLE IF NOT EXISTS archive_settings (
+                guild_id INTEGER PRIMARY KEY,
+                enabled INTEGER DEFAULT 0,
+                retention_days INTEGER DEFAULT 30
+            );
+
+            -- メッセージアーカイブ（検索用）
+            CREATE TABLE IF NOT EXISTS message_archive (
+                message_id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                author_id INTEGER NOT NULL,
+                author_name TEXT,
+                content TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            );
+
+            -- メッセージアーカイブの全文検索インデックス（日本語対応のため trigram）
+            CREATE VIRTUAL TABLE IF NOT EXISTS message_archive_fts USING fts5(
+                content,
+                content='message_archive',
+                content_rowid='message_id',
+                tokenize='trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS message_archive_ai AFTER INSERT ON message_archive BEGIN
+                INSERT INTO message_archive_fts(rowid, content) VALUES (new.message_id, new.content);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS message_archive_ad AFTER DELETE ON message_archive BEGIN
+                INSERT INTO message_archive_fts(message_archive_fts, rowid, content)
+                VALUES ('delete', old.message_id, old.content);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS message_archive_au AFTER UPDATE OF content ON message_archive BEGIN
+                INSERT INTO message_archive_fts(message_archive_fts, rowid, content)
+                VALUES ('delete', old.message_id, old.content);
+                INSERT INTO message_archive_fts(rowid, content) VALUES (new.message_id, new.content);
+            END;
+
+            -- スラッシュコマンドの同期状態（scope 0 がグローバル、それ以外はサーバーID）
+            CREATE TABLE IF NOT EXISTS command_sync_state (
+                scope INTEGER PRIMARY KEY,
+                tree_hash TEXT NOT NULL,
+                synced_at INTEGER
+            );
+
             -- パフォーマンス向上用インデックス
             CREATE INDEX IF NOT EXISTS idx_user_levels_guild_user ON user_levels(guild_id, user_id);
             CREATE INDEX IF NOT EXISTS idx_user_levels_ranking ON user_levels(guild_id, level DESC, xp DESC);
@@ -258,12 +521,15 @@ class DatabaseCore:
             CREATE INDEX IF NOT EXISTS idx_polls_active ON polls(ended, end_time);
             CREATE INDEX IF NOT EXISTS idx_star_messages_guild ON star_messages(guild_id, star_count DESC);
             CREATE INDEX IF NOT EXISTS idx_wordcounter_guild_word ON wordcounter_counts(guild_id, word, count DESC);
+            CREATE INDEX IF NOT EXISTS idx_message_store_created ON message_store(created_at);
+            CREATE INDEX IF NOT EXISTS idx_message_archive_guild_created ON message_archive(guild_id, created_at);
         """)
         await self._db.commit()
 
         # 既存テーブルにカラムを追加（マイグレーション）
         await self._migrate_user_levels_reactions()
         await self._migrate_star_weekly_report()
+        await self._migrate_logger_digest()
 
     async def _migrate_user_levels_reactions(self) -> None:
         """user_levelsテーブルにリアクションカラムを追加（既存DB用マイグレーション）"""
@@ -300,3 +566,13 @@ class DatabaseCore:
             await self._db.commit()
         except Exception:
             pass
+
+    async def _migrate_logger_digest(self) -> None:
+        """logger_settingsテーブルにダイジェスト用カラムを追加（既存DB用マイグレーション）"""
+        try:
+            await self._db.execute(
+                "ALTER TABLE logger_settings ADD COLUMN digest_window INTEGER DEFAULT 0"
+            )
+            await self._db.commit()
+        except Exception:
+            pass
@@ -6,17 +6,67 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from utils.metrics import cache_lookup
 
 if TYPE_CHECKING:
     import aiosqlite
 
 
+class XpRules:
+    """
+    サーバーごとのXP獲得ルール（設定変更時にコンパイル）
+
+    メッセージごとの判定はメモリ上の frozenset と dict の参照のみで行う。
+    """
+
+    __slots__ = ("enabled", "ignored_channels", "channel_multipliers", "role_multipliers")
+
+    def __init__(
+        self,
+        enabled: bool,
+        ignored_channels: frozenset[int],
+        channel_multipliers: dict[int, float],
+        role_multipliers: dict[int, float]
+    ) -> None:
+        self.enabled = enabled
+        self.ignored_channels = ignored_channels
+        self.channel_multipliers = channel_multipliers
+        self.role_multipliers = role_multipliers
+
+    def multiplier_for(self, channel_id: int, parent_id: Optional[int], role_ids: Iterable[int]) -> float:
+        """
+        XP倍率を計算（0の場合はXPなし）
+
+        チャンネル倍率（スレッドは親チャンネルも参照）と、
+        所持ロールの中で最も高い倍率を掛け合わせる。
+        """
+        if not self.enabled:
+            return 0.0
+        if channel_id in self.ignored_channels or parent_id in self.ignored_channels:
+            return 0.0
+
+        multiplier = self.channel_multipliers.get(
+            channel_id, self.channel_multipliers.get(parent_id, 1.0)
+        )
+        if self.role_multipliers:
+            role_multiplier = max(
+                (self.role_multipliers[r] for r in role_ids if r in self.role_multipliers),
+                default=1.0
+            )
+            multiplier *= role_multiplier
+        return multiplier
+
+
 class LevelingMixin:
     """レベリングシステム関連のデータベース操作"""
 
     _db: aiosqlite.Connection
 
+    # コンパイル済みXP獲得ルールのキャッシュ（メッセージごとに参照されるため）
+    _xp_rules_cache: dict[int, XpRules] = {}
+
     # ==================== レベル設定 ====================
 
     async def get_leveling_settings(self, guild_id: int) -> Optional[dict]:
@@ -41,6 +91,7 @@ class LevelingMixin:
                 enabled = excluded.enabled
         """, (guild_id, 1 if enabled else 0))
         await self._commit()
+        self._xp_rules_cache.pop(guild_id, None)
 
     async def add_ignored_channel(self, guild_id: int, channel_id: int) -> None:
         """レベルシステムの除外チャンネルを追加"""
@@ -56,6 +107,7 @@ class LevelingMixin:
                     ignored_channels = excluded.ignored_channels
             """, (guild_id, json.dumps(ignored)))
             await self._commit()
+            self._xp_rules_cache.pop(guild_id, None)
 
     async def remove_ignored_channel(self, guild_id: int, channel_id: int) -> None:
         """レベルシステムの除外チャンネルを削除"""
@@ -71,6 +123,134 @@ class LevelingMixin:
                 (json.dumps(ignored), guild_id)
             )
             await self._commit()
+            self._xp_rules_cache.pop(guild_id, None)
+
+    # ==================== XP倍率 ====================
+
+    async def get_xp_multipliers(self, guild_id: int) -> list[dict]:
+        """XP倍率の設定を取得"""
+        async with self._db.execute(
+            "SELECT target_id, target_type, multiplier FROM xp_multipliers WHERE guild_id = ? ORDER BY target_type, multiplier DESC",
+            (guild_id,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    async def set_xp_multiplier(
+        self,
+        guild_id: int,
+        target_id: int,
+        target_type: str,
+        multiplier: float
+    ) -> None:
+        """XP倍率を設定（target_type: "channel" または "role"）"""
+        await self._db.execute("""
+            INSERT INTO xp_multipliers (guild_id, target_id, target_type, multiplier)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(guild_id, target_id) DO UPDATE SET
+                target_type = excluded.target_type,
+                multiplier = excluded.multiplier
+        """, (guild_id, target_id, target_type, multiplier))
+        await self._commit()
+        self._xp_rules_cache.pop(guild_id, None)
+
+    async def remove_xp_multiplier(self, guild_id: int, target_id: int) -> bool:
+        """XP倍率を削除"""
+        cursor = await self._db.execute(
+            "DELETE FROM xp_multipliers WHERE guild_id = ? AND target_id = ?",
+            (guild_id, target_id)
+        )
+        await self._commit()
+        self._xp_rules_cache.pop(guild_id, None)
+        return cursor.rowcount > 0
+
+    async def get_xp_rules(self, guild_id: int) -> XpRules:
+        """コンパイル済みのXP獲得ルールを取得（設定変更まではDBを参照しない）"""
+        rules = self._xp_rules_cache.get(guild_id)
+        cache_lookup("xp_rules", rules is not None)
+        if rules is not None:
+            return rules
+
+        settings = await self.get_leveling_settings(guild_id)
+        multipliers = await self.get_xp_multipliers(guild_id)
+
+        rules = XpRules(
+            enabled=bool(settings.get("enabled", 1)) if settings else True,
+            ignored_channels=frozenset(settings.get("ignored_channels", [])) if settings else frozenset(),
+            channel_multipliers={
+                m["target_id"]: m["multiplier"] for m in multipliers if m["target_type"] == "channel"
+            },
+            role_multipliers={
+                m["target_id"]: m["multiplier"] for m in multipliers if m["target_type"] == "role"
+            }
+        )
+        self._xp_rules_cache[guild_id] = rules
+        return rules
+
+    # ==================== レベル報酬ロール ====================
+
+    # レベル報酬ロールのキャッシュ（レベルアップごとに参照されるため）
+    _level_roles_cache: dict[int, list[dict]] = {}
+
+    async def get_level_roles(self, guild_id: int) -> list[dict]:
+        """レベル報酬ロールを取得（レベル順、キャッシュ付き）"""
+        if guild_id in self._level_roles_cache:
+            cache_lookup("level_roles", True)
+            return self._level_roles_cache[guild_id]
+        cache_lookup("level_roles", False)
+
+        async with self._db.execute(
+            "SELECT role_id, level FROM level_roles WHERE guild_id = ? ORDER BY level, role_id",
+            (guild_id,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            result = [dict(row) for row in rows]
+
+        self._level_roles_cache[guild_id] = result
+        return result
+
+    async def set_level_role(self, guild_id: int, level: int, role_id: int) -> None:
+        """レベル報酬ロールを設定"""
+        await self._db.execute("""
+            INSERT INTO level_roles (guild_id, role_id, level)
+            VALUES (?, ?, ?)
+            ON CONFLICT(guild_id, role_id) DO UPDATE SET
+                level = excluded.level
+        """, (guild_id, role_id, level))
+        await self._commit()
+        self._level_roles_cache.pop(guild_id, None)
+
+    async def remove_level_role(self, guild_id: int, role_id: int) -> bool:
+        """レベル報酬ロールを削除"""
+        cursor = await self._db.execute(
+            "DELETE FROM level_roles WHERE guild_id = ? AND role_id = ?",
+            (guild_id, role_id)
+        )
+        await self._commit()
+        self._level_roles_cache.pop(guild_id, None)
+        return cursor.rowcount > 0
+
+    async def get_user_levels_after(
+        self,
+        guild_id: int,
+        after_user_id: int,
+        limit: int,
+        min_level: int = 1
+    ) -> list[dict]:
+        """
+        ユーザーレベルを user_id 順に取得（キーセットページネーション）
+
+        OFFSET を使わず、前のチャンクの最後の user_id から続きを読むため、
+        何チャンク目でも (guild_id, user_id) インデックスで直接シークできる。
+        """
+        async with self._db.execute("""
+            SELECT user_id, level FROM user_levels
+            WHERE guild_id = ? AND user_id > ? AND level >= ?
+            ORDER BY user_id
+            LIMIT ?
+        """, (guild_id, after_user_id, min_level, limit)) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
 
     # ==================== ユーザーレベル ====================
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
+from utils.metrics import cache_lookup
+
 if TYPE_CHECKING:
     import aiosqlite
 
@@ -14,16 +16,25 @@ class LoggerMixin:
 
     _db: aiosqlite.Connection
 
+    # ログ設定のキャッシュ（全イベントで参照されるため）
+    _logger_settings_cache: dict[int, Optional[dict]] = {}
+
     async def get_logger_settings(self, guild_id: int) -> Optional[dict]:
-        """ログ設定を取得"""
+        """ログ設定を取得（キャッシュ付き）"""
+        if guild_id in self._logger_settings_cache:
+            cache_lookup("logger_settings", True)
+            return self._logger_settings_cache[guild_id]
+        cache_lookup("logger_settings", False)
+
         async with self._db.execute(
             "SELECT * FROM logger_settings WHERE guild_id = ?",
             (guild_id,)
         ) as cursor:
             row = await cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            result = dict(row) if row else None
+
+        self._logger_settings_cache[guild_id] = result
+        return result
 
     async def set_logger_channel(self, guild_id: int, channel_id: int) -> None:
         """ログチャンネルを設定"""
@@ -35,6 +46,7 @@ class LoggerMixin:
                 enabled = 1
         """, (guild_id, channel_id))
         await self._commit()
+        self._logger_settings_cache.pop(guild_id, None)
 
     async def disable_logger(self, guild_id: int) -> None:
         """ログを無効化"""
@@ -43,6 +55,16 @@ class LoggerMixin:
             (guild_id,)
         )
         await self._commit()
+        self._logger_settings_cache.pop(guild_id, None)
+
+    async def set_logger_digest(self, guild_id: int, window: int) -> None:
+        """ダイジェストの集計時間（秒）を設定（0で無効）"""
+        await self._db.execute(
+            "UPDATE logger_settings SET digest_window = ? WHERE guild_id = ?",
+            (window, guild_id)
+        )
+        await self._commit()
+        self._logger_settings_cache.pop(guild_id, None)
 
     async def update_logger_settings(
         self,
@@ -76,3 +98,4 @@ class LoggerMixin:
                 params
             )
             await self._commit()
+            self._logger_settings_cache.pop(guild_id, None)
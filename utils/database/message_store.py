@@ -0,0 +1,67 @@
+"""
+メッセージストア関連のデータベース操作
+"""
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+
+class MessageStoreMixin:
+    """メッセージストア関連のデータベース操作"""
+
+    _db: aiosqlite.Connection
+
+    async def store_messages(self, rows: list[tuple]) -> None:
+        """
+        メッセージをまとめて保存
+
+        Args:
+            rows: (message_id, guild_id, channel_id, author_id, author_name,
+                   content, attachments, created_at) のリスト
+        """
+        if not rows:
+            return
+        await self._db.executemany("""
+            INSERT INTO message_store (
+                message_id, guild_id, channel_id, author_id, author_name,
+                content, attachments, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(message_id) DO UPDATE SET
+                content = excluded.content,
+                attachments = excluded.attachments
+        """, rows)
+        await self._commit()
+
+    async def get_stored_message(self, message_id: int) -> Optional[dict]:
+        """保存されたメッセージを取得"""
+        async with self._db.execute(
+            "SELECT * FROM message_store WHERE message_id = ?",
+            (message_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
+
+    async def delete_stored_messages(self, message_ids: list[int]) -> None:
+        """保存されたメッセージを削除"""
+        if not message_ids:
+            return
+        await self._db.executemany(
+            "DELETE FROM message_store WHERE message_id = ?",
+            [(message_id,) for message_id in message_ids]
+        )
+        await self._commit()
+
+    async def purge_stored_messages(self, before: int) -> int:
+        """保存期間を過ぎたメッセージを削除"""
+        cursor = await self._db.execute(
+            "DELETE FROM message_store WHERE created_at < ?",
+            (before,)
+        )
+        await self._commit()
+        return cursor.rowcount
@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import json
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,3 +35,55 @@ class MusicMixin:
                 default_volume = excluded.default_volume
         """, (guild_id, volume))
         await self._commit()
+
+    # ==================== セッション永続化 ====================
+
+    async def save_music_sessions(self, sessions: list[dict]) -> None:
+        """音楽セッションのスナップショットをまとめて保存"""
+        if not sessions:
+            return
+        await self._db.executemany("""
+            INSERT INTO music_sessions (
+                guild_id, voice_channel_id, current_track, position, loop_mode, queue, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(guild_id) DO UPDATE SET
+                voice_channel_id = excluded.voice_channel_id,
+                current_track = excluded.current_track,
+                position = excluded.position,
+                loop_mode = excluded.loop_mode,
+                queue = excluded.queue,
+                updated_at = CURRENT_TIMESTAMP
+        """, [
+            (
+                s["guild_id"],
+                s["voice_channel_id"],
+                s["current_track"],
+                s["position"],
+                s["loop_mode"],
+                json.dumps(s["queue"]),
+            )
+            for s in sessions
+        ])
+        await self._commit()
+
+    async def get_music_sessions(self) -> list[dict]:
+        """保存されている音楽セッションを全て取得"""
+        async with self._db.execute("SELECT * FROM music_sessions") as cursor:
+            rows = await cursor.fetchall()
+            results = []
+            for row in rows:
+                result = dict(row)
+                result["queue"] = json.loads(result.get("queue") or "[]")
+                results.append(result)
+            return results
+
+    async def delete_music_sessions(self, guild_ids: list[int]) -> None:
+        """音楽セッションのスナップショットを削除"""
+        if not guild_ids:
+            return
+        await self._db.executemany(
+            "DELETE FROM music_sessions WHERE guild_id = ?",
+            [(guild_id,) for guild_id in guild_ids]
+        )
+        await self._commit()
@@ -60,3 +60,11 @@ class PersistentViewMixin:
             (message_id,)
         )
         await self._commit()
+
+    async def delete_persistent_views(self, message_ids: list[int]) -> None:
+        """永続的Viewをまとめて削除"""
+        await self._db.executemany(
+            "DELETE FROM persistent_views WHERE message_id = ?",
+            [(message_id,) for message_id in message_ids]
+        )
+        await self._commit()
@@ -0,0 +1,228 @@
+"""
+クラスター間通信（ランチャー ⇔ 各クラスタープロセス）
+
+ランチャーが 127.0.0.1 で待ち受け、各クラスターが接続する。
+メッセージは1行1件のJSONで、以下の op を使う。
+
+クラスター → ランチャー:
+    identify  接続時の認証（cluster_id と起動時に渡された secret）
+    ready     全シャードの準備完了（ランチャーは次のクラスターを起動する）
+    request   他のクラスターへのイベント送信（ランチャーが返信をまとめて response で返す）
+    reply     受け取った event への返信
+    control   ランチャーへの操作（restart / shutdown）
+
+ランチャー → クラスター:
+    event     他のクラスターからのイベント（登録したハンドラーで処理して reply を返す）
+    response  request への返信（クラスターIDごと）
+    close     Botを終了して指定の終了コードで終了する
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from discord.ext.commands import Bot
+
+logger = get_logger("sumire.ipc")
+
+# 認証用の secret を渡す環境変数
+SECRET_ENV = "SUMIRE_IPC_SECRET"
+
+# 1メッセージの最大サイズ
+MAX_MESSAGE_SIZE = 1024 * 1024
+
+# request の返信を待つ時間（秒）
+REQUEST_TIMEOUT = 15.0
+
+# ランチャーへの再接続間隔（秒）
+RECONNECT_DELAY = 3.0
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[dict[str, Any]]:
+    """1件読み込み（接続が閉じられた場合None）"""
+    try:
+        line = await reader.readline()
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+        return None
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError:
+        logger.warning("不正なIPCメッセージを破棄しました")
+        return {}
+    return message if isinstance(message, dict) else {}
+
+
+async def write_message(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    """1件書き込み"""
+    writer.write(json.dumps(message, ensure_ascii=False, default=str).encode() + b"\n")
+    await writer.drain()
+
+
+class ClusterClient:
+    """クラスタープロセス側のIPCクライアント"""
+
+    def __init__(self, bot: Bot, cluster_id: int, port: int, secret: str) -> None:
+        self.bot = bot
+        self.cluster_id = cluster_id
+        self.port = port
+        self._secret = secret
+        self._handlers: dict[str, Handler] = {}
+        self._pending: dict[int, asyncio.Future] = {}
+        self._nonces = itertools.count(1)
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._ready_sent = False
+
+    @property
+    def connected(self) -> bool:
+        """ランチャーに接続しているか"""
+        return self._connected.is_set()
+
+    def register(self, event: str, handler: Handler) -> None:
+        """イベントハンドラーを登録（戻り値が送信元への返信になる）"""
+        self._handlers[event] = handler
+
+    def start(self) -> None:
+        """接続タスクを開始（切断時は再接続する）"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(
+                    "127.0.0.1", self.port, limit=MAX_MESSAGE_SIZE
+                )
+            except OSError as e:
+                logger.warning(f"ランチャーに接続できません: {e}")
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+
+            self._writer = writer
+            try:
+                await write_message(writer, {
+                    "op": "identify",
+                    "cluster_id": self.cluster_id,
+                    "secret": self._secret,
+                })
+                if self._ready_sent:
+                    await write_message(writer, {"op": "ready"})
+                self._connected.set()
+                logger.info(f"ランチャーに接続しました (cluster={self.cluster_id})")
+
+                while (message := await read_message(reader)) is not None:
+                    await self._dispatch(message)
+            except ConnectionError:
+                pass
+            finally:
+                self._connected.clear()
+                self._writer = None
+                writer.close()
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(ConnectionError("ランチャーとの接続が切れました"))
+                self._pending.clear()
+
+            logger.warning("ランチャーとの接続が切れました。再接続します")
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        op = message.get("op")
+        if op == "event":
+            asyncio.create_task(self._handle_event(message))
+        elif op == "response":
+            future = self._pending.pop(message.get("nonce"), None)
+            if future is not None and not future.done():
+                future.set_result({int(k): v for k, v in message.get("replies", {}).items()})
+        elif op == "close":
+            code = int(message.get("code", 0))
+            logger.info(f"ランチャーから終了要求を受けました (code={code})")
+            asyncio.create_task(self.bot.request_exit(code))
+
+    async def _handle_event(self, message: dict[str, Any]) -> None:
+        event = message.get("event")
+        handler = self._handlers.get(event)
+        if handler is None:
+            result: Any = {"error": f"未登録のイベント: {event}"}
+        else:
+            try:
+                result = await handler(message.get("data"))
+            except Exception as e:
+                logger.error(f"IPCイベント処理エラー: {event} - {e}", exc_info=True)
+                result = {"error": str(e)}
+
+        await self._send({
+            "op": "reply",
+            "origin": message.get("origin"),
+            "nonce": message.get("nonce"),
+            "data": result,
+        })
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        if self._writer is None:
+            raise ConnectionError("ランチャーに接続していません")
+        await write_message(self._writer, message)
+
+    async def request(
+        self,
+        event: str,
+        data: Any = None,
+        include_self: bool = False,
+        timeout: float = REQUEST_TIMEOUT
+    ) -> dict[int, Any]:
+        """
+        他のクラスターにイベントを送り、返信を待つ
+
+        Args:
+            event: イベント名
+            data: JSONにできるデータ
+            include_self: 自分自身にも送る
+            timeout: 返信を待つ時間（秒）。ランチャー側でも同じ時間で打ち切る
+
+        Returns:
+            dict[int, Any]: クラスターID → 返信（時間内に返信のなかったクラスターは含まない）
+        """
+        nonce = next(self._nonces)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = future
+        try:
+            await self._send({
+                "op": "request",
+                "nonce": nonce,
+                "event": event,
+                "data": data,
+                "include_self": include_self,
+                "timeout": timeout,
+            })
+            return await asyncio.wait_for(future, timeout=timeout + 5)
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def control(self, action: str) -> None:
+        """ランチャーに操作を要求（restart / shutdown）"""
+        await self._send({"op": "control", "action": action})
+
+    async def notify_ready(self) -> None:
+        """全シャードの準備完了を通知"""
+        self._ready_sent = True
+        if self._writer is not None:
+            await self._send({"op": "ready"})
+
+    async def close(self) -> None:
+        """接続を閉じる"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
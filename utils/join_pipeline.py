@@ -0,0 +1,165 @@
+"""
+メンバー参加パイプライン
+
+参加レートをスライディングウィンドウで計測してレイド（大量参加）を検知し、
+自動ロールの付与は同時実行数を制限したワーカーでまとめて処理する。
+ロール付与キューはレベル報酬ロールの付与でも使用する。
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+import discord
+
+from utils.logging import get_logger
+
+logger = get_logger("sumire.join_pipeline")
+
+# ロール付与キューの上限（超えた分は破棄）
+MAX_PENDING_GRANTS = 5000
+
+# 429 を受けた場合の再試行回数
+MAX_RETRIES = 3
+
+
+class JoinRateWindow:
+    """サーバーごとの参加数をスライディングウィンドウで数える"""
+
+    __slots__ = ("window", "_joins")
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._joins: deque[float] = deque()
+
+    def record(self, now: Optional[float] = None) -> int:
+        """参加を記録し、ウィンドウ内の参加数を返す"""
+        now = time.monotonic() if now is None else now
+        self._joins.append(now)
+        cutoff = now - self.window
+        while self._joins and self._joins[0] < cutoff:
+            self._joins.popleft()
+        return len(self._joins)
+
+
+class RoleGrantQueue:
+    """同時実行数を制限したロール付与キュー"""
+
+    def __init__(self, concurrency: int = 2, label: str = "AutoRole") -> None:
+        self.concurrency = max(1, concurrency)
+        self.label = label
+        self._queue: asyncio.Queue[tuple[discord.Member, list[discord.Role], str]] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+
+        self.granted = 0
+        self.dropped = 0
+        self.failed = 0
+        self.rate_limited = 0
+
+    @property
+    def pending(self) -> int:
+        """付与待ちの件数"""
+        return self._queue.qsize()
+
+    def submit(self, member: discord.Member, roles: list[discord.Role], reason: str) -> bool:
+        """
+        ロール付与をキューに追加（複数ロールは1リクエストで付与）
+
+        Returns:
+            bool: キューに追加できた場合True
+        """
+        if self._queue.qsize() >= MAX_PENDING_GRANTS:
+            self.dropped += 1
+            return False
+
+        self._queue.put_nowait((member, roles, reason))
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._run_worker()))
+        return True
+
+    def discard_guild(self, guild_id: int) -> int:
+        """サーバーの付与待ちを破棄（レイド検知時）"""
+        kept = []
+        discarded = 0
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            self._queue.task_done()
+            if item[0].guild.id == guild_id:
+                discarded += 1
+            else:
+                kept.append(item)
+        for item in kept:
+            self._queue.put_nowait(item)
+        self.dropped += discarded
+        return discarded
+
+    async def _run_worker(self) -> None:
+        """キューが空になるまで付与"""
+        while not self._queue.empty():
+            member, roles, reason = self._queue.get_nowait()
+            try:
+                await self._grant(member, roles, reason)
+            finally:
+                self._queue.task_done()
+
+    async def _grant(self, member: discord.Member, roles: list[discord.Role], reason: str) -> None:
+        """1件付与（429は待機して再試行）"""
+        # 待っている間に退出・付与済みになった場合はスキップ
+        # （キャッシュを絞ったプロファイルでは未キャッシュのことがあるため、受け取ったメンバーで付与を試みる）
+        current = member.guild.get_member(member.id)
+        if current is None:
+            if member.guild.chunked:
+                return
+            current = member
+        missing = [role for role in roles if not current.get_role(role.id)]
+        if not missing:
+            return
+
+        names = ", ".join(role.name for role in missing)
+        for attempt in range(MAX_RETRIES):
+            try:
+                await current.add_roles(*missing, reason=reason)
+                self.granted += 1
+                logger.info(f"{self.label}: {names} を {current} に付与")
+                return
+            except discord.RateLimited as e:
+                self.rate_limited += 1
+                await asyncio.sleep(e.retry_after)
+            except discord.Forbidden:
+                self.failed += 1
+                logger.error(f"{self.label}: ロール付与権限なし role={names}, member={current}")
+                return
+            except discord.NotFound:
+                return
+            except discord.HTTPException as e:
+                if e.status != 429:
+                    self.failed += 1
+                    logger.error(f"{self.label}: ロール付与エラー: {e}")
+                    return
+                self.rate_limited += 1
+                await asyncio.sleep(2 ** attempt)
+
+        self.failed += 1
+        logger.warning(f"{self.label}: 再試行上限に達しました role={names}, member={current}")
+
+    def stats(self) -> dict[str, int]:
+        """付与統計"""
+        return {
+            "pending": self.pending,
+            "granted": self.granted,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+        }
+
+    async def close(self) -> None:
+        """ワーカーを停止して付与待ちを破棄"""
+        for task in self._workers:
+            task.cancel()
+        self._workers.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
@@ -1,46 +1,184 @@
 """
 ロギングシステムの設定
+
+ログの書き込み（ファイル・コンソール）は QueueListener の別スレッドで行い、
+イベントループのスレッドではキューに積むだけにする。
 """
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 書き込みスレッド（setup_logging で作成）
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """1行1件のJSON形式"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = record.stack_info
+        return json.dumps(data, ensure_ascii=False)
+
+
+class DebugSampler(logging.Filter):
+    """
+    同じ箇所から大量に出るDEBUGログを間引く
+
+    呼び出し箇所（ファイルと行）ごとに1秒あたり per_second 件まで通し、
+    超えた分は破棄して、次の秒の最初のログに省略した件数を付ける。
+    """
+
+    def __init__(self, per_second: int) -> None:
+        super().__init__()
+        self.per_second = per_second
+        # (ファイル, 行) → [秒, 通した件数, 省略した件数]
+        self._windows: dict[tuple[str, int], list[int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+
+        key = (record.pathname, record.lineno)
+        second = int(record.created)
+        window = self._windows.get(key)
+        if window is None or window[0] != second:
+            suppressed = window[2] if window else 0
+            self._windows[key] = [second, 1, 0]
+            if suppressed:
+                record.msg = f"{record.msg}（同じログを {suppressed} 件省略）"
+            return True
+
+        if window[1] < self.per_second:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """例外のトレースバックを書き込み側のフォーマッターに残したままキューに積む"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # メッセージの組み立てだけ行い、フォーマットは書き込みスレッドで行う
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _file_handler(
+    log_path: Path,
+    rotation: str,
+    max_bytes: int,
+    when: str,
+    backup_count: int
+) -> logging.Handler:
+    """ローテーション設定に応じたファイルハンドラー"""
+    if rotation == "size":
+        return logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    if rotation == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            log_path, when=when, backupCount=backup_count, encoding="utf-8"
+        )
+    return logging.FileHandler(log_path, encoding="utf-8")
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    console: bool = True
+    console: bool = True,
+    rotation: str = "size",
+    max_bytes: int = 10 * 1024 * 1024,
+    when: str = "midnight",
+    backup_count: int = 7,
+    json_format: bool = False,
+    debug_per_second: int = 0
 ) -> logging.Logger:
-    """ロギングを設定"""
+    """
+    ロギングを設定
+
+    Args:
+        level: ログレベル
+        log_file: ログファイルのパス（Noneでファイルに出力しない）
+        console: コンソールにも出力する
+        rotation: ファイルのローテーション（size / time / none）
+        max_bytes: rotation=size の場合のファイルサイズ上限
+        when: rotation=time の場合の切り替えタイミング（TimedRotatingFileHandler の when）
+        backup_count: 残す古いファイルの数
+        json_format: ファイルに1行1件のJSONで出力する（コンソールは通常の形式）
+        debug_per_second: 同じ箇所のDEBUGログを1秒あたりこの件数まで出力（0で間引かない）
+    """
+    global _listener, _queue_handler
+
     logger = logging.getLogger("sumire")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
+    # 再設定の場合は前の書き込みスレッドを止める
+    stop_logging()
+
     # フォーマッター
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+        datefmt=DATE_FORMAT
     )
 
+    handlers: list[logging.Handler] = []
+
     # コンソールハンドラー
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # ファイルハンドラー
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(
-            log_path,
-            encoding="utf-8"
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler = _file_handler(log_path, rotation, max_bytes, when, backup_count)
+        file_handler.setFormatter(JsonFormatter() if json_format else formatter)
+        handlers.append(file_handler)
+
+    # 呼び出し元のスレッドではキューに積むだけにし、書き込みは別スレッドで行う
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = _QueueHandler(log_queue)
+    if debug_per_second > 0:
+        _queue_handler.addFilter(DebugSampler(debug_per_second))
+    logger.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # discord.pyのログを設定
     discord_logger = logging.getLogger("discord")
@@ -49,6 +187,24 @@ def setup_logging(
     return logger
 
 
+def stop_logging() -> None:
+    """書き込みスレッドを停止（キューに残っているログは書き出してから止まる）"""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger("sumire").removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# 終了時にキューに残っているログを書き出す
+atexit.register(stop_logging)
+
+
 def get_logger(name: str = "sumire") -> logging.Logger:
     """ロガーを取得"""
     return logging.getLogger(name)
@@ -0,0 +1,184 @@
+"""
+イベントループの遅延監視
+
+イベントループ上のタスクが一定間隔でハートビートを更新し、別スレッドがそれを監視する。
+ハートビートが閾値を超えて止まった場合はループが同期処理でブロックされているため、
+ブロック中にメインスレッドのスタックを取得し、どのコルーチンが原因かをログに出す。
+
+config.yaml の monitoring.asyncio_debug を有効にすると、asyncio のデバッグモードで
+slow_callback_duration を超えたコールバックも asyncio がログに出す（オーバーヘッドが大きいため調査時のみ）。
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from types import FrameType
+from typing import NamedTuple, Optional
+
+from utils.logging import get_logger
+from utils.metrics import registry
+
+logger = get_logger("sumire.loop_monitor")
+
+# ハートビートの間隔（秒）
+HEARTBEAT_INTERVAL = 0.5
+
+# ログに出すスタックの深さ
+STACK_LIMIT = 15
+
+# 保持するブロック検出の件数
+HISTORY_SIZE = 20
+
+# 保持する遅延の件数（HEARTBEAT_INTERVAL ごとに1件、直近5分）
+LAG_HISTORY_SIZE = 600
+
+# イベントループの遅延（sleep が予定より遅れて戻った時間）
+LOOP_LAG_SECONDS = registry.histogram(
+    "sumire_event_loop_lag_seconds",
+    "イベントループのスケジューリング遅延",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+# ブロックを検出した回数（coroutine: ブロック中に実行されていたコルーチン）
+LOOP_BLOCKS = registry.counter(
+    "sumire_event_loop_blocks_total",
+    "イベントループのブロックを検出した回数",
+    ("coroutine",)
+)
+
+
+class BlockReport(NamedTuple):
+    """ブロック検出時の記録"""
+
+    timestamp: float
+    duration: float
+    coroutine: str
+    stack: str
+
+
+def _coroutine_frames(frame: Optional[FrameType]) -> list[FrameType]:
+    """スタック上のコルーチンのフレーム（内側から順）"""
+    frames = []
+    while frame is not None:
+        if frame.f_code.co_flags & inspect.CO_COROUTINE:
+            frames.append(frame)
+        frame = frame.f_back
+    return frames
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({code.co_filename}:{frame.f_lineno})"
+
+
+class LoopWatchdog:
+    """イベントループの遅延を計測し、ブロックを検出したらスタックを記録する"""
+
+    def __init__(self, threshold: float = 0.25, interval: float = HEARTBEAT_INTERVAL) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.last_lag = 0.0
+        self.history: deque[BlockReport] = deque(maxlen=HISTORY_SIZE)
+        self.lags: deque[float] = deque(maxlen=LAG_HISTORY_SIZE)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._reported = False
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """監視を開始（イベントループのスレッドから呼ぶ）"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._beat())
+        self._thread = threading.Thread(target=self._watch, name="sumire-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """監視を停止"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._thread = None
+
+    def enable_debug(self, slow_callback_duration: float) -> None:
+        """asyncio のデバッグモードを有効化（遅いコールバックを asyncio がログに出す）"""
+        loop = asyncio.get_running_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = slow_callback_duration
+
+        # asyncio のログを Bot のログと同じ出力先に出す
+        asyncio_logger = logging.getLogger("asyncio")
+        asyncio_logger.setLevel(logging.WARNING)
+        for handler in get_logger().handlers:
+            if handler not in asyncio_logger.handlers:
+                asyncio_logger.addHandler(handler)
+        logger.info(f"asyncio デバッグモードを有効化しました（slow_callback_duration={slow_callback_duration}秒）")
+
+    async def _beat(self) -> None:
+        """ハートビートを更新し、sleep の遅れを遅延として記録"""
+        while True:
+            scheduled = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self.last_lag = max(0.0, now - scheduled)
+            LOOP_LAG_SECONDS.observe(self.last_lag)
+            self.lags.append(self.last_lag)
+
+            if self._reported:
+                self._reported = False
+                if self.history:
+                    self.history[-1] = self.history[-1]._replace(duration=self.last_lag)
+                logger.warning(f"イベントループのブロックが解消しました（遅延 {self.last_lag:.2f} 秒）")
+
+    def _watch(self) -> None:
+        """ハートビートを監視（別スレッド）"""
+        poll = min(self.interval, self.threshold) / 2
+        while not self._stop.wait(poll):
+            loop = self._loop
+            if loop is None or loop.is_closed() or not loop.is_running():
+                continue
+
+            stalled = time.monotonic() - self._heartbeat - self.interval
+            if stalled >= self.threshold and not self._reported:
+                self._report(stalled)
+                self._reported = True
+
+    def _report(self, stalled: float) -> None:
+        """ブロック中のメインスレッドのスタックを記録"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        coroutines = _coroutine_frames(frame)
+        if coroutines:
+            # 最も内側のコルーチン（同期処理を呼び出している箇所）と、その呼び出し元
+            names = [getattr(f.f_code, "co_qualname", f.f_code.co_name) for f in coroutines]
+            coroutine = names[0]
+            summary = _frame_name(coroutines[0])
+            if len(names) > 1:
+                summary += f"（呼び出し元: {' ← '.join(names[1:])}）"
+        else:
+            coroutine = "callback"
+            summary = "コルーチン外のコールバック"
+
+        stack = "".join(traceback.format_stack(frame, limit=STACK_LIMIT)) if frame else ""
+        del frame, coroutines
+
+        LOOP_BLOCKS.labels(coroutine).inc()
+        self.history.append(BlockReport(time.time(), stalled, coroutine, stack))
+        logger.warning(
+            f"イベントループが {stalled:.2f} 秒以上ブロックされています: {summary}\n{stack}".rstrip()
+        )
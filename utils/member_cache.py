@@ -0,0 +1,180 @@
+"""
+メンバーキャッシュのプロファイルと取得ヘルパー
+
+discord.py のデフォルトでは全サーバーの全メンバーを起動時にチャンクしてメモリに保持する。
+サーバー数が多い場合はメモリと起動時間を大きく消費するため、config.yaml の
+cache.profile でキャッシュ方針を選べるようにする。
+
+キャッシュを絞ったプロファイルでは guild.get_member が None を返すことがあるため、
+メンバーが必要な処理は MemberCache を通して取得する（キャッシュ → API の順に取得し、
+全メンバーが必要な場合はそのサーバーだけ初回にチャンクする）。
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import NamedTuple, Optional
+
+import discord
+
+from utils.logging import get_logger
+
+logger = get_logger("sumire.member_cache")
+
+# query_members で一度に取得できるIDの上限
+QUERY_BATCH_SIZE = 100
+
+
+class CacheProfile(NamedTuple):
+    """メンバーキャッシュのプロファイル"""
+
+    name: str
+    # VC参加中のメンバーをキャッシュ（音楽・VC時間の計測に必要なため全プロファイルで有効）
+    voice: bool
+    # 参加・更新イベントを受けたメンバーをキャッシュ
+    joined: bool
+    # 起動時に全サーバーのメンバーをチャンクする
+    chunk_guilds_at_startup: bool
+    # discord.py のメッセージキャッシュ件数（None で無効。ログはメッセージストアを使う）
+    max_messages: Optional[int]
+
+    def member_cache_flags(self) -> discord.MemberCacheFlags:
+        """discord.py に渡す MemberCacheFlags"""
+        return discord.MemberCacheFlags(voice=self.voice, joined=self.joined)
+
+
+CACHE_PROFILES: dict[str, CacheProfile] = {
+    # 従来通り全メンバーを保持（小規模向け）
+    "full": CacheProfile("full", voice=True, joined=True, chunk_guilds_at_startup=True, max_messages=1000),
+    # 起動時にチャンクせず、参加・更新・VC・必要になったサーバーのメンバーのみ保持
+    "balanced": CacheProfile("balanced", voice=True, joined=True, chunk_guilds_at_startup=False, max_messages=200),
+    # VC参加中のメンバーのみ保持（大規模向け）
+    "minimal": CacheProfile("minimal", voice=True, joined=False, chunk_guilds_at_startup=False, max_messages=None),
+}
+
+DEFAULT_PROFILE = "full"
+
+
+def get_profile(name: str) -> CacheProfile:
+    """プロファイルを取得（不明な名前はデフォルト）"""
+    profile = CACHE_PROFILES.get(name)
+    if profile is None:
+        logger.warning(f"不明なキャッシュプロファイル: {name}（{DEFAULT_PROFILE} を使用します）")
+        profile = CACHE_PROFILES[DEFAULT_PROFILE]
+    return profile
+
+
+def _chunk_timeout(guild: discord.Guild) -> float:
+    """チャンクの待機時間（discord.py と同じく1万人あたり1秒、最低でも10秒）"""
+    return max(10.0, (guild.member_count or 0) / 10000)
+
+
+class MemberCache:
+    """キャッシュにないメンバーを API・チャンクで補う取得ヘルパー"""
+
+    def __init__(self, profile: CacheProfile) -> None:
+        self.profile = profile
+        self.hits = 0
+        self.fetched = 0
+        self.queried = 0
+        self.chunked = 0
+
+    async def get_member(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """
+        メンバーを取得（キャッシュになければ API から取得）
+
+        Returns:
+            Optional[discord.Member]: メンバー（サーバーにいない・取得に失敗した場合None）
+        """
+        member = guild.get_member(user_id)
+        if member is not None:
+            self.hits += 1
+            return member
+
+        # チャンク済みのサーバーでキャッシュにない場合はサーバーにいない
+        if guild.chunked:
+            return None
+
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+        except discord.HTTPException as e:
+            logger.warning(f"メンバー取得エラー: {user_id} in {guild.name} - {e}")
+            return None
+
+        self.fetched += 1
+        return member
+
+    async def get_members(self, guild: discord.Guild, user_ids: list[int]) -> dict[int, discord.Member]:
+        """
+        複数のメンバーをまとめて取得（キャッシュにない分は100件ずつゲートウェイに問い合わせる）
+
+        Returns:
+            dict[int, discord.Member]: ユーザーID → メンバー（見つからなかったIDは含まない）
+        """
+        found: dict[int, discord.Member] = {}
+        missing: list[int] = []
+        for user_id in dict.fromkeys(user_ids):
+            member = guild.get_member(user_id)
+            if member is not None:
+                found[user_id] = member
+            else:
+                missing.append(user_id)
+
+        self.hits += len(found)
+        if not missing or guild.chunked:
+            return found
+
+        if len(missing) == 1:
+            member = await self.get_member(guild, missing[0])
+            if member is not None:
+                found[member.id] = member
+            return found
+
+        for i in range(0, len(missing), QUERY_BATCH_SIZE):
+            batch = missing[i:i + QUERY_BATCH_SIZE]
+            try:
+                members = await guild.query_members(
+                    user_ids=batch,
+                    limit=len(batch),
+                    cache=self.profile.joined
+                )
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                logger.warning(f"メンバー一括取得エラー: {guild.name} - {e!r}")
+                continue
+            self.queried += len(members)
+            for member in members:
+                found[member.id] = member
+        return found
+
+    async def members(self, guild: discord.Guild) -> list[discord.Member]:
+        """
+        サーバーの全メンバーを取得（未チャンクのサーバーは初回にチャンクする）
+
+        同じサーバーへの同時要求は discord.py 側で1回にまとめられる。
+        joined が無効なプロファイルではチャンク結果をキャッシュしないため、毎回チャンクする。
+        """
+        if guild.chunked:
+            return guild.members
+
+        try:
+            members = await asyncio.wait_for(
+                guild.chunk(cache=self.profile.joined),
+                timeout=_chunk_timeout(guild)
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"メンバーのチャンクがタイムアウトしました: {guild.name}（キャッシュ済みのメンバーのみ使用）")
+            return guild.members
+
+        self.chunked += 1
+        logger.debug(f"メンバーをチャンクしました: {guild.name} ({len(members)} 人)")
+        return members
+
+    def stats(self) -> dict[str, int]:
+        """取得統計"""
+        return {
+            "hits": self.hits,
+            "fetched": self.fetched,
+            "queried": self.queried,
+            "chunked": self.chunked,
+        }
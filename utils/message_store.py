@@ -0,0 +1,202 @@
+"""
+削除・編集ログ用のコンパクトなメッセージストア
+
+discord.py のメッセージキャッシュ（Message オブジェクト全体）の代わりに、
+ログに必要な最小限の情報だけをメモリ上限付きのリングバッファに保持し、
+SQLite へまとめて書き出す。古いメッセージは保存期間を過ぎたら削除する。
+"""
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+import discord
+
+from utils.logging import get_logger
+from utils.metrics import cache_lookup
+
+if TYPE_CHECKING:
+    from utils.database import Database
+
+logger = get_logger("sumire.message_store")
+
+# 1件あたりの固定オーバーヘッド（タプル・整数・辞書エントリ）の概算バイト数
+ENTRY_OVERHEAD = 200
+
+# この件数溜まったら定期書き出しを待たずに書き出す
+FLUSH_THRESHOLD = 500
+
+
+class StoredMessage(NamedTuple):
+    """保存されたメッセージ"""
+
+    message_id: int
+    guild_id: int
+    channel_id: int
+    author_id: int
+    author_name: str
+    content: str
+    attachments: str
+    created_at: int
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> StoredMessage:
+        """Message から作成"""
+        return cls(
+            message_id=message.id,
+            guild_id=message.guild.id,
+            channel_id=message.channel.id,
+            author_id=message.author.id,
+            author_name=str(message.author),
+            content=message.content or "",
+            attachments="\n".join(a.filename for a in message.attachments),
+            created_at=int(message.created_at.timestamp()),
+        )
+
+    @classmethod
+    def from_row(cls, row: dict) -> StoredMessage:
+        """データベースの行から作成"""
+        return cls(
+            message_id=row["message_id"],
+            guild_id=row["guild_id"],
+            channel_id=row["channel_id"],
+            author_id=row["author_id"],
+            author_name=row["author_name"] or "",
+            content=row["content"] or "",
+            attachments=row["attachments"] or "",
+            created_at=row["created_at"],
+        )
+
+    @property
+    def size(self) -> int:
+        """メモリ使用量の概算（バイト）"""
+        return (
+            ENTRY_OVERHEAD
+            + sys.getsizeof(self.content)
+            + sys.getsizeof(self.attachments)
+            + sys.getsizeof(self.author_name)
+        )
+
+
+class MessageStore:
+    """メモリ上限付きリングバッファ + SQLite のメッセージストア"""
+
+    def __init__(self, db: Database, max_bytes: int, ttl_seconds: int) -> None:
+        self.db = db
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._ring: OrderedDict[int, StoredMessage] = OrderedDict()
+        self._bytes = 0
+        self._pending: dict[int, StoredMessage] = {}
+        self._deleted: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    @property
+    def memory_bytes(self) -> int:
+        """リングバッファのメモリ使用量の概算"""
+        return self._bytes
+
+    @property
+    def needs_flush(self) -> bool:
+        """書き出し待ちが閾値を超えているか"""
+        return len(self._pending) + len(self._deleted) >= FLUSH_THRESHOLD
+
+    def _remember(self, stored: StoredMessage) -> None:
+        """リングバッファに追加（上限を超えたら古いものから破棄）"""
+        old = self._ring.pop(stored.message_id, None)
+        if old:
+            self._bytes -= old.size
+        self._ring[stored.message_id] = stored
+        self._bytes += stored.size
+
+        while self._bytes > self.max_bytes and self._ring:
+            _, evicted = self._ring.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def add(self, stored: StoredMessage) -> None:
+        """メッセージを追加（書き出しは flush でまとめて行う）"""
+        self._remember(stored)
+        self._pending[stored.message_id] = stored
+        self._deleted.discard(stored.message_id)
+
+    async def get(self, message_id: int) -> Optional[StoredMessage]:
+        """メッセージを取得（メモリ → データベースの順）"""
+        if message_id in self._deleted:
+            return None
+
+        stored = self._ring.get(message_id) or self._pending.get(message_id)
+        cache_lookup("message_store", stored is not None)
+        if stored:
+            return stored
+
+        row = await self.db.get_stored_message(message_id)
+        return StoredMessage.from_row(row) if row else None
+
+    async def update_content(self, message_id: int, content: str) -> Optional[StoredMessage]:
+        """
+        メッセージ内容を更新
+
+        Returns:
+            Optional[StoredMessage]: 更新前のメッセージ（未保存の場合None）
+        """
+        before = await self.get(message_id)
+        if before:
+            self.add(before._replace(content=content))
+        return before
+
+    async def pop(self, message_id: int) -> Optional[StoredMessage]:
+        """メッセージを取得して削除"""
+        stored = await self.get(message_id)
+        self.forget([message_id])
+        return stored
+
+    def forget(self, message_ids: list[int]) -> None:
+        """メッセージを削除"""
+        for message_id in message_ids:
+            old = self._ring.pop(message_id, None)
+            if old:
+                self._bytes -= old.size
+            self._pending.pop(message_id, None)
+            self._deleted.add(message_id)
+
+    async def flush(self) -> None:
+        """書き出し待ちのメッセージと削除をまとめてデータベースに反映"""
+        if not self._pending and not self._deleted:
+            return
+
+        # 書き込み中の追加・削除は次回に回すため、バッファを入れ替えてから書き込む
+        pending, self._pending = self._pending, {}
+        deleted, self._deleted = self._deleted, set()
+
+        try:
+            async with self.db.transaction():
+                await self.db.store_messages([tuple(s) for s in pending.values()])
+                await self.db.delete_stored_messages(list(deleted))
+        except Exception:
+            # 失敗した分を戻す（書き込み中に更新・削除されたものは新しい方を優先）
+            for message_id, stored in pending.items():
+                if message_id not in self._deleted:
+                    self._pending.setdefault(message_id, stored)
+            self._deleted |= {message_id for message_id in deleted if message_id not in self._pending}
+            raise
+        logger.debug(f"メッセージストア書き出し: 保存={len(pending)}, 削除={len(deleted)}")
+
+    async def purge(self, purge_db: bool = True) -> int:
+        """
+        保存期間を過ぎたメッセージを削除
+
+        Args:
+            purge_db: データベースからも削除する（Falseの場合はメモリ上のみ）
+        """
+        cutoff = int(time.time()) - self.ttl_seconds
+        expired = [mid for mid, s in self._ring.items() if s.created_at < cutoff]
+        for message_id in expired:
+            self._bytes -= self._ring.pop(message_id).size
+        if not purge_db:
+            return 0
+        return await self.db.purge_stored_messages(cutoff)
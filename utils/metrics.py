@@ -0,0 +1,358 @@
+"""
+メトリクス（カウンター・ゲージ・ヒストグラム）
+
+プロセス内の処理件数・処理時間を集計し、config.yaml の metrics.enabled が有効な場合は
+Prometheus のテキスト形式で HTTP 公開する（127.0.0.1 のみ。クラスターごとに port + クラスター番号）。
+
+計測はメモリ上の加算のみで行うため、ホットパスから呼び出してよい。
+既存の統計（stats()）を持つクラスは、値を二重に数えないよう add_collector で
+公開時に読み出す。
+
+Usage:
+    from utils.metrics import registry
+
+    EVENTS = registry.counter("sumire_example_total", "説明", ("kind",))
+    EVENTS.labels("message").inc()
+"""
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional
+
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+logger = get_logger("sumire.metrics")
+
+# 処理時間ヒストグラムのデフォルトのバケット（秒）
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 公開時に呼び出す関数の戻り値: (メトリクス名, 種類, 説明, ラベル, 値)
+Sample = tuple[str, str, str, dict[str, str], float]
+Collector = Callable[[], Iterable[Sample]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """バケットから分位点を概算（線形補間）"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if cumulative + count >= rank and count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+class _Metric:
+    """ラベルの組み合わせごとに値を持つメトリクス"""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], object] = {}
+        if not labelnames:
+            self._children[()] = self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: object):
+        """ラベルの値を指定して取得（ホットパスでは戻り値を保持して使い回す）"""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: ラベルの数が一致しません {self.labelnames}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def children(self) -> dict[tuple[str, ...], object]:
+        """ラベルの値 → 値"""
+        return dict(self._children)
+
+    def clear(self) -> None:
+        """ラベル付きの値を全て削除"""
+        if self.labelnames:
+            self._children.clear()
+
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        for key, child in list(self._children.items()):
+            yield "", dict(zip(self.labelnames, key)), child.value
+
+
+class Counter(_Metric):
+    """増加のみのカウンター"""
+
+    type = "counter"
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+
+class Gauge(_Metric):
+    """任意の値を取るゲージ"""
+
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self._children[()].set(value)
+
+
+class Histogram(_Metric):
+    """値の分布（処理時間など）"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._children[()].observe(value)
+
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        for key, child in list(self._children.items()):
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield "_sum", labels, child.sum
+            yield "_count", labels, child.count
+
+
+class MetricsRegistry:
+    """メトリクスの登録と Prometheus テキスト形式への変換"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Collector] = {}
+
+    def _get_or_create(self, cls: type[_Metric], name: str, *args, **kwargs) -> _Metric:
+        # Cogのリロードで同じ名前を再登録した場合は既存のものを返す
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"メトリクス {name} は {metric.type} として登録済みです")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """カウンターを登録"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """ゲージを登録"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """ヒストグラムを登録"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """登録済みのメトリクスを取得"""
+        return self._metrics.get(name)
+
+    def add_collector(self, key: str, collector: Collector) -> None:
+        """公開時に値を読み出す関数を登録（同じキーは置き換え）"""
+        self._collectors[key] = collector
+
+    def remove_collector(self, key: str) -> None:
+        """公開時に値を読み出す関数を削除"""
+        self._collectors.pop(key, None)
+
+    def collect(self, *names: str) -> dict[str, list[tuple[dict[str, str], float]]]:
+        """メトリクス名ごとの現在値を、登録済みのメトリクスと収集関数の両方から取得（収集関数は1回ずつ呼ぶ）"""
+        values: dict[str, list[tuple[dict[str, str], float]]] = {name: [] for name in names}
+        for name in names:
+            metric = self._metrics.get(name)
+            if metric is not None:
+                values[name].extend((labels, value) for suffix, labels, value in metric.samples() if not suffix)
+        for key, collector in list(self._collectors.items()):
+            try:
+                for n, _, _, labels, value in collector():
+                    if n in values:
+                        values[n].append((labels, value))
+            except Exception as e:
+                logger.warning(f"メトリクスの収集に失敗しました: {key} - {e!r}")
+        return values
+
+    def render(self) -> str:
+        """Prometheus のテキスト形式に変換"""
+        families: dict[str, tuple[str, str, list[str]]] = {}
+
+        for metric in list(self._metrics.values()):
+            lines = families.setdefault(metric.name, (metric.type, metric.documentation, []))[2]
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+
+        for key, collector in list(self._collectors.items()):
+            try:
+                samples = list(collector())
+            except Exception as e:
+                logger.warning(f"メトリクスの収集に失敗しました: {key} - {e!r}")
+                continue
+            for name, kind, documentation, labels, value in samples:
+                lines = families.setdefault(name, (kind, documentation, []))[2]
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        output = []
+        for name, (kind, documentation, lines) in families.items():
+            output.append(f"# HELP {name} {documentation}")
+            output.append(f"# TYPE {name} {kind}")
+            output.extend(lines)
+        return "\n".join(output) + "\n"
+
+
+registry = MetricsRegistry()
+
+# キャッシュの参照結果（result: hit / miss）
+CACHE_LOOKUPS = registry.counter(
+    "sumire_cache_lookups_total",
+    "キャッシュの参照回数",
+    ("cache", "result")
+)
+
+# 直近の /metrics の生成時間
+SCRAPE_SECONDS = registry.gauge("sumire_metrics_render_seconds", "直近の /metrics の生成にかかった時間")
+
+
+def cache_lookup(cache: str, hit: bool) -> None:
+    """キャッシュの参照結果を記録"""
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class MetricsServer:
+    """/metrics を返すローカルHTTPサーバー"""
+
+    def __init__(self, host: str, port: int, refresh: Optional[Callable[[], Awaitable[Any]]] = None) -> None:
+        """
+        Args:
+            host: 待ち受けるアドレス
+            port: 待ち受けるポート
+            refresh: 生成前に呼ぶ関数（収集関数がイベントループ上で行えない取得を別スレッドで行う）
+        """
+        self.host = host
+        self.port = port
+        self.refresh = refresh
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        """待ち受けを開始"""
+        from aiohttp import web  # 無効時は読み込まない
+
+        async def handle_metrics(request: web.Request) -> web.Response:
+            if self.refresh is not None:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logger.warning(f"メトリクスの更新に失敗しました: {e!r}")
+            started = time.perf_counter()
+            body = registry.render()
+            SCRAPE_SECONDS.set(time.perf_counter() - started)
+            return web.Response(text=body, content_type="text/plain", charset="utf-8",
+                                headers={"X-Prometheus-Version": "0.0.4"})
+
+        app = web.Application()
+        app.router.add_get("/metrics", handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"メトリクスを公開しました: http://{self.host}:{self.port}/metrics")
+
+    async def close(self) -> None:
+        """待ち受けを停止"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
@@ -0,0 +1,291 @@
+"""
+送信メッセージスケジューラー
+
+ログ・通知などBotが自発的に送るメッセージを送信先チャンネルごとのキューに積み、
+優先度順に1件ずつ送信する。混雑時は低優先度のメッセージをまとめる・破棄する。
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import re
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Optional
+
+import discord
+
+from utils.logging import get_logger
+from utils.metrics import registry
+
+if TYPE_CHECKING:
+    from discord.abc import Messageable
+    from discord.ext.commands import Bot
+
+logger = get_logger("sumire.outbound")
+
+# チャンネルごとのキュー上限（これを超えると低優先度から破棄）
+MAX_QUEUE_DEPTH = 50
+
+# 高優先度メッセージのみ許容する絶対上限
+HARD_QUEUE_LIMIT = MAX_QUEUE_DEPTH * 2
+
+# 429 を受けた場合の再試行回数
+MAX_RETRIES = 3
+
+# channel.send 1回あたりの所要時間（result: ok / rate_limited / forbidden / error）
+SEND_SECONDS = registry.histogram(
+    "sumire_outbound_send_seconds",
+    "送信スケジューラーの channel.send の所要時間",
+    ("result",)
+)
+
+
+class Priority(IntEnum):
+    """送信優先度（値が小さいほど優先）"""
+
+    MODERATION = 0
+    LOG = 1
+    NORMAL = 2
+    LOW = 3
+
+
+class _OutboundItem:
+    """キュー内の送信待ちメッセージ"""
+
+    __slots__ = ("priority", "seq", "kwargs", "coalesce_key", "future", "followers", "cancelled")
+
+    def __init__(
+        self,
+        priority: Priority,
+        seq: int,
+        kwargs: dict[str, Any],
+        coalesce_key: Optional[str],
+        future: asyncio.Future,
+    ) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.kwargs = kwargs
+        self.coalesce_key = coalesce_key
+        self.future = future
+        # 内容を置き換えた後続の送信（呼び出し元ごとに Future を分け、片方のキャンセルが他に影響しないようにする）
+        self.followers: list[asyncio.Future] = []
+        self.cancelled = False
+
+    def __lt__(self, other: _OutboundItem) -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def resolve(self, message: Optional[discord.Message]) -> None:
+        for future in (self.future, *self.followers):
+            if not future.done():
+                future.set_result(message)
+
+
+class _ChannelQueue:
+    """送信先チャンネル1つ分のキュー"""
+
+    __slots__ = ("channel", "heap", "pending", "coalesce", "worker")
+
+    def __init__(self, channel: Messageable) -> None:
+        self.channel = channel
+        self.heap: list[_OutboundItem] = []
+        self.pending = 0
+        self.coalesce: dict[str, _OutboundItem] = {}
+        self.worker: Optional[asyncio.Task] = None
+
+    def push(self, item: _OutboundItem) -> None:
+        heapq.heappush(self.heap, item)
+        self.pending += 1
+        if item.coalesce_key:
+            self.coalesce[item.coalesce_key] = item
+
+    def pop(self) -> Optional[_OutboundItem]:
+        while self.heap:
+            item = heapq.heappop(self.heap)
+            if item.cancelled:
+                continue
+            self.pending -= 1
+            if item.coalesce_key and self.coalesce.get(item.coalesce_key) is item:
+                del self.coalesce[item.coalesce_key]
+            return item
+        return None
+
+    def discard(self, item: _OutboundItem) -> None:
+        item.cancelled = True
+        self.pending -= 1
+        if item.coalesce_key and self.coalesce.get(item.coalesce_key) is item:
+            del self.coalesce[item.coalesce_key]
+        item.resolve(None)
+
+    def worst(self) -> Optional[_OutboundItem]:
+        live = [item for item in self.heap if not item.cancelled]
+        if not live:
+            return None
+        return max(live, key=lambda item: (item.priority, item.seq))
+
+
+# メッセージ送信のルート（discord.http の 429 の警告から、送信分のみを数えるため）
+_SEND_URL_PATTERN = re.compile(r"/channels/\d+/messages$")
+
+
+class _SendRateLimitCounter(logging.Handler):
+    """
+    メッセージ送信が受けた 429 を discord.http の警告から数える
+
+    discord.py は 429 を受けると HTTPClient.request 内で待機して再試行するため、
+    送信側には例外が届かない（max_ratelimit_timeout を超えた場合のみ RateLimited になり、
+    それは _deliver で数える）。
+    """
+
+    def __init__(self, scheduler: OutboundScheduler) -> None:
+        super().__init__(level=logging.WARNING)
+        self.scheduler = scheduler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        args = record.args
+        if not isinstance(args, tuple) or len(args) != 3 or "Retrying in" not in str(record.msg):
+            return
+        method, url, _ = args
+        if method == "POST" and _SEND_URL_PATTERN.search(str(url)):
+            self.scheduler.rate_limited += 1
+
+
+class OutboundScheduler:
+    """送信メッセージスケジューラー"""
+
+    def __init__(self, bot: Bot) -> None:
+        self.bot = bot
+        self._queues: dict[int, _ChannelQueue] = {}
+        self._seq = itertools.count()
+        self._rate_limit_handler = _SendRateLimitCounter(self)
+        logging.getLogger("discord.http").addHandler(self._rate_limit_handler)
+
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.rate_limited = 0
+
+    def send(
+        self,
+        channel: Messageable,
+        *,
+        priority: Priority = Priority.NORMAL,
+        coalesce_key: Optional[str] = None,
+        **kwargs: Any
+    ) -> asyncio.Future:
+        """
+        メッセージを送信キューに追加
+
+        Args:
+            channel: 送信先
+            priority: 送信優先度
+            coalesce_key: 同じキーの未送信メッセージがあれば内容を置き換える
+            **kwargs: channel.send() に渡す引数
+
+        Returns:
+            asyncio.Future: 送信された Message（破棄・失敗時は None）
+        """
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = _ChannelQueue(channel)
+
+        # 同じキーの未送信メッセージは最新の内容に置き換える
+        if coalesce_key and coalesce_key in queue.coalesce:
+            existing = queue.coalesce[coalesce_key]
+            existing.kwargs = kwargs
+            self.coalesced += 1
+            existing.followers.append(future)
+            return future
+
+        item = _OutboundItem(priority, next(self._seq), kwargs, coalesce_key, future)
+
+        if queue.pending >= MAX_QUEUE_DEPTH:
+            worst = queue.worst()
+            if worst and worst.priority > priority:
+                queue.discard(worst)
+                self.dropped += 1
+            elif priority >= Priority.NORMAL or queue.pending >= HARD_QUEUE_LIMIT:
+                self.dropped += 1
+                item.resolve(None)
+                logger.debug(f"送信キュー満杯のため破棄: channel_id={channel.id}, priority={priority.name}")
+                return future
+
+        queue.push(item)
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._run_worker(channel.id, queue))
+        return future
+
+    async def _run_worker(self, channel_id: int, queue: _ChannelQueue) -> None:
+        """チャンネルのキューを優先度順に送信"""
+        try:
+            while True:
+                item = queue.pop()
+                if item is None:
+                    break
+                item.resolve(await self._deliver(queue.channel, item))
+        finally:
+            if self._queues.get(channel_id) is queue and queue.pending == 0:
+                del self._queues[channel_id]
+
+    async def _deliver(self, channel: Messageable, item: _OutboundItem) -> Optional[discord.Message]:
+        """1件送信（429は待機して再試行）"""
+        for _ in range(MAX_RETRIES):
+            started = time.perf_counter()
+            try:
+                message = await channel.send(**item.kwargs)
+                SEND_SECONDS.labels("ok").observe(time.perf_counter() - started)
+                self.sent += 1
+                return message
+            except discord.RateLimited as e:
+                SEND_SECONDS.labels("rate_limited").observe(time.perf_counter() - started)
+                self.rate_limited += 1
+                await asyncio.sleep(e.retry_after)
+            except discord.Forbidden:
+                SEND_SECONDS.labels("forbidden").observe(time.perf_counter() - started)
+                self.failed += 1
+                guild_id = getattr(getattr(channel, "guild", None), "id", None)
+                logger.warning(f"送信権限なし: channel_id={channel.id}, guild_id={guild_id}")
+                return None
+            except discord.HTTPException as e:
+                SEND_SECONDS.labels("rate_limited" if e.status == 429 else "error").observe(
+                    time.perf_counter() - started
+                )
+                if e.status != 429:
+                    self.failed += 1
+                    logger.warning(f"メッセージ送信失敗: channel_id={channel.id} - {e}")
+                    return None
+                self.rate_limited += 1
+                await asyncio.sleep(1)
+
+        self.failed += 1
+        return None
+
+    def queue_depths(self) -> dict[int, int]:
+        """チャンネルごとの送信待ち件数"""
+        return {channel_id: q.pending for channel_id, q in self._queues.items() if q.pending}
+
+    def stats(self) -> dict[str, int]:
+        """送信統計"""
+        return {
+            "queued": sum(q.pending for q in self._queues.values()),
+            "channels": len(self._queues),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+        }
+
+    async def close(self) -> None:
+        """送信ワーカーを停止"""
+        logging.getLogger("discord.http").removeHandler(self._rate_limit_handler)
+        for queue in list(self._queues.values()):
+            if queue.worker and not queue.worker.done():
+                queue.worker.cancel()
+            while (item := queue.pop()) is not None:
+                item.resolve(None)
+        self._queues.clear()
@@ -0,0 +1,146 @@
+"""
+パフォーマンス診断用のリングバッファ（/perf で参照）
+
+記録はイベントごとの加算のみで、集計は /perf の実行時に行う。
+処理時間の分布は utils.metrics のヒストグラムを参照する。
+"""
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+from collections import deque
+from typing import Optional
+
+# イベント数を記録する秒数
+RATE_WINDOW = 60
+
+# サーバーごとの処理時間を集計する区間（秒）と区間数（直近5分）
+HOTSPOT_SLOT_SECONDS = 60
+HOTSPOT_SLOTS = 5
+
+# 保持するGCの記録数
+GC_HISTORY = 200
+
+
+def percentile(values: list[float], q: float) -> float:
+    """分位点（最近傍法、空の場合は0）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class RateCounter:
+    """直近 window 秒の1秒ごとの件数"""
+
+    __slots__ = ("window", "_slots")
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        self.window = window
+        # [秒, 件数]
+        self._slots: deque[list[int]] = deque(maxlen=window)
+
+    def add(self, count: int = 1) -> None:
+        second = int(time.monotonic())
+        if self._slots and self._slots[-1][0] == second:
+            self._slots[-1][1] += count
+        else:
+            self._slots.append([second, count])
+
+    def rate(self, seconds: Optional[int] = None) -> float:
+        """直近 seconds 秒（最大 window 秒）の1秒あたりの件数"""
+        seconds = min(seconds or self.window, self.window)
+        # 記録中の秒は途中のため含めない
+        now = int(time.monotonic())
+        total = sum(count for second, count in self._slots if now - seconds <= second < now)
+        return total / seconds
+
+
+class GuildHotspots:
+    """サーバーごとのイベント処理時間（直近 HOTSPOT_SLOTS 区間）"""
+
+    def __init__(self) -> None:
+        # (区間の開始, {サーバーID: [秒, 件数]})
+        self._slots: deque[tuple[int, dict[int, list[float]]]] = deque(maxlen=HOTSPOT_SLOTS)
+
+    def add(self, guild_id: int, seconds: float) -> None:
+        slot = int(time.monotonic()) // HOTSPOT_SLOT_SECONDS
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append((slot, {}))
+        entry = self._slots[-1][1].get(guild_id)
+        if entry is None:
+            self._slots[-1][1][guild_id] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def top(self, limit: int = 5) -> list[tuple[int, float, int]]:
+        """処理時間の合計が多いサーバー [(サーバーID, 秒, 件数)]"""
+        oldest = int(time.monotonic()) // HOTSPOT_SLOT_SECONDS - HOTSPOT_SLOTS
+        totals: dict[int, list[float]] = {}
+        for slot, guilds in list(self._slots):
+            if slot <= oldest:
+                continue
+            for guild_id, (seconds, count) in guilds.items():
+                total = totals.setdefault(guild_id, [0.0, 0])
+                total[0] += seconds
+                total[1] += count
+        ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        return [(guild_id, seconds, int(count)) for guild_id, (seconds, count) in ranked]
+
+
+class GcMonitor:
+    """GCの停止時間を記録（gc.callbacks）"""
+
+    def __init__(self) -> None:
+        # (世代, 停止時間, 回収数)
+        self.history: deque[tuple[int, float, int]] = deque(maxlen=GC_HISTORY)
+        self._started = 0.0
+        self._installed = False
+
+    def start(self) -> None:
+        if not self._installed:
+            gc.callbacks.append(self._callback)
+            self._installed = True
+
+    def stop(self) -> None:
+        if self._installed:
+            gc.callbacks.remove(self._callback)
+            self._installed = False
+
+    def _callback(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started:
+            self.history.append((info["generation"], time.perf_counter() - self._started, info["collected"]))
+            self._started = 0.0
+
+    def pauses(self) -> list[float]:
+        """直近のGCの停止時間（秒）"""
+        return [duration for _, duration, _ in self.history]
+
+
+def _process_rss() -> int:
+    """プロセスのメモリ使用量（RSS、バイト、同期関数）"""
+    import psutil  # 起動時間短縮のため初回使用時に読み込む
+
+    return psutil.Process().memory_info().rss
+
+
+class PerfRecorder:
+    """/perf 用の記録をまとめたもの（Botに1つ）"""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.gateway_events = RateCounter()
+        self.hotspots = GuildHotspots()
+        self.gc = GcMonitor()
+        # 直近に取得したRSS（メトリクスの収集関数はイベントループ上で呼ばれるため、この値を読むだけにする）
+        self.rss_bytes = 0
+
+    async def refresh_memory(self) -> int:
+        """RSSを別スレッドで取得して記録"""
+        self.rss_bytes = await asyncio.to_thread(_process_rss)
+        return self.rss_bytes
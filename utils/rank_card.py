@@ -0,0 +1,286 @@
+"""
+ランクカード画像の生成
+
+画像の描画は CPU を使うため ProcessPoolExecutor で行い、イベントループを止めない。
+アバター画像はアセットのハッシュをキーに共有キャッシュし、
+完成したカードは (ユーザー, XP, レベル, 順位, 表示名, アバター) をキーにメモ化する。
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import io
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import discord
+
+from utils.logging import get_logger
+
+# Pillow は描画するワーカープロセスでのみ読み込む（Botプロセスの起動時間短縮のため）
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+logger = get_logger("sumire.rank_card")
+
+# カードのサイズ
+CARD_WIDTH = 934
+CARD_HEIGHT = 282
+AVATAR_SIZE = 200
+
+# 取得するアバターのサイズ（Discord CDN の size パラメータ）
+AVATAR_FETCH_SIZE = 256
+
+# キャッシュ件数の上限
+AVATAR_CACHE_SIZE = 512
+CARD_CACHE_SIZE = 256
+
+# 色
+BACKGROUND_COLOR = (35, 39, 42, 255)
+PANEL_COLOR = (47, 49, 54, 255)
+TRACK_COLOR = (72, 75, 78, 255)
+TEXT_COLOR = (255, 255, 255, 255)
+SUBTEXT_COLOR = (185, 187, 190, 255)
+
+# ワーカープロセス内のフォントキャッシュ（プロセスごと）
+_fonts: dict[tuple[str, int], object] = {}
+
+
+def _font(path: str, size: int):
+    """フォントを読み込み（指定がない・読めない場合は内蔵フォント）"""
+    from PIL import ImageFont
+
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = ImageFont.truetype(path, size) if path else ImageFont.load_default(size)
+        except OSError:
+            font = ImageFont.load_default(size)
+        _fonts[key] = font
+    return font
+
+
+def _fit_text(draw, text: str, font, max_width: int) -> str:
+    """幅に収まらないテキストを省略"""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > max_width:
+        text = text[:-1]
+    return text + "…"
+
+
+def render_rank_card(
+    display_name: str,
+    level: int,
+    xp: int,
+    next_level_xp: int,
+    rank: Optional[int],
+    accent: tuple[int, int, int],
+    avatar: Optional[bytes],
+    font_path: str = ""
+) -> bytes:
+    """
+    ランクカードを描画してPNGを返す（ワーカープロセスで実行）
+
+    引数・戻り値はプロセス間で受け渡すため、すべてpickle可能な型にしている。
+    """
+    from PIL import Image, ImageDraw
+
+    card = Image.new("RGBA", (CARD_WIDTH, CARD_HEIGHT), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(card)
+    draw.rounded_rectangle((16, 16, CARD_WIDTH - 16, CARD_HEIGHT - 16), radius=24, fill=PANEL_COLOR)
+
+    # アバター（円形に切り抜き）
+    avatar_x, avatar_y = 40, (CARD_HEIGHT - AVATAR_SIZE) // 2
+    if avatar:
+        try:
+            image = Image.open(io.BytesIO(avatar)).convert("RGBA").resize((AVATAR_SIZE, AVATAR_SIZE))
+        except OSError:
+            image = None
+    else:
+        image = None
+
+    mask = Image.new("L", (AVATAR_SIZE, AVATAR_SIZE), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, AVATAR_SIZE, AVATAR_SIZE), fill=255)
+    if image is not None:
+        card.paste(image, (avatar_x, avatar_y), mask)
+    else:
+        draw.ellipse(
+            (avatar_x, avatar_y, avatar_x + AVATAR_SIZE, avatar_y + AVATAR_SIZE),
+            fill=TRACK_COLOR
+        )
+
+    accent_color = (*accent, 255)
+    left = avatar_x + AVATAR_SIZE + 40
+    right = CARD_WIDTH - 56
+
+    # 順位とレベル（右上）
+    big = _font(font_path, 48)
+    small = _font(font_path, 26)
+    level_text = f"Lv.{level}"
+    level_width = draw.textlength(level_text, font=big)
+    draw.text((right - level_width, 44), level_text, font=big, fill=accent_color)
+
+    rank_text = f"#{rank}" if rank else "#-"
+    rank_width = draw.textlength(rank_text, font=big)
+    draw.text((right - level_width - 32 - rank_width, 44), rank_text, font=big, fill=TEXT_COLOR)
+
+    # 名前
+    name_font = _font(font_path, 40)
+    name_max = int(right - left - level_width - rank_width - 64)
+    draw.text((left, 140), _fit_text(draw, display_name, name_font, name_max), font=name_font, fill=TEXT_COLOR)
+
+    # XP
+    xp_text = f"{xp:,} / {next_level_xp:,} XP"
+    xp_width = draw.textlength(xp_text, font=small)
+    draw.text((right - xp_width, 150), xp_text, font=small, fill=SUBTEXT_COLOR)
+
+    # 進捗バー
+    bar_top, bar_bottom = 196, 232
+    draw.rounded_rectangle((left, bar_top, right, bar_bottom), radius=18, fill=TRACK_COLOR)
+    ratio = min(1.0, xp / next_level_xp) if next_level_xp > 0 else 1.0
+    filled = int((right - left) * ratio)
+    if filled >= bar_bottom - bar_top:
+        draw.rounded_rectangle((left, bar_top, left + filled, bar_bottom), radius=18, fill=accent_color)
+
+    buffer = io.BytesIO()
+    card.save(buffer, format="PNG", optimize=False)
+    return buffer.getvalue()
+
+
+class RankCardRenderer:
+    """ランクカードの生成（プロセスプール・アバターキャッシュ・カードのメモ化）"""
+
+    def __init__(self, workers: int = 2, font_path: str = "") -> None:
+        self.workers = max(1, workers)
+        self.font_path = font_path
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._avatars: OrderedDict[str, bytes] = OrderedDict()
+        self._avatar_fetches: dict[str, asyncio.Task] = {}
+        self._cards: OrderedDict[tuple, bytes] = OrderedDict()
+
+        self.rendered = 0
+        self.card_hits = 0
+        self.avatar_hits = 0
+        self.failed = 0
+
+    @property
+    def available(self) -> bool:
+        """Pillow がインストールされているか"""
+        return PIL_AVAILABLE
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """プロセスプールを取得（初回に作成）"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def _fetch_avatar(self, asset: discord.Asset) -> Optional[bytes]:
+        """アバター画像を取得（同じアバターの同時取得は1回にまとめる）"""
+        key = asset.key
+        data = self._avatars.get(key)
+        if data is not None:
+            self._avatars.move_to_end(key)
+            self.avatar_hits += 1
+            return data
+
+        task = self._avatar_fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                asset.replace(size=AVATAR_FETCH_SIZE, static_format="png").read()
+            )
+            self._avatar_fetches[key] = task
+        try:
+            data = await asyncio.shield(task)
+        except (discord.HTTPException, ValueError) as e:
+            logger.warning(f"アバター取得エラー: {key} - {e}")
+            return None
+        finally:
+            if task.done():
+                self._avatar_fetches.pop(key, None)
+
+        self._avatars[key] = data
+        while len(self._avatars) > AVATAR_CACHE_SIZE:
+            self._avatars.popitem(last=False)
+        return data
+
+    async def render(
+        self,
+        user: discord.abc.User,
+        level: int,
+        xp: int,
+        rank: Optional[int],
+        accent: Optional[discord.Colour] = None
+    ) -> Optional[bytes]:
+        """
+        ランクカードを生成
+
+        Returns:
+            Optional[bytes]: PNG画像（Pillow がない・生成に失敗した場合None）
+        """
+        if not PIL_AVAILABLE:
+            return None
+
+        asset = user.display_avatar
+        colour = accent or discord.Colour.blurple()
+        key = (user.id, xp, level, rank, user.display_name, asset.key, colour.value)
+
+        card = self._cards.get(key)
+        if card is not None:
+            self._cards.move_to_end(key)
+            self.card_hits += 1
+            return card
+
+        avatar = await self._fetch_avatar(asset)
+        loop = asyncio.get_running_loop()
+        try:
+            card = await loop.run_in_executor(
+                self._get_pool(),
+                render_rank_card,
+                user.display_name,
+                level,
+                xp,
+                (level + 1) * 100,
+                rank,
+                colour.to_rgb(),
+                avatar,
+                self.font_path,
+            )
+        except BrokenProcessPool:
+            # ワーカーが異常終了した場合は次回作り直す
+            logger.error("ランクカードのプロセスプールが停止したため再作成します")
+            self._pool = None
+            self.failed += 1
+            return None
+        except Exception as e:
+            logger.error(f"ランクカード生成エラー: {user} - {e}")
+            self.failed += 1
+            return None
+
+        self.rendered += 1
+        self._cards[key] = card
+        while len(self._cards) > CARD_CACHE_SIZE:
+            self._cards.popitem(last=False)
+        return card
+
+    def stats(self) -> dict[str, int]:
+        """生成統計"""
+        return {
+            "rendered": self.rendered,
+            "card_hits": self.card_hits,
+            "avatar_hits": self.avatar_hits,
+            "failed": self.failed,
+            "cached_cards": len(self._cards),
+            "cached_avatars": len(self._avatars),
+        }
+
+    def close(self) -> None:
+        """プロセスプールを停止"""
+        for task in self._avatar_fetches.values():
+            task.cancel()
+        self._avatar_fetches.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
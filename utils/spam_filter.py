@@ -0,0 +1,174 @@
+"""
+コピペスパム判定
+
+ユーザーごとに直近のメッセージの指紋（正規化した内容のハッシュと、
+文字シングルのハッシュの bottom-k スケッチ）を保持し、同一・ほぼ同一の
+メッセージの連投を判定する。判定は保持件数・スケッチ長が固定のため O(1)。
+レベル（XP）と単語カウントの両方から同じメッセージについて参照される。
+"""
+from __future__ import annotations
+
+import re
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict, deque
+from typing import Optional
+
+import discord
+
+# ユーザーごとに保持する直近の指紋数
+WINDOW_SIZE = 5
+
+# この秒数より古い指紋は比較しない
+WINDOW_SECONDS = 300
+
+# この秒数発言のないユーザーは破棄
+IDLE_SECONDS = 600
+
+# サーバーごとに保持するユーザー数の上限（超えたら最も古いユーザーから破棄）
+MAX_USERS_PER_GUILD = 5000
+
+# シングル（連続する文字）の長さ
+SHINGLE_SIZE = 3
+
+# スケッチに残すハッシュ数
+SKETCH_SIZE = 8
+
+# ほぼ同一とみなす類似度（スケッチの一致率）
+NEAR_DUPLICATE_THRESHOLD = 0.75
+
+_STRIP_PATTERN = re.compile(r"[\s\W_]+", re.UNICODE)
+_REPEAT_PATTERN = re.compile(r"(.)\1{2,}")
+
+
+class _Fingerprint:
+    """メッセージ1件分の指紋"""
+
+    __slots__ = ("digest", "sketch", "created_at")
+
+    def __init__(self, digest: int, sketch: frozenset[int], created_at: float) -> None:
+        self.digest = digest
+        self.sketch = sketch
+        self.created_at = created_at
+
+
+class _UserWindow:
+    """ユーザーごとの直近の指紋"""
+
+    __slots__ = ("fingerprints", "last_message_id", "last_verdict", "last_seen")
+
+    def __init__(self) -> None:
+        self.fingerprints: deque[_Fingerprint] = deque(maxlen=WINDOW_SIZE)
+        self.last_message_id = 0
+        self.last_verdict = False
+        self.last_seen = 0.0
+
+
+def normalize(content: str) -> str:
+    """表記ゆれ・空白・記号・連続文字を除いた比較用の文字列"""
+    text = unicodedata.normalize("NFKC", content).casefold()
+    text = _STRIP_PATTERN.sub("", text)
+    return _REPEAT_PATTERN.sub(r"\1\1", text)
+
+
+def fingerprint(content: str, now: float) -> Optional[_Fingerprint]:
+    """指紋を作成（比較する内容がない場合None）"""
+    text = normalize(content)
+    if not text:
+        return None
+
+    digest = zlib.crc32(text.encode())
+    if len(text) <= SHINGLE_SIZE:
+        sketch = frozenset((digest,))
+    else:
+        hashes = {
+            zlib.crc32(text[i:i + SHINGLE_SIZE].encode())
+            for i in range(len(text) - SHINGLE_SIZE + 1)
+        }
+        sketch = frozenset(sorted(hashes)[:SKETCH_SIZE])
+    return _Fingerprint(digest, sketch, now)
+
+
+class SpamFilter:
+    """コピペスパム判定（サーバーごとにメモリ上限あり）"""
+
+    def __init__(self) -> None:
+        self._guilds: dict[int, OrderedDict[int, _UserWindow]] = {}
+        self.checked = 0
+        self.flagged = 0
+
+    def is_spam(self, message: discord.Message) -> bool:
+        """
+        メッセージがスパム（直近の自分のメッセージと同一・ほぼ同一）か判定
+
+        同じメッセージについて複数回呼ばれた場合は最初の判定を返す。
+        """
+        guild_id = message.guild.id
+        users = self._guilds.get(guild_id)
+        if users is None:
+            users = self._guilds[guild_id] = OrderedDict()
+
+        window = users.get(message.author.id)
+        if window is not None and window.last_message_id == message.id:
+            return window.last_verdict
+
+        now = time.monotonic()
+        self._evict(users, now)
+
+        if window is None:
+            window = users[message.author.id] = _UserWindow()
+        else:
+            users.move_to_end(message.author.id)
+
+        verdict = False
+        current = fingerprint(message.content, now)
+        if current is not None:
+            cutoff = now - WINDOW_SECONDS
+            for previous in window.fingerprints:
+                if previous.created_at < cutoff:
+                    continue
+                if previous.digest == current.digest or self._similar(previous, current):
+                    verdict = True
+                    break
+            window.fingerprints.append(current)
+
+        window.last_message_id = message.id
+        window.last_verdict = verdict
+        window.last_seen = now
+
+        self.checked += 1
+        if verdict:
+            self.flagged += 1
+        return verdict
+
+    @staticmethod
+    def _similar(a: _Fingerprint, b: _Fingerprint) -> bool:
+        """スケッチの一致率でほぼ同一か判定"""
+        union = len(a.sketch | b.sketch)
+        if not union:
+            return False
+        return len(a.sketch & b.sketch) / union >= NEAR_DUPLICATE_THRESHOLD
+
+    @staticmethod
+    def _evict(users: OrderedDict[int, _UserWindow], now: float) -> None:
+        """発言のないユーザーと上限超過分を破棄（古い順に並んでいる）"""
+        idle_cutoff = now - IDLE_SECONDS
+        while users:
+            oldest = next(iter(users.values()))
+            if oldest.last_seen >= idle_cutoff and len(users) < MAX_USERS_PER_GUILD:
+                break
+            users.popitem(last=False)
+
+    def forget_guild(self, guild_id: int) -> None:
+        """サーバーの指紋をすべて破棄"""
+        self._guilds.pop(guild_id, None)
+
+    def stats(self) -> dict[str, int]:
+        """判定統計"""
+        return {
+            "guilds": len(self._guilds),
+            "users": sum(len(users) for users in self._guilds.values()),
+            "checked": self.checked,
+            "flagged": self.flagged,
+        }
@@ -0,0 +1,201 @@
+"""
+起動プロファイラ（--profile-startup）
+
+モジュールごとのimport時間・Cogごとの読み込み時間・起動処理の各フェーズの時間を計測し、
+時間順に並べたレポートとJSONを書き出す。無効時は何も計測しない。
+
+標準ライブラリのみを使用する（計測対象のimportより先に読み込むため）。
+"""
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# レポートに表示するimportの件数
+REPORT_TOP_IMPORTS = 40
+
+
+class _TimedLoader:
+    """exec_module の時間を計測するローダーのラッパー"""
+
+    def __init__(self, loader: Any, name: str, finder: _ImportTimer) -> None:
+        self._loader = loader
+        self._name = name
+        self._finder = finder
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._finder.enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._finder.exit()
+
+
+class _ImportTimer(MetaPathFinder):
+    """モジュールの読み込み時間（自身のみ・子を含む）を記録するフック"""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, tuple[float, float]] = {}
+        self._stack: list[list] = []
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname, self)
+        return spec
+
+    def enter(self, name: str) -> None:
+        """読み込み開始（[名前, 開始時刻, 子の合計時間]）"""
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        """読み込み終了（親には子を含む時間を加算）"""
+        name, start, children = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        self.timings[name] = (cumulative - children, cumulative)
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+
+class StartupProfiler:
+    """起動プロファイラ（シングルトン）"""
+
+    _instance: Optional[StartupProfiler] = None
+
+    def __new__(cls) -> StartupProfiler:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
+        self.enabled = False
+        self._started_at = 0.0
+        self._preloaded = 0
+        self._timer: Optional[_ImportTimer] = None
+        self.phases: list[tuple[str, float]] = []
+        self.cogs: list[tuple[str, float, bool]] = []
+
+    def enable(self) -> None:
+        """計測を開始（以降のimportを記録）"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._started_at = time.perf_counter()
+        self._preloaded = len(sys.modules)
+        self._timer = _ImportTimer()
+        sys.meta_path.insert(0, self._timer)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """起動処理の1フェーズを計測"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def record_cog(self, name: str, seconds: float, ok: bool) -> None:
+        """Cogの読み込み時間を記録（並行して読み込むため、他のCogの読み込みと重なった経過時間）"""
+        if self.enabled:
+            self.cogs.append((name, seconds, ok))
+
+    def finish(self) -> dict[str, Any]:
+        """計測を終了して結果を返す"""
+        if self._timer is not None and self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+
+        timings = self._timer.timings if self._timer else {}
+        imports = sorted(
+            (
+                {"module": name, "self": round(own, 6), "cumulative": round(cumulative, 6)}
+                for name, (own, cumulative) in timings.items()
+            ),
+            key=lambda item: item["self"],
+            reverse=True
+        )
+        return {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "total": round(time.perf_counter() - self._started_at, 6),
+            "preloaded_modules": self._preloaded,
+            "imported_modules": len(imports),
+            "import_self_total": round(sum(item["self"] for item in imports), 6),
+            "phases": [{"name": name, "seconds": round(seconds, 6)} for name, seconds in self.phases],
+            "cogs": sorted(
+                ({"name": name, "seconds": round(seconds, 6), "ok": ok} for name, seconds, ok in self.cogs),
+                key=lambda item: item["seconds"],
+                reverse=True
+            ),
+            "imports": imports,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """結果を時間順のテキストレポートにする"""
+        lines = [
+            f"起動プロファイル ({result['created_at']}, Python {result['python']})",
+            f"合計: {result['total']:.3f}s / import: {result['import_self_total']:.3f}s "
+            f"({result['imported_modules']} モジュール, 計測開始前に読み込み済み {result['preloaded_modules']})",
+            "",
+            "[フェーズ]",
+        ]
+        for phase in sorted(result["phases"], key=lambda item: item["seconds"], reverse=True):
+            lines.append(f"  {phase['seconds']:8.3f}s  {phase['name']}")
+
+        lines += ["", "[Cog（並行読み込みの経過時間。互いに重なるため合計は cogs.load と一致しない）]"]
+        for cog in result["cogs"]:
+            mark = "" if cog["ok"] else "  (失敗)"
+            lines.append(f"  {cog['seconds']:8.3f}s  {cog['name']}{mark}")
+
+        lines += ["", f"[import 上位{REPORT_TOP_IMPORTS}件（自身 / 子を含む）]"]
+        for item in result["imports"][:REPORT_TOP_IMPORTS]:
+            lines.append(f"  {item['self']:8.3f}s  {item['cumulative']:8.3f}s  {item['module']}")
+        return "\n".join(lines)
+
+    def write(self, json_path: str) -> str:
+        """
+        結果をJSONとテキストレポート（同名の .txt）に書き出す
+
+        Returns:
+            str: テキストレポート
+        """
+        result = self.finish()
+        report = self.format_report(result)
+
+        path = Path(json_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.with_suffix(".txt").write_text(report + "\n", encoding="utf-8")
+        return report
@@ -7,13 +7,12 @@ import asyncio
 from typing import TYPE_CHECKING
 
 import discord
-import psutil
 from discord.ext import tasks
 
 from utils.logging import get_logger
 
 if TYPE_CHECKING:
-    from discord.ext.commands import Bot
+    from discord.ext.commands import AutoShardedBot
 
 logger = get_logger("sumire.status")
 
@@ -21,7 +20,7 @@ logger = get_logger("sumire.status")
 class StatusManager:
     """システムステータス管理クラス"""
 
-    def __init__(self, bot: Bot) -> None:
+    def __init__(self, bot: AutoShardedBot) -> None:
         self.bot = bot
         self._task_started = False
 
@@ -39,27 +38,33 @@ class StatusManager:
 
     @tasks.loop(seconds=5)
     async def update_status(self) -> None:
-        """ステータスを定期更新（システムモニター表示）"""
-        # 接続が閉じられている場合はスキップ
-        if self.bot.is_closed() or self.bot.ws is None or self.bot.ws.socket is None:
+        """ステータスを定期更新（システムモニター表示、シャードごとにそのシャードのレイテンシ）"""
+        if self.bot.is_closed():
             return
 
         try:
             # プロセスのメモリ使用量を別スレッドで取得
             mem_mb = await asyncio.to_thread(self._get_process_memory)
 
-            # Discord API レイテンシ（ミリ秒）
-            ping_ms = self.bot.latency * 1000
+            for shard_id, shard in self.bot.shards.items():
+                # 接続が閉じられているシャードはスキップ
+                if shard.is_closed():
+                    continue
 
-            # ステータス文字列
-            status_text = f"RAM {mem_mb:.1f}MB | Ping {ping_ms:.0f}ms"
+                # Discord API レイテンシ（ミリ秒）
+                ping_ms = shard.latency * 1000
 
-            activity = discord.Activity(
-                type=discord.ActivityType.watching,
-                name=status_text
-            )
-            await self.bot.change_presence(activity=activity)
-            logger.debug(f"ステータス更新: {status_text}")
+                # ステータス文字列（複数シャードの場合はシャード番号も表示）
+                status_text = f"RAM {mem_mb:.1f}MB | Ping {ping_ms:.0f}ms"
+                if (self.bot.shard_count or 1) > 1:
+                    status_text += f" | Shard {shard_id}"
+
+                activity = discord.Activity(
+                    type=discord.ActivityType.watching,
+                    name=status_text
+                )
+                await self.bot.change_presence(activity=activity, shard_id=shard_id)
+                logger.debug(f"ステータス更新: {status_text}")
 
         except (ConnectionResetError, OSError) as e:
             # 接続切断時のエラーは警告レベルで出力（トレースバックなし）
@@ -79,6 +84,8 @@ class StatusManager:
     @staticmethod
     def _get_process_memory() -> float:
         """プロセスのメモリ使用量を取得（同期関数）"""
+        import psutil  # 起動時間短縮のため初回使用時に読み込む
+
         process = psutil.Process()
         mem_bytes = process.memory_info().rss
         mem_mb = mem_bytes / (1024 ** 2)
@@ -28,7 +28,9 @@ from .log_views import (
     LogBulkDeleteView,
     LogMemberTimeoutView,
     LogChannelUpdateView,
-    LogRoleUpdateView
+    LogRoleUpdateView,
+    LogRaidModeView,
+    LogDigestView
 )
 from .giveaway_views import (
     GiveawayView,
@@ -49,3 +51,4 @@ from .br_roulette_views import (
     BRRouletteView,
     ExclusionModal
 )
+from .archive_views import ArchiveSearchView
@@ -0,0 +1,131 @@
+"""
+メッセージアーカイブ検索用 Components V2 View
+"""
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+import discord
+from discord import ui
+
+from utils.logging import get_logger
+
+logger = get_logger("sumire.views.archive")
+
+
+class ArchiveSearchView(ui.LayoutView):
+    """アーカイブ検索結果（ページ送り付き）"""
+
+    # 1件あたりの本文の最大表示文字数
+    MAX_CONTENT_LENGTH = 150
+
+    def __init__(
+        self,
+        guild_id: int,
+        query: str,
+        fetch_page: Callable[[int], Awaitable[list[dict]]],
+        page_size: int,
+        user_id: int
+    ) -> None:
+        """
+        Args:
+            guild_id: サーバーID（ジャンプリンク用）
+            query: 検索語
+            fetch_page: ページ番号を受け取り、page_size + 1 件までの結果を返す関数
+            page_size: 1ページの表示件数
+            user_id: ページ送りできるユーザー（検索した人）
+        """
+        super().__init__(timeout=300)
+        self.guild_id = guild_id
+        self.query = query
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.user_id = user_id
+
+        self.page = 0
+        self.results: list[dict] = []
+        self.has_next = False
+
+    async def load(self, page: int) -> None:
+        """指定ページを読み込んでUIを再構築"""
+        rows = await self.fetch_page(page)
+        self.page = page
+        self.results = rows[:self.page_size]
+        self.has_next = len(rows) > self.page_size
+
+        self.clear_items()
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        """UIを構築"""
+        container = ui.Container(accent_colour=discord.Colour.blurple())
+
+        container.add_item(ui.TextDisplay(f"## 🔍 検索結果: {discord.utils.escape_markdown(self.query)}"))
+        container.add_item(ui.Separator())
+
+        if not self.results:
+            container.add_item(ui.TextDisplay("該当するメッセージが見つかりませんでした。"))
+        else:
+            start = self.page * self.page_size
+            for idx, row in enumerate(self.results, start + 1):
+                content = row["content"]
+                if len(content) > self.MAX_CONTENT_LENGTH:
+                    content = content[:self.MAX_CONTENT_LENGTH] + "…"
+                content = discord.utils.escape_mentions(content).replace("\n", " ")
+                jump_url = f"https://discord.com/channels/{self.guild_id}/{row['channel_id']}/{row['message_id']}"
+                posted = discord.utils.format_dt(discord.utils.snowflake_time(row["message_id"]), "f")
+                container.add_item(ui.TextDisplay(
+                    f"**{idx}.** <@{row['author_id']}> in <#{row['channel_id']}> ・ {posted} ・ [ジャンプ]({jump_url})\n"
+                    f"> {content}"
+                ))
+
+        container.add_item(ui.Separator())
+        container.add_item(ui.TextDisplay(f"-# ページ {self.page + 1} ・ 関連度順"))
+
+        if self.page > 0 or self.has_next:
+            button_row = ui.ActionRow()
+            button_row.add_item(ui.Button(
+                label="◀ 前へ",
+                style=discord.ButtonStyle.secondary,
+                custom_id="archive:search:prev",
+                disabled=self.page == 0
+            ))
+            button_row.add_item(ui.Button(
+                label="次へ ▶",
+                style=discord.ButtonStyle.secondary,
+                custom_id="archive:search:next",
+                disabled=not self.has_next
+            ))
+            container.add_item(button_row)
+
+        self.add_item(container)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """インタラクションのチェックとルーティング"""
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                "この検索結果は検索した人のみ操作できます。",
+                ephemeral=True
+            )
+            return False
+
+        custom_id = interaction.data.get("custom_id", "")
+
+        if custom_id == "archive:search:prev":
+            await self._change_page(interaction, self.page - 1)
+            return False
+        elif custom_id == "archive:search:next":
+            await self._change_page(interaction, self.page + 1)
+            return False
+
+        return True
+
+    async def _change_page(self, interaction: discord.Interaction, page: int) -> None:
+        """ページを切り替え"""
+        await interaction.response.defer()
+        try:
+            await self.load(max(page, 0))
+        except Exception as e:
+            logger.error(f"アーカイブ検索ページ取得エラー: {e}")
+            return
+        await interaction.edit_original_response(view=self)
@@ -3,6 +3,7 @@ Giveaway用 Components V2 View
 """
 from __future__ import annotations
 
+import re
 from typing import Optional
 from datetime import datetime
 
@@ -27,7 +28,6 @@ class GiveawayView(ui.LayoutView):
         winner_count: int = 1
     ) -> None:
         super().__init__(timeout=None)  # 永続的View
-        self.db = Database()
 
         container = ui.Container(accent_colour=discord.Colour.gold())
 
@@ -51,26 +51,33 @@ class GiveawayView(ui.LayoutView):
 
         # 参加ボタン
         button_row = ui.ActionRow()
-        button_row.add_item(ui.Button(
-            label="🎉 参加する",
-            style=discord.ButtonStyle.success,
-            custom_id="giveaway:join"
-        ))
+        button_row.add_item(GiveawayJoinButton())
         container.add_item(button_row)
 
         self.add_item(container)
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        """インタラクションのチェックとルーティング"""
-        custom_id = interaction.data.get("custom_id", "")
 
-        if custom_id == "giveaway:join":
-            await self.handle_join(interaction)
-            return False
+class GiveawayJoinButton(ui.DynamicItem[ui.Button], template=r"giveaway:join"):
+    """参加ボタン（全Giveaway共通のハンドラ。Giveawayはメッセージで特定）"""
+
+    def __init__(self) -> None:
+        super().__init__(ui.Button(
+            label="🎉 参加する",
+            style=discord.ButtonStyle.success,
+            custom_id="giveaway:join"
+        ))
+        self.db = Database()
 
-        return True
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Button,
+        match: re.Match[str]
+    ) -> GiveawayJoinButton:
+        return cls()
 
-    async def handle_join(self, interaction: discord.Interaction) -> None:
+    async def callback(self, interaction: discord.Interaction) -> None:
         """参加処理"""
         message_id = interaction.message.id
         user_id = interaction.user.id
@@ -99,7 +106,8 @@ class GiveawayView(ui.LayoutView):
         giveaway: dict
     ) -> None:
         """View を更新"""
-        host = interaction.guild.get_member(giveaway["host_id"])
+        # 表示（メンション）にのみ使うため、メンバーキャッシュになければユーザーキャッシュを使う
+        host = interaction.guild.get_member(giveaway["host_id"]) or interaction.client.get_user(giveaway["host_id"])
         if not host:
             try:
                 host = await interaction.client.fetch_user(giveaway["host_id"])
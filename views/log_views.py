@@ -18,7 +18,8 @@ class LogMessageDeleteView(ui.LayoutView):
         author_avatar: str,
         author_id: int,
         channel_mention: str,
-        content: str
+        content: str,
+        executor: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -36,6 +37,8 @@ class LogMessageDeleteView(ui.LayoutView):
 
         # ユーザー情報
         container.add_item(ui.TextDisplay(f"**ユーザー:** {author_name}"))
+        if executor:
+            container.add_item(ui.TextDisplay(f"**削除した人:** {executor}"))
 
         # 削除されたメッセージ
         container.add_item(ui.TextDisplay("**削除されたメッセージ:**"))
@@ -142,16 +145,23 @@ class LogMemberLeaveView(ui.LayoutView):
         member_avatar: str,
         member_id: int,
         joined_at: str,
-        roles: list[str]
+        roles: list[str],
+        kicked_by: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
         container = ui.Container(accent_colour=discord.Colour.red())
 
-        # ヘッダー
+        # ヘッダー（キックの場合は実行者を表示）
+        if kicked_by:
+            title = "## 👢 メンバーキック"
+            desc = f"{member_mention} がキックされました"
+        else:
+            title = "## 👤 メンバー退出"
+            desc = f"{member_mention} がサーバーから退出しました"
         header = ui.Section(
-            ui.TextDisplay("## 👤 メンバー退出"),
-            ui.TextDisplay(f"{member_mention} がサーバーから退出しました"),
+            ui.TextDisplay(title),
+            ui.TextDisplay(desc),
             accessory=ui.Thumbnail(member_avatar)
         )
         container.add_item(header)
@@ -161,6 +171,8 @@ class LogMemberLeaveView(ui.LayoutView):
         # 情報
         info_text = f"**ユーザー:** {member_name}\n"
         info_text += f"**参加日:** {joined_at}"
+        if kicked_by:
+            info_text += f"\n**実行者:** {kicked_by}"
         container.add_item(ui.TextDisplay(info_text))
 
         # ロール
@@ -185,7 +197,8 @@ class LogMemberBanView(ui.LayoutView):
         user_mention: str,
         user_avatar: str,
         user_id: int,
-        is_unban: bool = False
+        is_unban: bool = False,
+        executor: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -208,6 +221,8 @@ class LogMemberBanView(ui.LayoutView):
 
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(f"**ユーザー:** {user_name}"))
+        if executor:
+            container.add_item(ui.TextDisplay(f"**実行者:** {executor}"))
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(f"-# ユーザーID: {user_id}"))
 
@@ -223,7 +238,8 @@ class LogChannelView(ui.LayoutView):
         channel_type: str,
         channel_id: int,
         is_delete: bool = False,
-        channel_mention: Optional[str] = None
+        channel_mention: Optional[str] = None,
+        executor: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -240,6 +256,8 @@ class LogChannelView(ui.LayoutView):
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(desc))
         container.add_item(ui.TextDisplay(f"**タイプ:** {channel_type}"))
+        if executor:
+            container.add_item(ui.TextDisplay(f"**実行者:** {executor}"))
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(f"-# チャンネルID: {channel_id}"))
 
@@ -255,7 +273,8 @@ class LogRoleView(ui.LayoutView):
         role_id: int,
         is_delete: bool = False,
         role_mention: Optional[str] = None,
-        role_colour: Optional[discord.Colour] = None
+        role_colour: Optional[discord.Colour] = None,
+        executor: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -272,6 +291,8 @@ class LogRoleView(ui.LayoutView):
         container.add_item(ui.TextDisplay(title))
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(desc))
+        if executor:
+            container.add_item(ui.TextDisplay(f"**実行者:** {executor}"))
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(f"-# ロールID: {role_id}"))
 
@@ -351,7 +372,8 @@ class LogChannelUpdateView(ui.LayoutView):
         channel_name: str,
         channel_mention: str,
         channel_id: int,
-        changes: list[str]
+        changes: list[str],
+        executor: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -360,6 +382,8 @@ class LogChannelUpdateView(ui.LayoutView):
         container.add_item(ui.TextDisplay("## 📢 チャンネル更新"))
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(f"**チャンネル:** {channel_mention}"))
+        if executor:
+            container.add_item(ui.TextDisplay(f"**実行者:** {executor}"))
 
         if changes:
             changes_text = "\n".join(changes)
@@ -380,7 +404,8 @@ class LogRoleUpdateView(ui.LayoutView):
         role_mention: str,
         role_id: int,
         changes: list[str],
-        role_colour: Optional[discord.Colour] = None
+        role_colour: Optional[discord.Colour] = None,
+        executor: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -390,6 +415,8 @@ class LogRoleUpdateView(ui.LayoutView):
         container.add_item(ui.TextDisplay("## 🎭 ロール更新"))
         container.add_item(ui.Separator())
         container.add_item(ui.TextDisplay(f"**ロール:** {role_mention}"))
+        if executor:
+            container.add_item(ui.TextDisplay(f"**実行者:** {executor}"))
 
         if changes:
             changes_text = "\n".join(changes)
@@ -399,3 +426,92 @@ class LogRoleUpdateView(ui.LayoutView):
         container.add_item(ui.TextDisplay(f"-# ロールID: {role_id}"))
 
         self.add_item(container)
+
+
+class LogRaidModeView(ui.LayoutView):
+    """レイドモード開始・解除ログ"""
+
+    def __init__(
+        self,
+        is_active: bool,
+        join_count: int,
+        window: int,
+        paused_count: int = 0
+    ) -> None:
+        super().__init__(timeout=None)
+
+        colour = discord.Colour.dark_red() if is_active else discord.Colour.green()
+        container = ui.Container(accent_colour=colour)
+
+        if is_active:
+            container.add_item(ui.TextDisplay("## 🚨 レイドモード開始"))
+            container.add_item(ui.Separator())
+            container.add_item(ui.TextDisplay(
+                f"**{window}秒** 以内に **{join_count}人** が参加しました。\n"
+                "大量参加が収まるまで自動ロールの付与を停止します。"
+            ))
+        else:
+            container.add_item(ui.TextDisplay("## ✅ レイドモード解除"))
+            container.add_item(ui.Separator())
+            container.add_item(ui.TextDisplay(
+                f"大量参加が収まったため自動ロールの付与を再開しました。\n"
+                f"**レイドモード中の参加:** {join_count}人\n"
+                f"**付与を見送ったメンバー:** {paused_count}人"
+            ))
+
+        self.add_item(container)
+
+
+class LogDigestView(ui.LayoutView):
+    """ログダイジェスト（一定時間内のイベントをまとめて表示）"""
+
+    # カテゴリの表示順とラベル
+    CATEGORY_LABELS = {
+        "moderation": "🔨 モデレーション",
+        "members": "👤 メンバー",
+        "messages": "📝 メッセージ",
+        "channels": "📢 チャンネル",
+        "roles": "🎭 ロール",
+    }
+
+    # TextDisplay 1つあたりの最大文字数
+    MAX_SECTION_LENGTH = 900
+
+    def __init__(
+        self,
+        events: list[tuple[str, str]],
+        started_at: datetime,
+        ended_at: datetime
+    ) -> None:
+        super().__init__(timeout=None)
+
+        container = ui.Container(accent_colour=discord.Colour.blurple())
+
+        container.add_item(ui.TextDisplay(f"## 📋 サーバーログ（{len(events)} 件）"))
+
+        # カテゴリごとにグループ化
+        grouped: dict[str, list[str]] = {}
+        for category, line in events:
+            grouped.setdefault(category, []).append(line)
+
+        for category, label in self.CATEGORY_LABELS.items():
+            lines = grouped.get(category)
+            if not lines:
+                continue
+
+            container.add_item(ui.Separator())
+            text = f"**{label}**（{len(lines)} 件）"
+            for i, line in enumerate(lines):
+                entry = f"\n• {line}"
+                if len(text) + len(entry) > self.MAX_SECTION_LENGTH:
+                    text += f"\n-# 他 {len(lines) - i} 件"
+                    break
+                text += entry
+            container.add_item(ui.TextDisplay(text))
+
+        container.add_item(ui.Separator())
+        start = discord.utils.format_dt(started_at, "T")
+        end = discord.utils.format_dt(ended_at, "T")
+        container.add_item(ui.TextDisplay(f"-# {start} 〜 {end}"))
+
+        self.add_item(container)
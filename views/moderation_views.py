@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import discord
 from discord import ui
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 
 class LogModerationActionView(ui.LayoutView):
@@ -157,3 +157,143 @@ class ModerationDMView(ui.LayoutView):
         container.add_item(ui.TextDisplay(info_text))
 
         self.add_item(container)
+
+
+class BulkModerationView(ui.LayoutView):
+    """一括モデレーションの確認・進捗・結果表示"""
+
+    ACTION_TEXT = {
+        "ban": ("BAN", discord.Colour.dark_red()),
+        "kick": ("キック", discord.Colour.orange()),
+        "timeout": ("タイムアウト", discord.Colour.gold())
+    }
+
+    # 失敗の詳細を表示する最大件数
+    MAX_FAILURES_SHOWN = 10
+
+    def __init__(
+        self,
+        action_type: str,  # "ban", "kick", "timeout"
+        targets: list[discord.Member],
+        reason: str,
+        moderator_id: int,
+        duration: Optional[str] = None,  # timeout用
+        skipped: int = 0,
+        on_confirm: Optional[Callable[[discord.Interaction], Awaitable[None]]] = None
+    ) -> None:
+        super().__init__(timeout=300 if on_confirm else None)
+        self.action_type = action_type
+        self.targets = targets
+        self.reason = reason
+        self.moderator_id = moderator_id
+        self.duration = duration
+        self.skipped = skipped
+        self.on_confirm = on_confirm
+
+        # 進捗
+        self.state = "confirm" if on_confirm else "running"  # confirm / running / done / cancelled
+        self.succeeded = 0
+        self.failures: list[str] = []
+
+        self._build_ui()
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + len(self.failures)
+
+    def refresh(self) -> None:
+        """現在の状態でUIを再構築"""
+        self.clear_items()
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        """UIを構築"""
+        action_text, colour = self.ACTION_TEXT.get(self.action_type, (self.action_type, discord.Colour.red()))
+        if self.state == "done":
+            colour = discord.Colour.green() if not self.failures else discord.Colour.orange()
+        container = ui.Container(accent_colour=colour)
+
+        titles = {
+            "confirm": f"## ⚠️ 一括{action_text}の確認",
+            "running": f"## ⏳ 一括{action_text}を実行中",
+            "done": f"## ✅ 一括{action_text}完了",
+            "cancelled": f"## 🚫 一括{action_text}を中止しました",
+        }
+        container.add_item(ui.TextDisplay(titles[self.state]))
+        container.add_item(ui.Separator())
+
+        info_text = f"**対象:** {len(self.targets)}人\n"
+        info_text += f"**実行者:** <@{self.moderator_id}>\n"
+        info_text += f"**理由:** {self.reason}"
+        if self.duration:
+            info_text += f"\n**期間:** {self.duration}"
+        if self.skipped:
+            info_text += f"\n**除外:** {self.skipped}人（権限・ロール階層のため）"
+        container.add_item(ui.TextDisplay(info_text))
+
+        if self.state == "confirm":
+            preview = ", ".join(m.mention for m in self.targets[:20])
+            if len(self.targets) > 20:
+                preview += f" ... 他 {len(self.targets) - 20}人"
+            container.add_item(ui.TextDisplay(f"-# {preview}"))
+            container.add_item(ui.Separator())
+
+            button_row = ui.ActionRow()
+            button_row.add_item(ui.Button(
+                label=f"{len(self.targets)}人を{action_text}",
+                style=discord.ButtonStyle.danger,
+                custom_id="bulkmod:confirm"
+            ))
+            button_row.add_item(ui.Button(
+                label="キャンセル",
+                style=discord.ButtonStyle.secondary,
+                custom_id="bulkmod:cancel"
+            ))
+            container.add_item(button_row)
+        elif self.state != "cancelled":
+            container.add_item(ui.Separator())
+            total = len(self.targets)
+            filled = int(10 * self.processed / total) if total else 10
+            bar = "█" * filled + "░" * (10 - filled)
+            container.add_item(ui.TextDisplay(
+                f"`{bar}` {self.processed}/{total}\n"
+                f"**成功:** {self.succeeded}　**失敗:** {len(self.failures)}"
+            ))
+
+            if self.failures and self.state == "done":
+                failures_text = "\n".join(f"• {line}" for line in self.failures[:self.MAX_FAILURES_SHOWN])
+                if len(self.failures) > self.MAX_FAILURES_SHOWN:
+                    failures_text += f"\n... 他 {len(self.failures) - self.MAX_FAILURES_SHOWN}件"
+                container.add_item(ui.TextDisplay(f"**失敗の詳細:**\n{failures_text}"))
+
+        self.add_item(container)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """インタラクションのチェックとルーティング"""
+        if interaction.user.id != self.moderator_id:
+            await interaction.response.send_message(
+                "この操作はコマンドを実行した人のみ行えます。",
+                ephemeral=True
+            )
+            return False
+
+        custom_id = interaction.data.get("custom_id", "")
+
+        if self.state != "confirm":
+            return False
+
+        if custom_id == "bulkmod:confirm":
+            self.state = "running"
+            self.stop()
+            self.refresh()
+            await interaction.response.edit_message(view=self)
+            await self.on_confirm(interaction)
+            return False
+        elif custom_id == "bulkmod:cancel":
+            self.state = "cancelled"
+            self.stop()
+            self.refresh()
+            await interaction.response.edit_message(view=self)
+            return False
+
+        return True
@@ -19,7 +19,8 @@ class NowPlayingView(ui.LayoutView):
         source: str,
         queue_count: int = 0,
         loop_mode: Optional[str] = None,
-        thumbnail_url: Optional[str] = None
+        thumbnail_url: Optional[str] = None,
+        notice: Optional[str] = None
     ) -> None:
         super().__init__(timeout=None)
 
@@ -56,6 +57,11 @@ class NowPlayingView(ui.LayoutView):
                 extra_text += f"**ループ:** {loop_text}"
             container.add_item(ui.TextDisplay(extra_text.strip()))
 
+        # 直前の曲のエラー・警告など
+        if notice:
+            container.add_item(ui.Separator())
+            container.add_item(ui.TextDisplay(notice))
+
         self.add_item(container)
 
 
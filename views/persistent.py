@@ -19,37 +19,64 @@ logger = get_logger("sumire.views")
 class PersistentViewManager:
     """永続的Viewを管理するクラス"""
 
+    @staticmethod
+    def dynamic_items() -> tuple[type[discord.ui.DynamicItem], ...]:
+        """
+        永続的なコンポーネント（custom_id テンプレートで全メッセージを処理する）
+
+        対象（チケット・投票など）は custom_id またはメッセージIDで特定するため、
+        メッセージ数に関係なくハンドラは一定数になる。
+        """
+        from .ticket_views import TicketCreateButton, TicketControlButton, TicketCategorySelect
+        from .poll_views import PollVoteButton
+        from .giveaway_views import GiveawayJoinButton
+        from .teamshuffle_views import TeamShuffleButton, TeamShuffleTeamCountSelect
+
+        return (
+            TicketCreateButton,
+            TicketControlButton,
+            TicketCategorySelect,
+            PollVoteButton,
+            GiveawayJoinButton,
+            TeamShuffleButton,
+            TeamShuffleTeamCountSelect,
+        )
+
     @staticmethod
     async def register_all(bot: SumireBot) -> None:
         """
-        全ての永続的Viewをbotに登録
+        全ての永続的なコンポーネントをbotに登録
         Bot起動時に呼び出される
         """
-        from .ticket_views import TicketPanelView, TicketControlView
-        from .teamshuffle_views import TeamShufflePanelView
+        items = PersistentViewManager.dynamic_items()
+        bot.add_dynamic_items(*items)
+        logger.info(f"永続的コンポーネントを登録完了: {len(items)} 種類")
 
-        # チケットパネルView（custom_idベースで登録）
-        bot.add_view(TicketPanelView(bot))
+    @staticmethod
+    async def purge_stale(bot: SumireBot) -> int:
+        """
+        チャンネルが削除された永続的Viewの行を削除
 
-        # チーム分けくじパネルView（custom_idベースで登録）
-        bot.add_view(TeamShufflePanelView(bot))
+        一時的に利用できないサーバーと、他のクラスターが担当するサーバーの行は残す。
 
-        # データベースから保存された永続的Viewを取得
+        Returns:
+            int: 削除した件数
+        """
         db = Database()
+        stale = []
+        for view_data in await db.get_persistent_views():
+            if not bot.owns_guild(view_data["guild_id"]):
+                continue
+            guild = bot.get_guild(view_data["guild_id"])
+            if guild is not None and guild.unavailable:
+                continue
+            if guild is None or guild.get_channel_or_thread(view_data["channel_id"]) is None:
+                stale.append(view_data["message_id"])
 
-        # チケットコントロールパネルを復元
-        ticket_controls = await db.get_persistent_views(view_type="ticket_control")
-        for view_data in ticket_controls:
-            try:
-                ticket_id = view_data.get("data", {}).get("ticket_id")
-                if ticket_id:
-                    view = TicketControlView(bot, ticket_id)
-                    bot.add_view(view, message_id=view_data["message_id"])
-                    logger.debug(f"チケットコントロールViewを復元: message_id={view_data['message_id']}")
-            except Exception as e:
-                logger.error(f"View復元エラー: {e}")
-
-        logger.info(f"永続的Viewを登録完了: {len(ticket_controls)} 個のチケットコントロール")
+        if stale:
+            await db.delete_persistent_views(stale)
+            logger.info(f"永続的Viewを掃除: {len(stale)} 件")
+        return len(stale)
 
     @staticmethod
     async def save_view(
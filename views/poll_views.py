@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import re
 from typing import Optional
 from datetime import datetime
 
@@ -38,7 +39,6 @@ class PollView(ui.LayoutView):
         ended: bool = False
     ) -> None:
         super().__init__(timeout=None)  # 永続的View
-        self.db = Database()
 
         # 投票数を集計
         vote_counts = [0] * len(options)
@@ -96,34 +96,41 @@ class PollView(ui.LayoutView):
             for row_start in range(0, len(options), 5):
                 button_row = ui.ActionRow()
                 for idx in range(row_start, min(row_start + 5, len(options))):
-                    emoji = OPTION_EMOJIS[idx] if idx < len(OPTION_EMOJIS) else str(idx + 1)
-                    button_row.add_item(ui.Button(
-                        label=emoji,
-                        style=discord.ButtonStyle.primary,
-                        custom_id=f"poll:vote:{idx}"
-                    ))
+                    button_row.add_item(PollVoteButton(idx))
                 container.add_item(button_row)
 
         self.add_item(container)
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        """インタラクションのチェックとルーティング"""
-        custom_id = interaction.data.get("custom_id", "")
 
-        if custom_id.startswith("poll:vote:"):
-            option_idx = int(custom_id.split(":")[-1])
-            await self.handle_vote(interaction, option_idx)
-            return False
+class PollVoteButton(ui.DynamicItem[ui.Button], template=r"poll:vote:(?P<option>[0-9]+)"):
+    """投票ボタン（全投票共通のハンドラ。投票はメッセージIDで特定）"""
 
-        return True
+    def __init__(self, option_idx: int) -> None:
+        emoji = OPTION_EMOJIS[option_idx] if option_idx < len(OPTION_EMOJIS) else str(option_idx + 1)
+        super().__init__(ui.Button(
+            label=emoji,
+            style=discord.ButtonStyle.primary,
+            custom_id=f"poll:vote:{option_idx}"
+        ))
+        self.option_idx = option_idx
+        self.db = Database()
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Button,
+        match: re.Match[str]
+    ) -> PollVoteButton:
+        return cls(int(match["option"]))
 
-    async def handle_vote(self, interaction: discord.Interaction, option_idx: int) -> None:
+    async def callback(self, interaction: discord.Interaction) -> None:
         """投票処理"""
         message_id = interaction.message.id
         user_id = interaction.user.id
 
         # 投票
-        success = await self.db.vote_poll(message_id, user_id, option_idx)
+        success = await self.db.vote_poll(message_id, user_id, self.option_idx)
 
         if success:
             await interaction.response.send_message(
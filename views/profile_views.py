@@ -79,7 +79,8 @@ class ProfileView(ui.LayoutView):
         member: discord.Member,
         vc_time: int = 0,
         reactions_given: int = 0,
-        reactions_received: int = 0
+        reactions_received: int = 0,
+        card: Optional[str] = None
     ) -> None:
         super().__init__(timeout=300)
 
@@ -100,6 +101,10 @@ class ProfileView(ui.LayoutView):
         section.add_item(ui.TextDisplay(header_text))
         container.add_item(section)
 
+        # ランクカード画像
+        if card:
+            container.add_item(ui.MediaGallery(discord.MediaGalleryItem(f"attachment://{card}")))
+
         container.add_item(ui.Separator())
 
         # アカウント情報
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import random
+import re
 from typing import TYPE_CHECKING, Optional
 
 import discord
@@ -52,7 +53,6 @@ class TeamShufflePanelView(ui.LayoutView):
     ) -> None:
         super().__init__(timeout=None)  # 永続的View
         self.bot = bot
-        self.db = Database()
         self._title = title
         self._creator = creator
         self._participants = participants or []
@@ -89,46 +89,19 @@ class TeamShufflePanelView(ui.LayoutView):
 
         # 参加・退出ボタン
         button_row = ui.ActionRow()
-        button_row.add_item(ui.Button(
-            label="✋ 参加",
-            style=discord.ButtonStyle.success,
-            custom_id="teamshuffle:join"
-        ))
-        button_row.add_item(ui.Button(
-            label="🚪 退出",
-            style=discord.ButtonStyle.secondary,
-            custom_id="teamshuffle:leave"
-        ))
+        button_row.add_item(TeamShuffleButton("join"))
+        button_row.add_item(TeamShuffleButton("leave"))
         container.add_item(button_row)
 
         # チーム数選択
         select_row = ui.ActionRow()
-        select_row.add_item(ui.Select(
-            placeholder=f"📊 チーム数: {self._team_count}",
-            options=[
-                discord.SelectOption(
-                    label=f"{i}チーム",
-                    value=str(i),
-                    default=(i == self._team_count)
-                )
-                for i in range(2, 11)  # 2〜10チーム
-            ],
-            custom_id="teamshuffle:teamcount"
-        ))
+        select_row.add_item(TeamShuffleTeamCountSelect(self._team_count))
         container.add_item(select_row)
 
         # シャッフル実行・中止ボタン
         shuffle_row = ui.ActionRow()
-        shuffle_row.add_item(ui.Button(
-            label="🎲 シャッフル実行",
-            style=discord.ButtonStyle.primary,
-            custom_id="teamshuffle:shuffle"
-        ))
-        shuffle_row.add_item(ui.Button(
-            label="🗑️ 中止",
-            style=discord.ButtonStyle.danger,
-            custom_id="teamshuffle:cancel"
-        ))
+        shuffle_row.add_item(TeamShuffleButton("shuffle"))
+        shuffle_row.add_item(TeamShuffleButton("cancel"))
         container.add_item(shuffle_row)
 
         # フッター
@@ -138,27 +111,143 @@ class TeamShufflePanelView(ui.LayoutView):
 
         self.add_item(container)
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        """インタラクションのチェックとルーティング"""
-        custom_id = interaction.data.get("custom_id", "")
 
-        if custom_id == "teamshuffle:join":
+# パネルボタンの表示（ラベル, スタイル）
+TEAM_SHUFFLE_BUTTONS = {
+    "join": ("✋ 参加", discord.ButtonStyle.success),
+    "leave": ("🚪 退出", discord.ButtonStyle.secondary),
+    "shuffle": ("🎲 シャッフル実行", discord.ButtonStyle.primary),
+    "cancel": ("🗑️ 中止", discord.ButtonStyle.danger),
+}
+
+
+async def _update_panel(interaction: discord.Interaction) -> None:
+    """パネルのViewを最新の状態に更新"""
+    message_id = interaction.message.id
+    panel = await Database().get_team_shuffle_panel(message_id)
+
+    if not panel:
+        return
+
+    # 作成者を取得（表示にのみ使うため、メンバーキャッシュになければユーザーキャッシュを使う）
+    creator = interaction.guild.get_member(panel["creator_id"]) or interaction.client.get_user(panel["creator_id"])
+    if not creator:
+        try:
+            creator = await interaction.client.fetch_user(panel["creator_id"])
+        except Exception:
+            creator = None
+
+    # 新しいViewを作成
+    new_view = TeamShufflePanelView(
+        bot=interaction.client,
+        title=panel["title"],
+        creator=creator,
+        participants=panel["participants"],
+        team_count=panel["team_count"]
+    )
+
+    try:
+        await interaction.message.edit(view=new_view)
+    except Exception as e:
+        logger.error(f"View更新エラー: {e}")
+
+
+class TeamShuffleTeamCountSelect(ui.DynamicItem[ui.Select], template=r"teamshuffle:teamcount"):
+    """チーム数選択（全パネル共通のハンドラ。パネルはメッセージIDで特定）"""
+
+    def __init__(self, team_count: int = 2) -> None:
+        super().__init__(ui.Select(
+            placeholder=f"📊 チーム数: {team_count}",
+            options=[
+                discord.SelectOption(
+                    label=f"{i}チーム",
+                    value=str(i),
+                    default=(i == team_count)
+                )
+                for i in range(2, 11)  # 2〜10チーム
+            ],
+            custom_id="teamshuffle:teamcount"
+        ))
+        self.db = Database()
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Select,
+        match: re.Match[str]
+    ) -> TeamShuffleTeamCountSelect:
+        return cls()
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """チーム数変更処理"""
+        message_id = interaction.message.id
+        values = interaction.data.get("values", [])
+
+        if not values:
+            return
+
+        new_count = int(values[0])
+
+        # パネル情報を取得して作成者チェック
+        panel = await self.db.get_team_shuffle_panel(message_id)
+        if not panel:
+            await interaction.response.send_message(
+                "パネルが見つかりません。",
+                ephemeral=True
+            )
+            return
+
+        if interaction.user.id != panel["creator_id"]:
+            await interaction.response.send_message(
+                "チーム数を変更できるのは作成者のみです。",
+                ephemeral=True
+            )
+            return
+
+        await self.db.update_team_shuffle_team_count(message_id, new_count)
+        await interaction.response.send_message(
+            f"📊 チーム数を {new_count} に変更しました。",
+            ephemeral=True
+        )
+        await _update_panel(interaction)
+
+
+class TeamShuffleButton(
+    ui.DynamicItem[ui.Button],
+    template=r"teamshuffle:(?P<action>join|leave|shuffle|cancel)"
+):
+    """パネルのボタン（全パネル共通のハンドラ。パネルはメッセージIDで特定）"""
+
+    def __init__(self, action: str) -> None:
+        label, style = TEAM_SHUFFLE_BUTTONS[action]
+        super().__init__(ui.Button(
+            label=label,
+            style=style,
+            custom_id=f"teamshuffle:{action}"
+        ))
+        self.action = action
+        self.db = Database()
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Button,
+        match: re.Match[str]
+    ) -> TeamShuffleButton:
+        return cls(match["action"])
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """操作ごとに振り分け"""
+        if self.action == "join":
             await self.handle_join(interaction)
-            return False
-        elif custom_id == "teamshuffle:leave":
+        elif self.action == "leave":
             await self.handle_leave(interaction)
-            return False
-        elif custom_id == "teamshuffle:teamcount":
-            await self.handle_team_count(interaction)
-            return False
-        elif custom_id == "teamshuffle:shuffle":
+        elif self.action == "shuffle":
             await self.handle_shuffle(interaction)
-            return False
-        elif custom_id == "teamshuffle:cancel":
+        elif self.action == "cancel":
             await self.handle_cancel(interaction)
-            return False
-
-        return True
 
     async def handle_join(self, interaction: discord.Interaction) -> None:
         """参加処理"""
@@ -172,7 +261,7 @@ class TeamShufflePanelView(ui.LayoutView):
                 "✋ チーム分けくじに参加しました！",
                 ephemeral=True
             )
-            await self._update_view(interaction)
+            await _update_panel(interaction)
         else:
             await interaction.response.send_message(
                 "既に参加済みです。",
@@ -191,46 +280,13 @@ class TeamShufflePanelView(ui.LayoutView):
                 "🚪 チーム分けくじから退出しました。",
                 ephemeral=True
             )
-            await self._update_view(interaction)
+            await _update_panel(interaction)
         else:
             await interaction.response.send_message(
                 "参加していません。",
                 ephemeral=True
             )
 
-    async def handle_team_count(self, interaction: discord.Interaction) -> None:
-        """チーム数変更処理"""
-        message_id = interaction.message.id
-        values = interaction.data.get("values", [])
-
-        if not values:
-            return
-
-        new_count = int(values[0])
-
-        # パネル情報を取得して作成者チェック
-        panel = await self.db.get_team_shuffle_panel(message_id)
-        if not panel:
-            await interaction.response.send_message(
-                "パネルが見つかりません。",
-                ephemeral=True
-            )
-            return
-
-        if interaction.user.id != panel["creator_id"]:
-            await interaction.response.send_message(
-                "チーム数を変更できるのは作成者のみです。",
-                ephemeral=True
-            )
-            return
-
-        await self.db.update_team_shuffle_team_count(message_id, new_count)
-        await interaction.response.send_message(
-            f"📊 チーム数を {new_count} に変更しました。",
-            ephemeral=True
-        )
-        await self._update_view(interaction)
-
     async def handle_shuffle(self, interaction: discord.Interaction) -> None:
         """シャッフル実行処理"""
         message_id = interaction.message.id
@@ -332,36 +388,6 @@ class TeamShufflePanelView(ui.LayoutView):
         except Exception as e:
             logger.error(f"パネル削除エラー: {e}")
 
-    async def _update_view(self, interaction: discord.Interaction) -> None:
-        """Viewを更新"""
-        message_id = interaction.message.id
-        panel = await self.db.get_team_shuffle_panel(message_id)
-
-        if not panel:
-            return
-
-        # 作成者を取得
-        creator = interaction.guild.get_member(panel["creator_id"])
-        if not creator:
-            try:
-                creator = await interaction.client.fetch_user(panel["creator_id"])
-            except Exception:
-                creator = None
-
-        # 新しいViewを作成
-        new_view = TeamShufflePanelView(
-            bot=self.bot,
-            title=panel["title"],
-            creator=creator,
-            participants=panel["participants"],
-            team_count=panel["team_count"]
-        )
-
-        try:
-            await interaction.message.edit(view=new_view)
-        except Exception as e:
-            logger.error(f"View更新エラー: {e}")
-
 
 class TeamShuffleResultView(ui.LayoutView):
     """チーム分け結果 View"""
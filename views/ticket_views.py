@@ -4,6 +4,8 @@ Components V2 (LayoutView + Container) を使用
 """
 from __future__ import annotations
 
+import re
+
 import discord
 from discord import ui
 from typing import TYPE_CHECKING, Optional
@@ -57,8 +59,6 @@ class TicketPanelView(ui.LayoutView):
     def __init__(self, bot: Optional[SumireBot] = None) -> None:
         super().__init__(timeout=None)
         self.bot = bot
-        self.config = Config()
-        self.db = Database()
 
         # Container を作成
         container = ui.Container(accent_colour=discord.Colour.purple())
@@ -90,25 +90,35 @@ class TicketPanelView(ui.LayoutView):
 
         # ボタン用ActionRow
         action_row = ui.ActionRow()
-        create_button = ui.Button(
-            label="🎫 チケットを作成",
-            style=discord.ButtonStyle.primary,
-            custom_id="ticket:panel:create"
-        )
-        action_row.add_item(create_button)
+        action_row.add_item(TicketCreateButton())
         container.add_item(action_row)
 
         # ContainerをLayoutViewに追加
         self.add_item(container)
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        """インタラクションのチェックとルーティング"""
-        if interaction.data.get("custom_id") == "ticket:panel:create":
-            await self.create_ticket(interaction)
-            return False
-        return True
 
-    async def create_ticket(self, interaction: discord.Interaction) -> None:
+class TicketCreateButton(ui.DynamicItem[ui.Button], template=r"ticket:panel:create"):
+    """チケット作成ボタン（全パネル共通のハンドラ）"""
+
+    def __init__(self) -> None:
+        super().__init__(ui.Button(
+            label="🎫 チケットを作成",
+            style=discord.ButtonStyle.primary,
+            custom_id="ticket:panel:create"
+        ))
+        self.config = Config()
+        self.db = Database()
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Button,
+        match: re.Match[str]
+    ) -> TicketCreateButton:
+        return cls()
+
+    async def callback(self, interaction: discord.Interaction) -> None:
         """チケット作成処理"""
         await interaction.response.defer(ephemeral=True)
 
@@ -190,10 +200,10 @@ class TicketPanelView(ui.LayoutView):
         )
 
         # チケット制御パネルを送信
-        control_view = TicketControlView(self.bot, ticket_id)
+        control_view = TicketControlView(interaction.client, ticket_id)
         control_message = await channel.send(view=control_view)
 
-        # 永続的Viewとして保存
+        # 永続的Viewとして保存（チャンネル削除後の掃除用）
         from .persistent import PersistentViewManager
         await PersistentViewManager.save_view(
             guild_id=guild.id,
@@ -227,8 +237,6 @@ class TicketControlView(ui.LayoutView):
         super().__init__(timeout=None)
         self.bot = bot
         self.ticket_id = ticket_id
-        self.db = Database()
-        self.config = Config()
 
         # Container を作成
         container = ui.Container(accent_colour=discord.Colour.blue())
@@ -240,57 +248,109 @@ class TicketControlView(ui.LayoutView):
 
         # カテゴリ選択用ActionRow
         category_row = ui.ActionRow()
-        category_select = ui.Select(
-            placeholder="📋 カテゴリを選択...",
-            options=[
-                discord.SelectOption(label=cat, value=cat)
-                for cat in self.config.ticket_categories
-            ],
-            custom_id=f"ticket:control:category:{ticket_id}"
-        )
-        category_row.add_item(category_select)
+        category_row.add_item(TicketCategorySelect(ticket_id))
         container.add_item(category_row)
 
         # ボタン用ActionRow
         button_row = ui.ActionRow()
-        button_row.add_item(ui.Button(
-            label="⏸️ 保留",
-            style=discord.ButtonStyle.secondary,
-            custom_id="ticket:control:hold"
-        ))
-        button_row.add_item(ui.Button(
-            label="👤 担当者追加",
-            style=discord.ButtonStyle.secondary,
-            custom_id="ticket:control:assign"
-        ))
-        button_row.add_item(ui.Button(
-            label="🔒 クローズ",
-            style=discord.ButtonStyle.danger,
-            custom_id="ticket:control:close"
-        ))
+        for action in ("hold", "assign", "close"):
+            button_row.add_item(TicketControlButton(action, ticket_id))
         container.add_item(button_row)
 
         # ContainerをLayoutViewに追加
         self.add_item(container)
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        """インタラクションのチェックとルーティング"""
-        custom_id = interaction.data.get("custom_id", "")
 
-        if custom_id == "ticket:control:hold":
+class TicketCategorySelect(
+    ui.DynamicItem[ui.Select],
+    template=r"ticket:control:category:(?P<ticket_id>[0-9]+)"
+):
+    """チケットのカテゴリ選択（全チケット共通のハンドラ）"""
+
+    def __init__(self, ticket_id: int) -> None:
+        super().__init__(ui.Select(
+            placeholder="📋 カテゴリを選択...",
+            options=[
+                discord.SelectOption(label=cat, value=cat)
+                for cat in Config().ticket_categories
+            ],
+            custom_id=f"ticket:control:category:{ticket_id}"
+        ))
+        self.ticket_id = ticket_id
+        self.db = Database()
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Select,
+        match: re.Match[str]
+    ) -> TicketCategorySelect:
+        return cls(int(match["ticket_id"]))
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """カテゴリを設定"""
+        await interaction.response.defer(ephemeral=True)
+
+        selected = interaction.data.get("values", [None])[0]
+        if not selected:
+            return
+
+        await self.db.update_ticket_category(interaction.channel.id, selected)
+
+        view = CommonSuccessView(
+            title="カテゴリを設定しました",
+            description=f"カテゴリ: **{selected}**"
+        )
+        await interaction.followup.send(view=view, ephemeral=True)
+
+        logger.info(f"チケットカテゴリ変更: {selected} - channel_id={interaction.channel.id}")
+
+
+# ボタンの表示（ラベル, スタイル）
+TICKET_CONTROL_BUTTONS = {
+    "hold": ("⏸️ 保留", discord.ButtonStyle.secondary),
+    "assign": ("👤 担当者追加", discord.ButtonStyle.secondary),
+    "close": ("🔒 クローズ", discord.ButtonStyle.danger),
+}
+
+
+class TicketControlButton(
+    ui.DynamicItem[ui.Button],
+    # チケットIDを含まない旧形式のcustom_idも受け付ける
+    template=r"ticket:control:(?P<action>hold|assign|close)(?::(?P<ticket_id>[0-9]+))?"
+):
+    """チケット制御ボタン（全チケット共通のハンドラ）"""
+
+    def __init__(self, action: str, ticket_id: int) -> None:
+        label, style = TICKET_CONTROL_BUTTONS[action]
+        super().__init__(ui.Button(
+            label=label,
+            style=style,
+            custom_id=f"ticket:control:{action}:{ticket_id}"
+        ))
+        self.action = action
+        self.ticket_id = ticket_id
+        self.db = Database()
+        self.config = Config()
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: ui.Button,
+        match: re.Match[str]
+    ) -> TicketControlButton:
+        return cls(match["action"], int(match["ticket_id"] or 0))
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """操作ごとに振り分け"""
+        if self.action == "hold":
             await self.hold_ticket(interaction)
-            return False
-        elif custom_id == "ticket:control:assign":
+        elif self.action == "assign":
             await self.assign_staff(interaction)
-            return False
-        elif custom_id == "ticket:control:close":
+        elif self.action == "close":
             await self.close_ticket(interaction)
-            return False
-        elif custom_id.startswith("ticket:control:category:"):
-            await self.set_category(interaction)
-            return False
-
-        return True
 
     async def hold_ticket(self, interaction: discord.Interaction) -> None:
         """チケットを保留状態に"""
@@ -333,24 +393,6 @@ class TicketControlView(ui.LayoutView):
         confirm_view = ConfirmCloseView(interaction.channel.id)
         await interaction.followup.send(view=confirm_view, ephemeral=True)
 
-    async def set_category(self, interaction: discord.Interaction) -> None:
-        """カテゴリを設定"""
-        await interaction.response.defer(ephemeral=True)
-
-        selected = interaction.data.get("values", [None])[0]
-        if not selected:
-            return
-
-        await self.db.update_ticket_category(interaction.channel.id, selected)
-
-        view = CommonSuccessView(
-            title="カテゴリを設定しました",
-            description=f"カテゴリ: **{selected}**"
-        )
-        await interaction.followup.send(view=view, ephemeral=True)
-
-        logger.info(f"チケットカテゴリ変更: {selected} - channel_id={interaction.channel.id}")
-
 
 class AssignStaffModal(ui.Modal, title="担当者追加"):
     """担当者追加用モーダル"""
@@ -379,7 +421,6 @@ class AssignStaffModal(ui.Modal, title="担当者追加"):
 
         try:
             user_id = int(input_value)
-            member = interaction.guild.get_member(user_id)
         except ValueError:
             view = CommonErrorView(
                 title="無効な入力",
@@ -388,6 +429,7 @@ class AssignStaffModal(ui.Modal, title="担当者追加"):
             await interaction.followup.send(view=view, ephemeral=True)
             return
 
+        member = await interaction.client.member_cache.get_member(interaction.guild, user_id)
         if not member:
             view = CommonErrorView(
                 title="ユーザーが見つかりません",